@@ -0,0 +1,22 @@
+"""Add RouletteConfig.version for lock-free spin snapshots.
+
+Revision ID: 20251226_0001
+Revises: 20251225_0006
+Create Date: 2025-12-26 10:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20251226_0001"
+down_revision = "20251225_0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("roulette_config", sa.Column("version", sa.Integer(), nullable=False, server_default="1"))
+
+
+def downgrade() -> None:
+    op.drop_column("roulette_config", "version")
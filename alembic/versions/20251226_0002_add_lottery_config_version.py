@@ -0,0 +1,22 @@
+"""Add LotteryConfig.version for cached prize samplers.
+
+Revision ID: 20251226_0002
+Revises: 20251226_0001
+Create Date: 2025-12-26 11:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20251226_0002"
+down_revision = "20251226_0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("lottery_config", sa.Column("version", sa.Integer(), nullable=False, server_default="1"))
+
+
+def downgrade() -> None:
+    op.drop_column("lottery_config", "version")
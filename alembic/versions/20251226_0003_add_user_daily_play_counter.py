@@ -0,0 +1,34 @@
+"""Add user_daily_play_counter table.
+
+Revision ID: 20251226_0003
+Revises: 20251226_0002
+Create Date: 2025-12-26 12:00:00
+
+Per-user, per-feature KST-day play counts upserted by the play pipeline so game
+status endpoints no longer COUNT(*) the log tables with DATE(created_at).
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20251226_0003"
+down_revision = "20251226_0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_daily_play_counter",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("user.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("feature_type", sa.String(length=30), nullable=False),
+        sa.Column("kst_date", sa.Date(), nullable=False),
+        sa.Column("play_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(), nullable=False, server_default=sa.text("CURRENT_TIMESTAMP")),
+        sa.UniqueConstraint("user_id", "feature_type", "kst_date", name="uq_user_daily_play_counter"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("user_daily_play_counter")
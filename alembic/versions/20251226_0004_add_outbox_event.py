@@ -0,0 +1,43 @@
+"""Add outbox_event table for post-play side effects.
+
+Revision ID: 20251226_0004
+Revises: 20251226_0003
+Create Date: 2025-12-26 13:00:00
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+revision = "20251226_0004"
+down_revision = "20251226_0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "outbox_event",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("event_type", sa.String(length=50), nullable=False),
+        sa.Column("idempotency_key", sa.String(length=128), nullable=False),
+        sa.Column("payload_json", sa.JSON().with_variant(mysql.JSON(), "mysql"), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False, server_default="PENDING"),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("next_attempt_at", sa.DateTime(), nullable=False, server_default=sa.text("CURRENT_TIMESTAMP")),
+        sa.Column("locked_at", sa.DateTime(), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.text("CURRENT_TIMESTAMP")),
+        sa.Column("processed_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_outbox_event_id", "outbox_event", ["id"])
+    op.create_index("uq_outbox_event_idempotency_key", "outbox_event", ["idempotency_key"], unique=True)
+    op.create_index("ix_outbox_event_status_next_attempt", "outbox_event", ["status", "next_attempt_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_outbox_event_status_next_attempt", table_name="outbox_event")
+    op.drop_index("uq_outbox_event_idempotency_key", table_name="outbox_event")
+    op.drop_index("ix_outbox_event_id", table_name="outbox_event")
+    op.drop_table("outbox_event")
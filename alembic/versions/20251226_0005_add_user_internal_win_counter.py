@@ -0,0 +1,34 @@
+"""Add user_internal_win_counter table.
+
+Revision ID: 20251226_0005
+Revises: 20251226_0004
+Create Date: 2025-12-26 15:00:00
+
+Per-user, per-season internal win counts incremented by the play pipeline so the
+INTERNAL_WIN_50 stamp check and /season-pass/internal-wins read a single row.
+Populate existing seasons with scripts/backfill_internal_win_counter.py.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20251226_0005"
+down_revision = "20251226_0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_internal_win_counter",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("user.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("season_id", sa.Integer(), sa.ForeignKey("season_pass_config.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("win_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(), nullable=False, server_default=sa.text("CURRENT_TIMESTAMP")),
+        sa.UniqueConstraint("user_id", "season_id", name="uq_user_internal_win_counter"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("user_internal_win_counter")
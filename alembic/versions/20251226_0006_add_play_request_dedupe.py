@@ -0,0 +1,41 @@
+"""Add play_request_dedupe table.
+
+Revision ID: 20251226_0006
+Revises: 20251226_0005
+Create Date: 2025-12-26 18:00:00
+
+Stores /play Idempotency-Key values with the response they produced so client retries
+replay the result instead of consuming tokens twice.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+revision = "20251226_0006"
+down_revision = "20251226_0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "play_request_dedupe",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("feature_type", sa.String(length=30), nullable=False),
+        sa.Column("request_id", sa.String(length=64), nullable=False),
+        sa.Column("response_json", sa.JSON().with_variant(mysql.JSON(), "mysql"), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.text("CURRENT_TIMESTAMP")),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index("ix_play_request_dedupe_id", "play_request_dedupe", ["id"])
+    op.create_index("uq_play_request_dedupe_key", "play_request_dedupe", ["user_id", "feature_type", "request_id"], unique=True)
+    op.create_index("ix_play_request_dedupe_expires_at", "play_request_dedupe", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_play_request_dedupe_expires_at", table_name="play_request_dedupe")
+    op.drop_index("uq_play_request_dedupe_key", table_name="play_request_dedupe")
+    op.drop_index("ix_play_request_dedupe_id", table_name="play_request_dedupe")
+    op.drop_table("play_request_dedupe")
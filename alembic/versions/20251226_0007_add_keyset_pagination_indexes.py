@@ -0,0 +1,35 @@
+"""Add (created_at, id) indexes for keyset-paginated admin log browsing.
+
+Revision ID: 20251226_0007
+Revises: 20251226_0006
+Create Date: 2025-12-26 19:00:00
+
+/admin/api/game-tokens/ledger and /play-logs page by (created_at, id) DESC cursors; these
+indexes let every page be an index range scan instead of OFFSET over the whole table.
+"""
+
+from alembic import op
+
+revision = "20251226_0007"
+down_revision = "20251226_0006"
+branch_labels = None
+depends_on = None
+
+
+_INDEXES = (
+    ("ix_user_game_wallet_ledger_created_at_id", "user_game_wallet_ledger", ["created_at", "id"]),
+    ("ix_user_game_wallet_ledger_user_created_at_id", "user_game_wallet_ledger", ["user_id", "created_at", "id"]),
+    ("ix_roulette_log_created_at_id", "roulette_log", ["created_at", "id"]),
+    ("ix_dice_log_created_at_id", "dice_log", ["created_at", "id"]),
+    ("ix_lottery_log_created_at_id", "lottery_log", ["created_at", "id"]),
+)
+
+
+def upgrade() -> None:
+    for name, table, columns in _INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(_INDEXES):
+        op.drop_index(name, table_name=table)
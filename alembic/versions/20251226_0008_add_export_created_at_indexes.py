@@ -0,0 +1,26 @@
+"""Add (created_at, id) indexes for streaming ledger exports.
+
+Revision ID: 20251226_0008
+Revises: 20251226_0007
+Create Date: 2025-12-26 20:00:00
+
+/admin/api/exports streams rows in (created_at, id) order over a time range; with these
+indexes MySQL walks the index instead of filesorting the whole table before the first row.
+"""
+
+from alembic import op
+
+revision = "20251226_0008"
+down_revision = "20251226_0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_user_cash_ledger_created_at_id", "user_cash_ledger", ["created_at", "id"])
+    op.create_index("ix_vault_earn_event_created_at_id", "vault_earn_event", ["created_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_vault_earn_event_created_at_id", table_name="vault_earn_event")
+    op.drop_index("ix_user_cash_ledger_created_at_id", table_name="user_cash_ledger")
@@ -0,0 +1,48 @@
+"""Add reward_delivery_job retry queue.
+
+Revision ID: 20251226_0009
+Revises: 20251226_0008
+Create Date: 2025-12-26 21:00:00
+
+Season-pass / level rewards whose inline delivery fails are queued here and re-delivered
+by app.workers.reward_delivery_worker with exponential backoff.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+revision = "20251226_0009"
+down_revision = "20251226_0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "reward_delivery_job",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("user.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("source", sa.String(length=50), nullable=False),
+        sa.Column("idempotency_key", sa.String(length=128), nullable=False),
+        sa.Column("rewards_json", sa.JSON().with_variant(mysql.JSON(), "mysql"), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False, server_default="PENDING"),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("next_attempt_at", sa.DateTime(), nullable=False, server_default=sa.text("CURRENT_TIMESTAMP")),
+        sa.Column("locked_at", sa.DateTime(), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.text("CURRENT_TIMESTAMP")),
+        sa.Column("delivered_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_reward_delivery_job_id", "reward_delivery_job", ["id"])
+    op.create_index("ix_reward_delivery_job_user_id", "reward_delivery_job", ["user_id"])
+    op.create_index("uq_reward_delivery_job_idempotency_key", "reward_delivery_job", ["idempotency_key"], unique=True)
+    op.create_index("ix_reward_delivery_job_status_next_attempt", "reward_delivery_job", ["status", "next_attempt_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_reward_delivery_job_status_next_attempt", table_name="reward_delivery_job")
+    op.drop_index("uq_reward_delivery_job_idempotency_key", table_name="reward_delivery_job")
+    op.drop_index("ix_reward_delivery_job_user_id", table_name="reward_delivery_job")
+    op.drop_index("ix_reward_delivery_job_id", table_name="reward_delivery_job")
+    op.drop_table("reward_delivery_job")
@@ -0,0 +1,36 @@
+"""Move the trial-origin token count onto user_game_wallet.
+
+Revision ID: 20251226_0010
+Revises: 20251226_0009
+Create Date: 2025-12-26 22:00:00
+
+Token consumption now updates balance and trial_balance in one statement instead of reading and
+updating a separate trial_token_bucket row. The bucket counts are copied over (capped at the
+wallet balance); trial_token_bucket itself is left in place and is no longer written.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20251226_0010"
+down_revision = "20251226_0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("user_game_wallet", sa.Column("trial_balance", sa.Integer(), nullable=False, server_default="0"))
+    op.execute(
+        """
+        UPDATE user_game_wallet
+        SET trial_balance = COALESCE((
+            SELECT CASE WHEN b.balance < user_game_wallet.balance THEN b.balance ELSE user_game_wallet.balance END
+            FROM trial_token_bucket b
+            WHERE b.user_id = user_game_wallet.user_id AND b.token_type = user_game_wallet.token_type
+        ), 0)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("user_game_wallet", "trial_balance")
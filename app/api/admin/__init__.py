@@ -23,6 +23,9 @@ from app.api.admin.routes import (
     admin_vault_programs,
     admin_vault_ops,
     admin_dashboard,
+    admin_simulation,
+    admin_exports,
+    admin_reward_delivery,
 )
 
 from app.api.deps import get_current_admin_id
@@ -50,3 +53,6 @@ admin_router.include_router(admin_vault_programs.legacy_router)
 admin_router.include_router(admin_vault_ops.router)
 admin_router.include_router(admin_vault_ops.legacy_router)
 admin_router.include_router(admin_dashboard.router)
+admin_router.include_router(admin_simulation.router)
+admin_router.include_router(admin_exports.router)
+admin_router.include_router(admin_reward_delivery.router)
@@ -0,0 +1,58 @@
+"""Admin streaming exports (CSV / gzip JSONL) of ledgers and game logs."""
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_db
+from app.models.user import User
+from app.services.export_service import EXPORT_FORMATS, ExportService
+
+router = APIRouter(prefix="/admin/api/exports", tags=["admin-exports"])
+service = ExportService()
+
+
+@router.get("/{dataset}")
+def export_dataset(
+    dataset: str,
+    format: str = Query("csv", description="csv | jsonl (gzip-compressed)"),
+    start: datetime | None = Query(None, description="created_at >= start (naive = UTC)"),
+    end: datetime | None = Query(None, description="created_at < end (naive = UTC)"),
+    user_id: int | None = None,
+    external_id: str | None = None,
+    db: Session = Depends(get_db),
+):
+    """Stream every matching row; datasets: game-wallet-ledger, cash-ledger, vault-earn-events, *-logs."""
+
+    model = service.get_model(dataset)
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail="INVALID_EXPORT_FORMAT")
+    if external_id:
+        user = db.query(User).filter(User.external_id == external_id).first()
+        if not user:
+            raise HTTPException(status_code=404, detail="USER_NOT_FOUND")
+        user_id = user.id
+
+    # The request session is closed once the handler returns, before the body is streamed,
+    # so the generator owns a session on the same engine for the lifetime of the download.
+    bind = db.get_bind()
+
+    def _body():
+        with Session(bind=bind) as export_db:
+            rows = service.iter_rows(export_db, model, start=start, end=end, user_id=user_id)
+            if format == "csv":
+                yield from service.encode_csv(rows, service.columns(model))
+            else:
+                yield from service.encode_jsonl_gzip(rows)
+
+    stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
+    if format == "csv":
+        media_type, filename = "text/csv; charset=utf-8", f"{dataset}_{stamp}.csv"
+    else:
+        media_type, filename = "application/gzip", f"{dataset}_{stamp}.jsonl.gz"
+    return StreamingResponse(
+        _body(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
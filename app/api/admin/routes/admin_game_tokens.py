@@ -1,9 +1,13 @@
 """Admin endpoints for granting game tokens."""
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import desc, literal, literal_column
+import time
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy import and_, literal, or_, select, union_all
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
+from app.core.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
 from app.models.dice import DiceLog
 from app.models.lottery import LotteryLog, LotteryPrize
 from app.models.roulette import RouletteLog, RouletteSegment
@@ -11,6 +15,8 @@ from app.models.game_wallet import UserGameWallet
 from app.models.game_wallet_ledger import UserGameWalletLedger
 from app.models.user import User
 from app.schemas.game_tokens import (
+    BulkGameTokensRequest,
+    BulkGameTokensResponse,
     GrantGameTokensRequest,
     GrantGameTokensResponse,
     LedgerEntry,
@@ -19,10 +25,12 @@ from app.schemas.game_tokens import (
     TokenBalance,
 )
 from app.schemas.base import to_kst_iso
+from app.services.game_token_bulk_service import GameTokenBulkService
 from app.services.game_wallet_service import GameWalletService
 
 router = APIRouter(prefix="/admin/api/game-tokens", tags=["admin-game-tokens"])
 wallet_service = GameWalletService()
+bulk_service = GameTokenBulkService()
 
 
 def _resolve_user_id(db: Session, user_id: int | None, external_id: str | None) -> int:
@@ -52,6 +60,42 @@ def revoke_tokens(payload: RevokeGameTokensRequest, db: Session = Depends(get_db
     return GrantGameTokensResponse(user_id=user_id, token_type=payload.token_type, balance=balance, external_id=external)
 
 
+def _run_bulk(db: Session, payload: BulkGameTokensRequest, revoke: bool) -> BulkGameTokensResponse:
+    started = time.perf_counter()
+    user_ids, not_found = bulk_service.resolve_user_ids(db, payload.user_ids, payload.external_ids, payload.segment)
+    run = bulk_service.revoke if revoke else bulk_service.grant
+    result = run(
+        db,
+        user_ids,
+        payload.token_type,
+        payload.amount,
+        reason=payload.reason,
+        label=payload.label,
+        meta={"source": "ADMIN_BULK", "segment": payload.segment} if payload.segment else {"source": "ADMIN_BULK"},
+    )
+    return BulkGameTokensResponse(
+        token_type=payload.token_type,
+        amount=payload.amount,
+        requested=result.requested,
+        applied=result.applied,
+        skipped_user_ids=result.skipped_user_ids,
+        not_found=not_found,
+        elapsed_ms=int((time.perf_counter() - started) * 1000),
+    )
+
+
+@router.post("/bulk-grant", response_model=BulkGameTokensResponse)
+def bulk_grant_tokens(payload: BulkGameTokensRequest, db: Session = Depends(get_db)):
+    """Grant the same amount to many users (explicit list and/or segment) with set-based writes."""
+    return _run_bulk(db, payload, revoke=False)
+
+
+@router.post("/bulk-revoke", response_model=BulkGameTokensResponse)
+def bulk_revoke_tokens(payload: BulkGameTokensRequest, db: Session = Depends(get_db)):
+    """Revoke the same amount from many users; wallets below the amount are skipped."""
+    return _run_bulk(db, payload, revoke=True)
+
+
 @router.get("/wallets", response_model=list[TokenBalance])
 def list_wallets(
     user_id: int | None = None,
@@ -93,85 +137,86 @@ def list_wallets(
     ]
 
 
+def _keyset_before(created_col, id_col, cursor_at: datetime, cursor_id: int):
+    """Rows strictly after the cursor in ``created_at DESC, id DESC`` order."""
+
+    return or_(created_col < cursor_at, and_(created_col == cursor_at, id_col < cursor_id))
+
+
 @router.get("/play-logs", response_model=list[PlayLogEntry])
 def list_recent_play_logs(
+    response: Response,
     limit: int = 50,
     offset: int = 0,
     external_id: str | None = None,
+    cursor: str | None = None,
     db: Session = Depends(get_db),
 ):
-    """Unified recent play logs from roulette/dice/lottery with pagination."""
+    """Unified recent play logs from roulette/dice/lottery.
+
+    Pass the ``X-Next-Cursor`` header of the previous page as ``cursor`` for keyset paging;
+    ``offset`` is kept for the legacy page-number UI and ignored when a cursor is given.
+    """
     limit = min(max(limit, 1), 200)
     offset = max(offset, 0)
 
-    # Build optional user filter
-    user_filter_roulette = True
-    user_filter_dice = True
-    user_filter_lottery = True
-
+    user_id: int | None = None
     if external_id:
         user = db.query(User).filter(User.external_id == external_id).first()
-        if user:
-            user_filter_roulette = RouletteLog.user_id == user.id
-            user_filter_dice = DiceLog.user_id == user.id
-            user_filter_lottery = LotteryLog.user_id == user.id
-        else:
+        if not user:
             return []  # No user found with this external_id
+        user_id = user.id
 
-    # 1. Roulette Query
-    q_roulette = (
-        db.query(
-            RouletteLog.id.label("id"),
-            RouletteLog.user_id,
-            User.external_id,
-            RouletteLog.reward_type,
-            RouletteLog.reward_amount,
-            RouletteSegment.label.label("detail"),
-            RouletteLog.created_at.label("created_at"),
-            literal("ROULETTE").label("game_type"),
-        )
-        .join(User, User.id == RouletteLog.user_id)
-        .join(RouletteSegment, RouletteSegment.id == RouletteLog.segment_id)
-        .filter(user_filter_roulette)
-    )
-
-    # 2. Dice Query
-    q_dice = (
-        db.query(
-            DiceLog.id.label("id"),
-            DiceLog.user_id,
-            User.external_id,
-            DiceLog.reward_type,
-            DiceLog.reward_amount,
-            DiceLog.result.label("detail"),
-            DiceLog.created_at.label("created_at"),
-            literal("DICE").label("game_type"),
-        )
-        .join(User, User.id == DiceLog.user_id)
-        .filter(user_filter_dice)
-    )
+    cursor_at: datetime | None = None
+    cursor_game = ""
+    cursor_id = 0
+    if cursor:
+        cursor_at, (cursor_game,), cursor_id = decode_cursor(cursor, 3)
+    # Each branch is cut to the page window on its own (created_at, id) index before the UNION,
+    # so a page costs 3 x limit index rows no matter how deep it is.
+    window = limit if cursor_at is not None else offset + limit
 
-    # 3. Lottery Query
-    q_lottery = (
-        db.query(
-            LotteryLog.id.label("id"),
-            LotteryLog.user_id,
-            User.external_id,
-            LotteryLog.reward_type,
-            LotteryLog.reward_amount,
-            LotteryPrize.label.label("detail"),
-            LotteryLog.created_at.label("created_at"),
-            literal("LOTTERY").label("game_type"),
-        )
-        .join(User, User.id == LotteryLog.user_id)
-        .join(LotteryPrize, LotteryPrize.id == LotteryLog.prize_id)
-        .filter(user_filter_lottery)
-    )
+    def _branch(game: str, log_model, detail_col, *joins):
+        query = db.query(
+            log_model.id.label("id"),
+            log_model.user_id.label("user_id"),
+            User.external_id.label("external_id"),
+            log_model.reward_type.label("reward_type"),
+            log_model.reward_amount.label("reward_amount"),
+            detail_col.label("detail"),
+            log_model.created_at.label("created_at"),
+            literal(game).label("game_type"),
+        ).join(User, User.id == log_model.user_id)
+        for target, on in joins:
+            query = query.join(target, on)
+        if user_id is not None:
+            query = query.filter(log_model.user_id == user_id)
+        if cursor_at is not None:
+            # Tie-break order across tables is (created_at, game_type, id) DESC.
+            if game < cursor_game:
+                query = query.filter(log_model.created_at <= cursor_at)
+            elif game == cursor_game:
+                query = query.filter(_keyset_before(log_model.created_at, log_model.id, cursor_at, cursor_id))
+            else:
+                query = query.filter(log_model.created_at < cursor_at)
+        return query.order_by(log_model.created_at.desc(), log_model.id.desc()).limit(window)
 
-    # Union All + Sort + Pagination
-    union_q = q_roulette.union_all(q_dice, q_lottery).order_by(desc(literal_column("created_at")))
+    branches = [
+        _branch("ROULETTE", RouletteLog, RouletteSegment.label, (RouletteSegment, RouletteSegment.id == RouletteLog.segment_id)),
+        _branch("DICE", DiceLog, DiceLog.result),
+        _branch("LOTTERY", LotteryLog, LotteryPrize.label, (LotteryPrize, LotteryPrize.id == LotteryLog.prize_id)),
+    ]
+    union_sq = union_all(*(branch.subquery().select() for branch in branches)).subquery()
+    page_q = select(union_sq).order_by(
+        union_sq.c.created_at.desc(), union_sq.c.game_type.desc(), union_sq.c.id.desc()
+    ).limit(limit)
+    if cursor_at is None:
+        page_q = page_q.offset(offset)
+    rows = db.execute(page_q).all()
 
-    rows = union_q.offset(offset).limit(limit).all()
+    if len(rows) == limit:
+        last = rows[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.created_at, last.game_type, last.id)
 
     return [
         PlayLogEntry(
@@ -188,16 +233,18 @@ def list_recent_play_logs(
     ]
 
 
-
 @router.get("/ledger", response_model=list[LedgerEntry])
 def list_wallet_ledger(
+    response: Response,
     limit: int = 100,
     offset: int = 0,
     user_id: int | None = None,
     external_id: str | None = None,
     token_type: str | None = None,
+    cursor: str | None = None,
     db: Session = Depends(get_db),
 ):
+    """Wallet ledger, newest first. ``cursor`` (from ``X-Next-Cursor``) enables keyset paging."""
     limit = min(max(limit, 1), 500)
     offset = max(offset, 0)
     query = (
@@ -214,12 +261,20 @@ def list_wallet_ledger(
     if token_type:
         query = query.filter(UserGameWalletLedger.token_type == token_type)
 
-    rows = (
-        query.order_by(UserGameWalletLedger.created_at.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
-    )
+    query = query.order_by(UserGameWalletLedger.created_at.desc(), UserGameWalletLedger.id.desc())
+    if cursor:
+        cursor_at, _, cursor_id = decode_cursor(cursor, 2)
+        query = query.filter(
+            _keyset_before(UserGameWalletLedger.created_at, UserGameWalletLedger.id, cursor_at, cursor_id)
+        )
+    else:
+        query = query.offset(offset)
+    rows = query.limit(limit).all()
+
+    if len(rows) == limit:
+        last = rows[-1].UserGameWalletLedger  # type: ignore[attr-defined]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.created_at, last.id)
+
     return [
         LedgerEntry(
             id=row.UserGameWalletLedger.id,  # type: ignore[attr-defined]
@@ -0,0 +1,47 @@
+"""Admin view of the reward delivery retry queue."""
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_db
+from app.models.reward_delivery_job import RewardDeliveryJob
+from app.schemas.admin_reward_delivery import RewardDeliveryBacklogResponse, RewardDeliveryJobEntry
+from app.services.reward_delivery_queue_service import RewardDeliveryQueueService
+
+router = APIRouter(prefix="/admin/api/reward-delivery-jobs", tags=["admin-reward-delivery"])
+
+
+@router.get("", response_model=RewardDeliveryBacklogResponse)
+def list_reward_delivery_jobs(
+    status: str | None = None,
+    user_id: int | None = None,
+    limit: int = 50,
+    offset: int = 0,
+    db: Session = Depends(get_db),
+):
+    """Per-status counts plus the oldest matching jobs (defaults to everything not yet DONE)."""
+
+    limit = min(max(limit, 1), 200)
+    offset = max(offset, 0)
+    stmt = select(RewardDeliveryJob)
+    if status:
+        stmt = stmt.where(RewardDeliveryJob.status == status)
+    else:
+        stmt = stmt.where(RewardDeliveryJob.status != "DONE")
+    if user_id:
+        stmt = stmt.where(RewardDeliveryJob.user_id == user_id)
+    jobs = db.execute(stmt.order_by(RewardDeliveryJob.id).offset(offset).limit(limit)).scalars().all()
+    return RewardDeliveryBacklogResponse(
+        counts=RewardDeliveryQueueService.status_counts(db),
+        items=[RewardDeliveryJobEntry.model_validate(job) for job in jobs],
+    )
+
+
+@router.post("/{job_id}/retry", response_model=RewardDeliveryJobEntry)
+def retry_reward_delivery_job(job_id: int, db: Session = Depends(get_db)):
+    """Requeue a FAILED (or stuck) job immediately; DONE jobs are left untouched."""
+
+    job = RewardDeliveryQueueService.retry(db, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="REWARD_DELIVERY_JOB_NOT_FOUND")
+    return job
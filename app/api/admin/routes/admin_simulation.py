@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_db
+from app.schemas.admin_simulation import (
+    DiceSimulationRequest,
+    LotterySimulationRequest,
+    RouletteSimulationRequest,
+    SimulationResponse,
+)
+from app.services.game_simulation_service import GameSimulationService
+
+router = APIRouter(prefix="/admin/api/simulation", tags=["admin-simulation"])
+
+
+@router.post("/roulette", response_model=SimulationResponse)
+def simulate_roulette(payload: RouletteSimulationRequest, db: Session = Depends(get_db)):
+    return GameSimulationService.simulate_roulette(db, payload)
+
+
+@router.post("/lottery", response_model=SimulationResponse)
+def simulate_lottery(payload: LotterySimulationRequest, db: Session = Depends(get_db)):
+    return GameSimulationService.simulate_lottery(db, payload)
+
+
+@router.post("/dice", response_model=SimulationResponse)
+def simulate_dice(payload: DiceSimulationRequest, db: Session = Depends(get_db)):
+    return GameSimulationService.simulate_dice(db, payload)
@@ -1,12 +1,13 @@
 """Dice API routes."""
 from datetime import date
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Query
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
 from app.api.deps import get_current_user_id
 from app.schemas.dice import DicePlayResponse, DiceStatusResponse
+from app.services.game_common import MAX_PLAY_BATCH
 from app.services.dice_service import DiceService
 
 router = APIRouter(prefix="/api/dice", tags=["dice"])
@@ -20,6 +21,17 @@ def dice_status(db: Session = Depends(get_db), user_id: int = Depends(get_curren
 
 
 @router.post("/play", response_model=DicePlayResponse)
-def dice_play(db: Session = Depends(get_db), user_id: int = Depends(get_current_user_id)) -> DicePlayResponse:
+def dice_play(
+    count: int = Query(1, ge=1, le=MAX_PLAY_BATCH, description="Number of plays to run in one request"),
+    idempotency_key: str | None = Header(
+        None,
+        alias="Idempotency-Key",
+        min_length=1,
+        max_length=64,
+        description="Client-generated key; a retry with the same key returns the original result",
+    ),
+    db: Session = Depends(get_db),
+    user_id: int = Depends(get_current_user_id),
+) -> DicePlayResponse:
     today = date.today()
-    return service.play(db=db, user_id=user_id, now=today)
+    return service.play(db=db, user_id=user_id, now=today, count=count, request_id=idempotency_key)
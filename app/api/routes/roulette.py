@@ -1,11 +1,12 @@
 """Roulette API routes."""
 from datetime import date
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Query
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_user_id, get_db
 from app.schemas.roulette import RoulettePlayResponse, RouletteStatusResponse
+from app.services.game_common import MAX_PLAY_BATCH
 from app.services.roulette_service import RouletteService
 
 router = APIRouter(prefix="/api/roulette", tags=["roulette"])
@@ -19,6 +20,17 @@ def roulette_status(db: Session = Depends(get_db), user_id: int = Depends(get_cu
 
 
 @router.post("/play", response_model=RoulettePlayResponse)
-def roulette_play(db: Session = Depends(get_db), user_id: int = Depends(get_current_user_id)) -> RoulettePlayResponse:
+def roulette_play(
+    count: int = Query(1, ge=1, le=MAX_PLAY_BATCH, description="Number of plays to run in one request"),
+    idempotency_key: str | None = Header(
+        None,
+        alias="Idempotency-Key",
+        min_length=1,
+        max_length=64,
+        description="Client-generated key; a retry with the same key returns the original result",
+    ),
+    db: Session = Depends(get_db),
+    user_id: int = Depends(get_current_user_id),
+) -> RoulettePlayResponse:
     today = date.today()
-    return service.play(db=db, user_id=user_id, now=today)
+    return service.play(db=db, user_id=user_id, now=today, count=count, request_id=idempotency_key)
@@ -2,9 +2,10 @@
 """Season pass API endpoints."""
 from __future__ import annotations
 
+import hashlib
 from datetime import date
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_user_id, get_db
@@ -22,15 +23,32 @@ router = APIRouter(prefix="/api/season-pass", tags=["season-pass"])
 service = SeasonPassService()
 
 
-@router.get("/status", response_model=SeasonPassStatusResponse, summary="Get season pass status")
+@router.get(
+    "/status",
+    response_model=SeasonPassStatusResponse,
+    summary="Get season pass status",
+    responses={304: {"description": "Status unchanged since the ETag sent in If-None-Match"}},
+)
 def get_status(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     user_id: int = Depends(get_current_user_id),
-) -> SeasonPassStatusResponse:
-    """Return active season info, progress, level list, and today's stamp flag."""
+):
+    """Return active season info, progress, level list, and today's stamp flag.
+
+    The response carries an ETag of its body; polling clients that send it back in If-None-Match
+    get an empty 304 while nothing has changed.
+    """
 
-    result = service.get_status(db=db, user_id=user_id, now=date.today())
-    return SeasonPassStatusResponse(**result)
+    result = SeasonPassStatusResponse(**service.get_status(db=db, user_id=user_id, now=date.today()))
+    etag = '"' + hashlib.sha256(result.model_dump_json().encode("utf-8")).hexdigest()[:32] + '"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return result
 
 
 @router.get(
@@ -6,15 +6,17 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, get_current_user_id
-from app.models.game_wallet import GameTokenType, UserGameWallet
+from app.models.game_wallet import GameTokenType
 from app.schemas.vault2 import VaultProgramResponse, VaultTopItem
 from app.schemas.vault import VaultFillResponse, VaultStatusResponse
+from app.services.game_wallet_service import GameWalletService
 from app.services.vault2_service import Vault2Service
 from app.services.vault_service import VaultService
 
 router = APIRouter(prefix="/api/vault", tags=["vault"])
 service = VaultService()
 v2_service = Vault2Service()
+wallet_service = GameWalletService()
 
 
 def _deep_merge_dict(base: dict, override: dict) -> dict:
@@ -40,13 +42,8 @@ def status(db: Session = Depends(get_db), user_id: int = Depends(get_current_use
 
     if eligible and locked_unexpired:
         ticket_token_types = (GameTokenType.DICE_TOKEN, GameTokenType.ROULETTE_COIN, GameTokenType.LOTTERY_TICKET)
-        wallet_rows = (
-            db.query(UserGameWallet)
-            .filter(UserGameWallet.user_id == user_id, UserGameWallet.token_type.in_(ticket_token_types))
-            .all()
-        )
-        balances = {row.token_type: int(row.balance or 0) for row in wallet_rows}
-        ticket_zero = all(balances.get(token_type, 0) <= 0 for token_type in ticket_token_types)
+        balances = wallet_service.get_balances(db, user_id, ticket_token_types)
+        ticket_zero = all(balance <= 0 for balance in balances.values())
         if ticket_zero:
             recommended_action = "OPEN_VAULT_MODAL"
             cta_payload = {
@@ -141,6 +141,44 @@ class Settings(BaseSettings):
         ),
     )
 
+    # Post-play side effects (team battle, season pass internal-win stamp, game XP).
+    # OFF: applied right after the play commits, in-request. ON: written to outbox_event in the play
+    # transaction and applied by the outbox worker (python -m app.workers.outbox_worker).
+    play_outbox_enabled: bool = Field(
+        False,
+        validation_alias=AliasChoices(
+            "PLAY_OUTBOX_ENABLED",
+            "play_outbox_enabled",
+        ),
+    )
+
+    # How long a /play Idempotency-Key is remembered; retries within this window replay the stored response.
+    play_idempotency_ttl_seconds: int = Field(
+        86400,
+        validation_alias=AliasChoices(
+            "PLAY_IDEMPOTENCY_TTL_SECONDS",
+            "play_idempotency_ttl_seconds",
+        ),
+    )
+
+    # Queue token-consumption ledger rows per transaction and write them as one multi-row INSERT at commit.
+    wallet_ledger_write_combining: bool = Field(
+        False,
+        validation_alias=AliasChoices(
+            "WALLET_LEDGER_WRITE_COMBINING",
+            "wallet_ledger_write_combining",
+        ),
+    )
+
+    # Flush the combined ledger INSERT early once this many rows are queued in one transaction.
+    wallet_ledger_buffer_max_rows: int = Field(
+        500,
+        validation_alias=AliasChoices(
+            "WALLET_LEDGER_BUFFER_MAX_ROWS",
+            "wallet_ledger_buffer_max_rows",
+        ),
+    )
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
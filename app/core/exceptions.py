@@ -42,3 +42,10 @@ class NotEnoughTokensError(HTTPException):
 
     def __init__(self, message: str = "NOT_ENOUGH_TOKENS"):
         super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail=message)
+
+
+class PlayRequestInProgressError(HTTPException):
+    """Raised when the same Idempotency-Key is being processed by a concurrent /play request."""
+
+    def __init__(self, message: str = "PLAY_REQUEST_IN_PROGRESS"):
+        super().__init__(status_code=status.HTTP_409_CONFLICT, detail=message)
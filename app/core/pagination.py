@@ -0,0 +1,31 @@
+"""Opaque keyset-pagination cursors (``created_at`` + tie-breakers, base64url encoded)."""
+from __future__ import annotations
+
+import base64
+from datetime import datetime
+
+from fastapi import HTTPException, status
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+_SEP = "|"
+
+
+def encode_cursor(created_at: datetime, *keys: object) -> str:
+    """Encode the last row's sort key: ``created_at``, optional tie-breakers, then its integer id."""
+
+    raw = _SEP.join([created_at.isoformat(), *(str(key) for key in keys)])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, parts: int) -> tuple[datetime, list[str], int]:
+    """Return (created_at, middle keys, id); raises 400 INVALID_CURSOR on a malformed token."""
+
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        values = base64.urlsafe_b64decode(padded.encode()).decode().split(_SEP)
+        if len(values) != parts:
+            raise ValueError(token)
+        return datetime.fromisoformat(values[0]), values[1:-1], int(values[-1])
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="INVALID_CURSOR") from exc
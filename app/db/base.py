@@ -51,4 +51,9 @@ from app.models import (  # noqa: F401
     VaultStatus,
     VaultEarnEvent,
     TrialTokenBucket,
+    UserDailyPlayCounter,
+    OutboxEvent,
+    UserInternalWinCounter,
+    PlayRequestDedupe,
+    RewardDeliveryJob,
 )
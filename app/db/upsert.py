@@ -0,0 +1,131 @@
+"""Dialect-aware INSERT ... ON DUPLICATE KEY / ON CONFLICT helpers.
+
+Production runs on MySQL; tests run on SQLite. Both support a native upsert, so hot
+counters can be maintained with one statement instead of SELECT-then-INSERT/UPDATE.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import Table, exists, literal, select
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.orm import Session
+
+
+def _dialect_insert(db: Session, table: Table):
+    name = db.get_bind().dialect.name
+    if name == "mysql":
+        return mysql.insert(table)
+    if name == "sqlite":
+        return sqlite.insert(table)
+    if name == "postgresql":
+        return postgresql.insert(table)
+    raise NotImplementedError(f"upsert not supported for dialect {name!r}")
+
+
+def _on_conflict_increment(db: Session, table: Table, stmt, keys: list[str], increments: list[str], values: list[str]):
+    if db.get_bind().dialect.name == "mysql":
+        set_ = {col: table.c[col] + stmt.inserted[col] for col in increments}
+        set_.update({col: stmt.inserted[col] for col in values})
+        return stmt.on_duplicate_key_update(**set_)
+    set_ = {col: table.c[col] + stmt.excluded[col] for col in increments}
+    set_.update({col: stmt.excluded[col] for col in values})
+    return stmt.on_conflict_do_update(index_elements=keys, set_=set_)
+
+
+def upsert_increment(
+    db: Session,
+    table: Table,
+    *,
+    keys: dict[str, Any],
+    increments: dict[str, int],
+    values: dict[str, Any] | None = None,
+    insert_values: dict[str, Any] | None = None,
+):
+    """Insert a row or add ``increments`` to an existing one matched by the unique ``keys``.
+
+    ``values`` are written on insert and overwritten on conflict (e.g. updated_at);
+    ``insert_values`` are written on insert only. Does not commit.
+    """
+
+    row = {**keys, **increments, **(values or {}), **(insert_values or {})}
+    stmt = _dialect_insert(db, table).values(**row)
+    return db.execute(_on_conflict_increment(db, table, stmt, list(keys), list(increments), list(values or {})))
+
+
+def upsert_increment_many(
+    db: Session,
+    table: Table,
+    rows: list[dict[str, Any]],
+    *,
+    keys: list[str],
+    increments: list[str],
+    values: list[str] | None = None,
+):
+    """Multi-row ``upsert_increment``: one INSERT ... VALUES (...), (...) statement for all ``rows``.
+
+    Every row must carry the same columns. Does not commit.
+    """
+
+    if not rows:
+        return None
+    stmt = _dialect_insert(db, table).values(rows)
+    return db.execute(_on_conflict_increment(db, table, stmt, keys, increments, list(values or [])))
+
+
+def insert_ignore(db: Session, table: Table, rows: list[dict[str, Any]], *, keys: list[str]) -> int:
+    """Multi-row INSERT that skips rows colliding with the unique ``keys``; returns how many were inserted.
+
+    MySQL uses INSERT IGNORE (rowcount counts inserted rows only); SQLite/PostgreSQL use
+    ON CONFLICT (keys) DO NOTHING. Every row must carry the same columns. Does not commit.
+    """
+
+    if not rows:
+        return 0
+    stmt = _dialect_insert(db, table).values(rows)
+    if db.get_bind().dialect.name == "mysql":
+        stmt = stmt.prefix_with("IGNORE")
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=keys)
+    return int(db.execute(stmt).rowcount or 0)
+
+
+def insert_ignore_keys(db: Session, table: Table, rows: list[dict[str, Any]], *, keys: list[str]) -> set[tuple]:
+    """``insert_ignore`` that returns the ``keys`` tuple of every row it actually inserted.
+
+    SQLite/PostgreSQL read them from RETURNING, which skips the ignored rows. MySQL has no
+    INSERT ... RETURNING: when every row goes in (the usual case) that is still one statement;
+    otherwise the batch is rolled back to a SAVEPOINT and retried row by row. Does not commit.
+    """
+
+    if not rows:
+        return set()
+    if db.get_bind().dialect.name != "mysql":
+        stmt = _dialect_insert(db, table).values(rows).on_conflict_do_nothing(index_elements=keys)
+        return set(db.execute(stmt.returning(*[table.c[key] for key in keys])).tuples())
+    savepoint = db.begin_nested()
+    if insert_ignore(db, table, rows, keys=keys) == len(rows):
+        savepoint.commit()
+        return {tuple(row[key] for key in keys) for row in rows}
+    savepoint.rollback()
+    return {tuple(row[key] for key in keys) for row in rows if insert_ignore(db, table, [row], keys=keys)}
+
+
+def insert_ignore_unless(db: Session, table: Table, row: dict[str, Any], *, keys: list[str], unless) -> bool:
+    """Single-row ``insert_ignore`` that also skips the insert when a row matching ``unless`` exists.
+
+    ``unless`` is a list of WHERE criteria on ``table`` for a guard the unique ``keys`` don't cover;
+    it is checked in the same INSERT ... SELECT ... WHERE NOT EXISTS statement. Returns whether the
+    row was inserted. Does not commit.
+    """
+
+    columns = list(row)
+    source = select(*[literal(row[col], type_=table.c[col].type).label(col) for col in columns]).where(
+        ~exists().where(*unless)
+    )
+    stmt = _dialect_insert(db, table).from_select(columns, source)
+    if db.get_bind().dialect.name == "mysql":
+        stmt = stmt.prefix_with("IGNORE")
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=keys)
+    return bool(db.execute(stmt).rowcount)
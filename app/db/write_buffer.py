@@ -0,0 +1,72 @@
+"""Transaction-scoped write combining for append-only tables (ledgers).
+
+Rows are queued on the Session instead of being added one ORM object at a time, then written as
+one executemany INSERT (a multi-row INSERT on the MySQL drivers) right before the transaction
+commits. Rows queued inside a transaction or savepoint that rolls back are discarded with it, so
+a rolled-back play never leaves ledger rows behind.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import Table, event, insert
+from sqlalchemy.orm import Session, SessionTransaction
+
+_BUFFER_KEY = "buffered_inserts"
+
+
+def _within(txn: SessionTransaction | None, ancestor: SessionTransaction) -> bool:
+    while txn is not None:
+        if txn is ancestor:
+            return True
+        txn = txn.parent
+    return False
+
+
+def flush_buffered_inserts(db: Session) -> int:
+    """Write every queued row now (one INSERT per table, in queue order); returns the row count."""
+
+    pending = db.info.pop(_BUFFER_KEY, None)
+    if not pending:
+        return 0
+    by_table: dict[Table, list[dict[str, Any]]] = {}
+    for _, table, row in pending:
+        by_table.setdefault(table, []).append(row)
+    for table, rows in by_table.items():
+        db.execute(insert(table), rows)
+    return len(pending)
+
+
+def _on_before_commit(session: Session) -> None:
+    flush_buffered_inserts(session)
+
+
+def _on_soft_rollback(session: Session, previous_transaction: SessionTransaction) -> None:
+    pending = session.info.get(_BUFFER_KEY)
+    if pending:
+        session.info[_BUFFER_KEY] = [entry for entry in pending if not _within(entry[0], previous_transaction)]
+
+
+def _on_transaction_end(session: Session, transaction: SessionTransaction) -> None:
+    # Session.close() ends the root transaction without a rollback event; never leak rows past it.
+    if transaction.parent is None:
+        session.info.pop(_BUFFER_KEY, None)
+
+
+def _install_listeners() -> None:
+    if not event.contains(Session, "before_commit", _on_before_commit):
+        event.listen(Session, "before_commit", _on_before_commit)
+        event.listen(Session, "after_soft_rollback", _on_soft_rollback)
+        event.listen(Session, "after_transaction_end", _on_transaction_end)
+
+
+def buffer_insert(db: Session, table: Table, row: dict[str, Any], max_rows: int = 500) -> None:
+    """Queue ``row`` for ``table`` in the current transaction; flushed early once ``max_rows`` are queued."""
+
+    _install_listeners()
+    db.connection()  # autobegin, so the row is tied to a live transaction
+    txn = db.get_nested_transaction() or db.get_transaction()
+    pending = db.info.setdefault(_BUFFER_KEY, [])
+    pending.append((txn, table, row))
+    if len(pending) >= max_rows:
+        flush_buffered_inserts(db)
@@ -28,6 +28,11 @@ from app.models.vault2 import VaultProgram, VaultStatus
 from app.models.vault_earn_event import VaultEarnEvent
 from app.models.trial_token_bucket import TrialTokenBucket
 from app.models.admin_audit_log import AdminAuditLog
+from app.models.user_daily_play_counter import UserDailyPlayCounter
+from app.models.outbox_event import OutboxEvent
+from app.models.user_internal_win_counter import UserInternalWinCounter
+from app.models.play_request_dedupe import PlayRequestDedupe
+from app.models.reward_delivery_job import RewardDeliveryJob
 from app.models.survey import (
     Survey,
     SurveyQuestion,
@@ -89,4 +94,9 @@ __all__ = [
     "VaultEarnEvent",
     "TrialTokenBucket",
     "AdminAuditLog",
+    "UserDailyPlayCounter",
+    "OutboxEvent",
+    "UserInternalWinCounter",
+    "PlayRequestDedupe",
+    "RewardDeliveryJob",
 ]
@@ -23,6 +23,8 @@ class UserGameWallet(Base):
     user_id = Column(Integer, ForeignKey("user.id", ondelete="CASCADE"), nullable=False, index=True)
     token_type = Column(SAEnum(GameTokenType), nullable=False)
     balance = Column(Integer, nullable=False, default=0)
+    # Tokens of `balance` that came from TRIAL_GRANT (spent first); 0 <= trial_balance <= balance.
+    trial_balance = Column(Integer, nullable=False, default=0, server_default="0")
     updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     user = relationship("User")
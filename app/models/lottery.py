@@ -16,6 +16,8 @@ class LotteryConfig(Base):
     name = Column(String(100), nullable=False)
     is_active = Column(Boolean, nullable=False, default=True)
     max_daily_tickets = Column(Integer, nullable=False, default=0)
+    # Bumped on every admin edit; plays reuse the weighted sampler built for (id, version).
+    version = Column(Integer, nullable=False, default=1, server_default="1")
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -52,6 +54,7 @@ class LotteryLog(Base):
     __tablename__ = "lottery_log"
     __table_args__ = (
         Index("ix_lottery_log_user_created_at", "user_id", "created_at"),
+        Index("ix_lottery_log_created_at_id", "created_at", "id"),
     )
 
     id = Column(Integer, primary_key=True, index=True)
@@ -0,0 +1,40 @@
+"""Transactional outbox for post-play side effects.
+
+Rows are written in the same transaction as the game play and drained by the outbox worker,
+so side effects are retried instead of silently dropped.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, String, Text
+from sqlalchemy.dialects.mysql import JSON as MySQLJSON
+
+from app.db.base_class import Base
+
+
+class OutboxEvent(Base):
+    __tablename__ = "outbox_event"
+    __table_args__ = (
+        Index("uq_outbox_event_idempotency_key", "idempotency_key", unique=True),
+        Index("ix_outbox_event_status_next_attempt", "status", "next_attempt_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    # Handler name, e.g. TEAM_BATTLE_GAME_PLAY / SEASON_PASS_INTERNAL_WIN / SEASON_PASS_GAME_XP.
+    event_type = Column(String(50), nullable=False)
+
+    # Globally unique key, e.g. "TEAM_BATTLE_GAME_PLAY:ROULETTE:123" (123 = user_event_log id).
+    idempotency_key = Column(String(128), nullable=False)
+
+    payload_json = Column(JSON().with_variant(MySQLJSON, "mysql"), nullable=False, default=dict)
+
+    # PENDING -> PROCESSING -> DONE, or back to PENDING with backoff; FAILED after max attempts.
+    status = Column(String(20), nullable=False, default="PENDING")
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    locked_at = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    processed_at = Column(DateTime, nullable=True)
@@ -0,0 +1,30 @@
+"""Idempotency keys of /play requests with the response they produced.
+
+A retried request (same user, feature and Idempotency-Key) replays `response_json` instead of
+consuming tokens and granting rewards again. Rows expire after PLAY_IDEMPOTENCY_TTL_SECONDS and
+are purged by scripts/purge_play_request_dedupe.py.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, String
+from sqlalchemy.dialects.mysql import JSON as MySQLJSON
+
+from app.db.base_class import Base
+
+
+class PlayRequestDedupe(Base):
+    __tablename__ = "play_request_dedupe"
+    __table_args__ = (
+        Index("uq_play_request_dedupe_key", "user_id", "feature_type", "request_id", unique=True),
+        Index("ix_play_request_dedupe_expires_at", "expires_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    # No FK: the row must stay compact and is purged independently of the user lifecycle.
+    user_id = Column(Integer, nullable=False)
+    feature_type = Column(String(30), nullable=False)
+    request_id = Column(String(64), nullable=False)
+    response_json = Column(JSON().with_variant(MySQLJSON, "mysql"), nullable=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    expires_at = Column(DateTime, nullable=False)
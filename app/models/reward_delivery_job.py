@@ -0,0 +1,43 @@
+"""Retry queue for reward deliveries that failed inline.
+
+A job is written in the same transaction that recorded the reward claim (season-pass / level
+reward log) instead of the grant itself, so the reward is delivered exactly once: either inline
+or later by the reward delivery worker.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import JSON, Column, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.dialects.mysql import JSON as MySQLJSON
+
+from app.db.base_class import Base
+
+
+class RewardDeliveryJob(Base):
+    __tablename__ = "reward_delivery_job"
+    __table_args__ = (
+        Index("uq_reward_delivery_job_idempotency_key", "idempotency_key", unique=True),
+        Index("ix_reward_delivery_job_status_next_attempt", "status", "next_attempt_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("user.id", ondelete="CASCADE"), nullable=False, index=True)
+
+    # Where the reward came from, e.g. SEASON_PASS_AUTO_CLAIM / SEASON_PASS_MANUAL_CLAIM / LEVEL_XP.
+    source = Column(String(50), nullable=False)
+
+    # One job per user + source + level, e.g. "SEASON_PASS:3:7:12" (season 3, user 7, level 12).
+    idempotency_key = Column(String(128), nullable=False)
+
+    # RewardItem list: [{"reward_type": ..., "reward_amount": ..., "meta": {...}}, ...]
+    rewards_json = Column(JSON().with_variant(MySQLJSON, "mysql"), nullable=False, default=list)
+
+    # PENDING -> PROCESSING -> DONE, or back to PENDING with backoff; FAILED after max attempts.
+    status = Column(String(20), nullable=False, default="PENDING")
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    locked_at = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    delivered_at = Column(DateTime, nullable=True)
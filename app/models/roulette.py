@@ -16,6 +16,8 @@ class RouletteConfig(Base):
     name = Column(String(100), nullable=False)
     is_active = Column(Boolean, nullable=False, default=True)
     max_daily_spins = Column(Integer, nullable=False, default=0)
+    # Bumped on every admin edit; spins read an immutable snapshot keyed by (id, version).
+    version = Column(Integer, nullable=False, default=1, server_default="1")
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -52,6 +54,7 @@ class RouletteLog(Base):
     __tablename__ = "roulette_log"
     __table_args__ = (
         Index("ix_roulette_log_user_created_at", "user_id", "created_at"),
+        Index("ix_roulette_log_created_at_id", "created_at", "id"),
     )
 
     id = Column(Integer, primary_key=True, index=True)
@@ -1,6 +1,8 @@
 """Tracks how many game tokens a user currently has that originated from TRIAL_GRANT.
 
 This enables reliable routing of trial-play rewards into Vault without heuristics.
+
+Superseded by `user_game_wallet.trial_balance` (backfilled in 20251226_0010); no longer written.
 """
 
 from datetime import datetime
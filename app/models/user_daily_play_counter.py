@@ -0,0 +1,24 @@
+"""Per-user daily play counters (KST day) maintained by the game play pipeline.
+
+Replaces COUNT(*) ... WHERE DATE(created_at) = today scans over the game log tables.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Integer, String, UniqueConstraint
+
+from app.db.base_class import Base
+
+
+class UserDailyPlayCounter(Base):
+    __tablename__ = "user_daily_play_counter"
+    __table_args__ = (
+        UniqueConstraint("user_id", "feature_type", "kst_date", name="uq_user_daily_play_counter"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("user.id", ondelete="CASCADE"), nullable=False)
+    feature_type = Column(String(30), nullable=False)
+    kst_date = Column(Date, nullable=False)
+    play_count = Column(Integer, nullable=False, default=0, server_default="0")
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
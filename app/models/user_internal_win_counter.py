@@ -0,0 +1,23 @@
+"""Per-user, per-season internal game win counters maintained by the game play pipeline.
+
+Feeds the season pass INTERNAL_WIN_50 stamp without COUNT(*) scans over the game log tables.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, UniqueConstraint
+
+from app.db.base_class import Base
+
+
+class UserInternalWinCounter(Base):
+    __tablename__ = "user_internal_win_counter"
+    __table_args__ = (
+        UniqueConstraint("user_id", "season_id", name="uq_user_internal_win_counter"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("user.id", ondelete="CASCADE"), nullable=False)
+    season_id = Column(Integer, ForeignKey("season_pass_config.id", ondelete="CASCADE"), nullable=False)
+    win_count = Column(Integer, nullable=False, default=0, server_default="0")
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
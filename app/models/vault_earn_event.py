@@ -17,6 +17,7 @@ class VaultEarnEvent(Base):
     __table_args__ = (
         Index("ix_vault_earn_event_user_created_at", "user_id", "created_at"),
         Index("uq_vault_earn_event_earn_event_id", "earn_event_id", unique=True),
+        Index("ix_vault_earn_event_created_at_id", "created_at", "id"),
     )
 
     id = Column(Integer, primary_key=True, index=True)
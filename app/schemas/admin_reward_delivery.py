@@ -0,0 +1,27 @@
+"""Schemas for the admin reward delivery retry-queue view."""
+from datetime import datetime
+
+from pydantic import ConfigDict
+
+from app.schemas.base import KstBaseModel as BaseModel
+
+
+class RewardDeliveryJobEntry(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    user_id: int
+    source: str
+    idempotency_key: str
+    rewards_json: list[dict]
+    status: str
+    attempts: int
+    next_attempt_at: datetime
+    last_error: str | None = None
+    created_at: datetime
+    delivered_at: datetime | None = None
+
+
+class RewardDeliveryBacklogResponse(BaseModel):
+    counts: dict[str, int]
+    items: list[RewardDeliveryJobEntry]
@@ -0,0 +1,80 @@
+from typing import Dict, List, Optional
+
+from pydantic import Field
+
+from app.schemas.admin_dice import AdminDiceConfigUpdate
+from app.schemas.admin_lottery import AdminLotteryPrizeBase
+from app.schemas.admin_roulette import AdminRouletteSegmentBase
+from app.schemas.base import KstBaseModel as BaseModel
+
+MAX_SIMULATION_PLAYS = 5_000_000
+
+
+class SimulationOptions(BaseModel):
+    plays: int = Field(1_000_000, ge=1, le=MAX_SIMULATION_PLAYS)
+    # Payout percentiles are reported per block of this many plays (e.g. per 1000 plays).
+    block_size: int = Field(1000, ge=1)
+    seed: Optional[int] = None
+    # Reward type counted as payout for RTP/percentiles (other types are broken down separately).
+    payout_reward_type: str = "POINT"
+    # Value of one play in payout units; RTP is only reported when set.
+    cost_per_play: Optional[float] = Field(None, gt=0)
+    # Expected load, used to turn stock depletion play counts into hours.
+    plays_per_hour: Optional[int] = Field(None, gt=0)
+
+
+class RouletteSimulationRequest(SimulationOptions):
+    config_id: Optional[int] = None
+    # Proposed (unsaved) segments; replaces the saved segments of config_id when given.
+    segments: Optional[List[AdminRouletteSegmentBase]] = None
+
+
+class LotterySimulationRequest(SimulationOptions):
+    config_id: Optional[int] = None
+    # Proposed (unsaved) prizes; replaces the saved prizes of config_id when given.
+    prizes: Optional[List[AdminLotteryPrizeBase]] = None
+
+
+class DiceSimulationRequest(SimulationOptions):
+    config_id: Optional[int] = None
+    # Proposed (unsaved) reward table; fields left empty fall back to config_id.
+    rewards: Optional[AdminDiceConfigUpdate] = None
+
+
+class SimulationOutcomeStats(BaseModel):
+    key: str
+    label: str
+    reward_type: str
+    reward_amount: int
+    expected_rate: float
+    observed_rate: float
+    is_jackpot: bool = False
+
+
+class StockDepletionPoint(BaseModel):
+    key: str
+    label: str
+    stock: int
+    sold_out_at_play: Optional[int] = None
+    sold_out_at_hour: Optional[float] = None
+
+
+class SimulationResponse(BaseModel):
+    game: str
+    plays: int
+    plays_simulated: int
+    seed: Optional[int] = None
+    payout_reward_type: str
+    mean_payout: float
+    payout_variance: float
+    payout_std: float
+    rtp: Optional[float] = None
+    block_size: int
+    block_payout_percentiles: Dict[str, float] = {}
+    jackpot_rate: Optional[float] = None
+    plays_per_jackpot: Optional[float] = None
+    reward_type_means: Dict[str, float] = {}
+    outcomes: List[SimulationOutcomeStats] = []
+    stock_depletion: List[StockDepletionPoint] = []
+    # Set when every prize sold out before `plays` (live plays would start failing here).
+    exhausted_at_play: Optional[int] = None
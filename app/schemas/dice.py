@@ -28,5 +28,7 @@ class DiceResult(BaseModel):
 class DicePlayResponse(BaseModel):
     result: str
     game: DiceResult
+    # All rolls of a batched play (`count`), in order; `game` is the last one.
+    results: list[DiceResult] = []
     season_pass: dict | None = None
     vault_earn: int = 0
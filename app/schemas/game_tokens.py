@@ -56,3 +56,25 @@ class LedgerEntry(BaseModel):
     label: str | None = None
     meta_json: dict | None = None
     created_at: str
+
+
+class BulkGameTokensRequest(BaseModel):
+    """Target users by id, external id and/or a user_segment name (union of all given)."""
+
+    user_ids: list[int] = Field(default_factory=list)
+    external_ids: list[str] = Field(default_factory=list)
+    segment: str | None = None
+    token_type: GameTokenType
+    amount: int = Field(gt=0)
+    reason: str | None = Field(default=None, max_length=100)
+    label: str | None = Field(default=None, max_length=255)
+
+
+class BulkGameTokensResponse(BaseModel):
+    token_type: GameTokenType
+    amount: int
+    requested: int
+    applied: int
+    skipped_user_ids: list[int] = []
+    not_found: list[str] = []
+    elapsed_ms: int
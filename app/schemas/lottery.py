@@ -30,4 +30,6 @@ class LotteryStatusResponse(BaseModel):
 class LotteryPlayResponse(BaseModel):
     result: str
     prize: LotteryPrizeSchema
+    # All draws of a batched play (`count`), in order; `prize` is the last one.
+    results: list[LotteryPrizeSchema] = []
     season_pass: dict | None = None
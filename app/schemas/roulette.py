@@ -31,5 +31,7 @@ class RouletteStatusResponse(BaseModel):
 class RoulettePlayResponse(BaseModel):
     result: str
     segment: RouletteSegmentSchema
+    # All spins of a batched play (`count`), in order; `segment` is the last one.
+    results: list[RouletteSegmentSchema] = []
     season_pass: dict | None = None
     vault_earn: int = 0
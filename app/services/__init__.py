@@ -1,7 +1,14 @@
 """Service package exports."""
 from app.services.dice_service import DiceService
 from app.services.feature_service import FeatureService
-from app.services.game_common import GamePlayContext, apply_season_pass_stamp, enforce_daily_limit, log_game_play
+from app.services.game_common import (
+    GamePlayContext,
+    apply_season_pass_stamp,
+    enforce_daily_limit,
+    log_game_play,
+    log_game_play_many,
+    play_unit_of_work,
+)
 from app.services.lottery_service import LotteryService
 from app.services.ranking_service import RankingService
 from app.services.reward_service import RewardService
@@ -15,6 +22,8 @@ __all__ = [
     "apply_season_pass_stamp",
     "enforce_daily_limit",
     "log_game_play",
+    "log_game_play_many",
+    "play_unit_of_work",
     "LotteryService",
     "RankingService",
     "RewardService",
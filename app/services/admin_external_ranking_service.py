@@ -8,11 +8,11 @@ from sqlalchemy.orm import Session
 
 from app.models.external_ranking import ExternalRankingData
 from app.models.user_activity import UserActivity
-from app.models.season_pass import SeasonPassStampLog
 from app.schemas.external_ranking import ExternalRankingCreate, ExternalRankingUpdate
 from app.models.user import User
 from app.models.new_member_dice import NewMemberDiceEligibility
 from app.services.vault_service import VaultService
+from app.services.season_pass_cache import season_pass_cache
 from app.services.season_pass_service import SeasonPassService
 from app.core.config import get_settings
 
@@ -180,6 +180,7 @@ class AdminExternalRankingService:
             db.add(season)
             db.add_all(levels)
             db.commit()
+            season_pass_cache.invalidate()
             current_season = season
 
         if not current_season:
@@ -187,6 +188,11 @@ class AdminExternalRankingService:
 
         season_id = current_season.id
 
+        xp_by_user: dict[int, int] = {}
+        # Remainders of users getting XP are written with their XP chunk; until then the row keeps the
+        # whole unconverted deposit, so a chunk that fails is converted again by the next import.
+        xp_remainders: dict[int, int] = {}
+        rows_by_user = {row.user_id: row for row in results}
         for row in results:
             # 예치: step_amount 단위당 XP 지급 + remainder 누적 (사용자별 이전 상태 기준)
             snap = prev_snapshot.get(
@@ -211,14 +217,23 @@ class AdminExternalRankingService:
                     continue
 
             if deposit_steps > 0 and xp_per_step > 0:
-                xp_to_add = deposit_steps * xp_per_step
-                season_pass.add_bonus_xp(db, user_id=row.user_id, xp_amount=xp_to_add, now=today)
+                xp_by_user[row.user_id] = xp_by_user.get(row.user_id, 0) + deposit_steps * xp_per_step
+                xp_remainders[row.user_id] = remainder
+                row.deposit_remainder = total_for_step
+                continue
 
             row.deposit_remainder = remainder
 
             # 이용 횟수: 1회당 20 XP 지급 (일일 누적 대비 증분 계산)
             # play_count 기반 XP 지급은 비활성
 
+        def _apply_remainders(user_ids: list[int]) -> None:
+            for user_id in user_ids:
+                rows_by_user[user_id].deposit_remainder = xp_remainders[user_id]
+
+        db.commit()
+        season_pass.apply_bonus_xp_bulk(db, season_id, xp_by_user, before_commit=_apply_remainders)
+
         # Weekly TOP10 (once per ISO week)
         top10 = (
             db.execute(
@@ -232,24 +247,14 @@ class AdminExternalRankingService:
         iso_year, iso_week, _ = today.isocalendar()
         week_key = f"W{iso_year}-{iso_week:02d}"
         for entry in top10:
-            existing_top = (
-                db.query(SeasonPassStampLog)
-                .filter(
-                    SeasonPassStampLog.user_id == entry.user_id,
-                    SeasonPassStampLog.season_id == season_id,
-                    SeasonPassStampLog.source_feature_type == "EXTERNAL_RANKING_TOP10",
-                    SeasonPassStampLog.period_key == f"TOP10_{week_key}",
-                )
-                .one_or_none()
+            season_pass.maybe_add_stamp(
+                db,
+                user_id=entry.user_id,
+                source_feature_type="EXTERNAL_RANKING_TOP10",
+                now=today,
+                period_key=f"TOP10_{week_key}",
+                once_per_period=True,
             )
-            if not existing_top:
-                season_pass.maybe_add_stamp(
-                    db,
-                    user_id=entry.user_id,
-                    source_feature_type="EXTERNAL_RANKING_TOP10",
-                    now=today,
-                    period_key=f"TOP10_{week_key}",
-                )
         return results
 
     @staticmethod
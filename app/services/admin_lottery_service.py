@@ -21,6 +21,11 @@ class AdminLotteryService:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="LOTTERY_CONFIG_NOT_FOUND")
         return config
 
+    @staticmethod
+    def _bump_version(config: LotteryConfig) -> None:
+        # Plays cache prize samplers per version; any edit must publish a new one.
+        config.version = (config.version or 1) + 1
+
     @staticmethod
     def _apply_prizes(config: LotteryConfig, prizes_data):
         # Clear then flush so deletes happen before inserts (avoid unique constraint conflicts on label)
@@ -95,6 +100,7 @@ class AdminLotteryService:
                 config.max_daily_tickets = update_data["max_daily_plays"]
             if data.prizes is not None:
                 AdminLotteryService._apply_prizes(config, data.prizes)
+            AdminLotteryService._bump_version(config)
             db.add(config)
             db.commit()
             db.refresh(config)
@@ -110,6 +116,7 @@ class AdminLotteryService:
     def toggle_active(db: Session, config_id: int, active: bool) -> LotteryConfig:
         config = AdminLotteryService.get_config(db, config_id)
         config.is_active = active
+        AdminLotteryService._bump_version(config)
         db.add(config)
         db.commit()
         db.refresh(config)
@@ -22,6 +22,11 @@ class AdminRouletteService:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="ROULETTE_CONFIG_NOT_FOUND")
         return config
 
+    @staticmethod
+    def _bump_version(config: RouletteConfig) -> None:
+        # Spins cache segment snapshots per version; any edit must publish a new one.
+        config.version = (config.version or 1) + 1
+
     @staticmethod
     def _apply_segments(db: Session, config: RouletteConfig, segments_data):
         # Normalize to exactly 6 slots (0~5). Accept both `index` and `slot_index`, pad/truncate silently.
@@ -100,6 +105,7 @@ class AdminRouletteService:
                 config.max_daily_spins = update_data["max_daily_spins"]
             if data.segments is not None:
                 AdminRouletteService._apply_segments(db, config, data.segments)
+            AdminRouletteService._bump_version(config)
             db.add(config)
             db.commit()
             db.refresh(config)
@@ -115,6 +121,7 @@ class AdminRouletteService:
     def toggle_active(db: Session, config_id: int, active: bool) -> RouletteConfig:
         config = AdminRouletteService.get_config(db, config_id)
         config.is_active = active
+        AdminRouletteService._bump_version(config)
         db.add(config)
         db.commit()
         db.refresh(config)
@@ -13,6 +13,7 @@ from app.schemas.admin_season import (
     AdminSeasonResponse,
     AdminSeasonUpdate,
 )
+from app.services.season_pass_cache import season_pass_cache
 
 
 class AdminSeasonService:
@@ -67,6 +68,7 @@ class AdminSeasonService:
         db.add(season)
         db.commit()
         db.refresh(season)
+        season_pass_cache.invalidate()
         return season
 
     @staticmethod
@@ -98,6 +100,7 @@ class AdminSeasonService:
             db.add(season)
             db.commit()
             db.refresh(season)
+            season_pass_cache.invalidate()
         return season
 
     @staticmethod
@@ -107,4 +110,5 @@ class AdminSeasonService:
         db.add(season)
         db.commit()
         db.refresh(season)
+        season_pass_cache.invalidate()
         return season
@@ -0,0 +1,46 @@
+"""Process-local cache of immutable, versioned game config snapshots.
+
+Game configs carry a ``version`` column that admin edits bump. Play paths read the
+(cheap, unlocked) config row, then reuse the snapshot built for that exact version
+instead of re-reading and locking child rows on every play.
+"""
+from __future__ import annotations
+
+import threading
+import weakref
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+from sqlalchemy.orm import Session
+
+T = TypeVar("T")
+
+
+class VersionedSnapshotCache(Generic[T]):
+    """Cache snapshots per database bind, keyed by (config_id, version)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # Keyed by engine so separate databases (e.g. per-test in-memory SQLite) never share entries.
+        self._by_bind: "weakref.WeakKeyDictionary[object, dict[int, tuple[int, T]]]" = weakref.WeakKeyDictionary()
+
+    def get_or_build(self, db: Session, config_id: int, version: int, builder: Callable[[], T]) -> T:
+        bind = db.get_bind()
+        with self._lock:
+            entries = self._by_bind.setdefault(bind, {})
+            cached = entries.get(config_id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        # Built outside the lock: concurrent misses may both build, last writer wins with identical data.
+        snapshot = builder()
+        with self._lock:
+            entries = self._by_bind.setdefault(bind, {})
+            current = entries.get(config_id)
+            if current is None or current[0] <= version:
+                entries[config_id] = (version, snapshot)
+        return snapshot
+
+    def clear(self) -> None:
+        with self._lock:
+            self._by_bind.clear()
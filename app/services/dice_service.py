@@ -2,7 +2,7 @@
 from datetime import date, datetime
 import random
 
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.core.exceptions import InvalidConfigError
@@ -12,10 +12,19 @@ from app.models.feature import FeatureType
 from app.models.game_wallet import GameTokenType
 from app.schemas.dice import DicePlayResponse, DiceResult, DiceStatusResponse
 from app.services.feature_service import FeatureService
-from app.services.game_common import GamePlayContext, log_game_play
+from app.services.game_common import (
+    MAX_PLAY_BATCH,
+    GamePlayContext,
+    aggregate_rewards,
+    game_xp_deferrer,
+    log_game_play_many,
+    play_unit_of_work,
+    record_internal_wins,
+)
 from app.services.game_wallet_service import GameWalletService
-from app.services.reward_service import RewardService
-from app.services.season_pass_service import SeasonPassService
+from app.services.play_counter_service import PlayCounterService
+from app.services.play_idempotency_service import PlayIdempotencyService
+from app.services.reward_service import RewardItem, RewardService
 from app.services.vault_service import VaultService
 
 
@@ -29,8 +38,9 @@ class DiceService:
         self.feature_service = FeatureService()
         self.reward_service = RewardService()
         self.wallet_service = GameWalletService()
-        self.season_pass_service = SeasonPassService()
         self.vault_service = VaultService()
+        self.play_counter_service = PlayCounterService()
+        self.idempotency_service = PlayIdempotencyService()
 
     def _get_today_config(self, db: Session) -> DiceConfig:
         config = db.execute(select(DiceConfig).where(DiceConfig.is_active.is_(True))).scalar_one_or_none()
@@ -49,13 +59,7 @@ class DiceService:
         token_type = GameTokenType.DICE_TOKEN
         token_balance = self.wallet_service.get_balance(db, user_id, token_type)
 
-        today_plays = db.execute(
-            select(func.count()).select_from(DiceLog).where(
-                DiceLog.user_id == user_id,
-                DiceLog.config_id == config.id,
-                func.date(DiceLog.created_at) == today,
-            )
-        ).scalar_one()
+        today_plays = self.play_counter_service.get_today(db, user_id, FeatureType.DICE.value, today)
         # Daily cap removed: use 0 to denote unlimited.
         unlimited = 0
         remaining = 0
@@ -71,20 +75,7 @@ class DiceService:
             feature_type=FeatureType.DICE,
         )
 
-    def play(self, db: Session, user_id: int, now: date | datetime) -> DicePlayResponse:
-        today = now.date() if isinstance(now, datetime) else now
-        self.feature_service.validate_feature_active(db, today, FeatureType.DICE)
-        config = self._get_today_config(db)
-        token_type = GameTokenType.DICE_TOKEN
-
-        today_plays = db.execute(
-            select(func.count()).select_from(DiceLog).where(
-                DiceLog.user_id == user_id,
-                DiceLog.config_id == config.id,
-                func.date(DiceLog.created_at) == today,
-            )
-        ).scalar_one()
-
+    def _roll(self, config: DiceConfig) -> DiceResult:
         user_dice = [random.randint(1, 6), random.randint(1, 6)]
         dealer_dice = [random.randint(1, 6), random.randint(1, 6)]
         user_sum = sum(user_dice)
@@ -107,101 +98,138 @@ class DiceService:
             reward_type = config.lose_reward_type
             reward_amount = config.lose_reward_amount
 
-        _, consumed_trial = self.wallet_service.require_and_consume_token(
-            db,
-            user_id,
-            token_type,
-            amount=1,
-            reason="DICE_PLAY",
-            label=f"{config.name} - {outcome}",
-            meta={"result": outcome},
-        )
-
-        log_entry = DiceLog(
-            user_id=user_id,
-            config_id=config.id,
-            user_dice_1=user_dice[0],
-            user_dice_2=user_dice[1],
+        return DiceResult(
+            user_dice=user_dice,
+            dealer_dice=dealer_dice,
             user_sum=user_sum,
-            dealer_dice_1=dealer_dice[0],
-            dealer_dice_2=dealer_dice[1],
             dealer_sum=dealer_sum,
-            result=outcome,
+            outcome=outcome,
             reward_type=reward_type,
             reward_amount=reward_amount,
         )
-        db.add(log_entry)
-        db.commit()
-        db.refresh(log_entry)
 
-        total_earn = 0
-        # Vault Phase 1: idempotent game accrual (safe-guarded by feature flag).
-        total_earn += self.vault_service.record_game_play_earn_event(
-            db,
-            user_id=user_id,
-            game_type=FeatureType.DICE.value,
-            game_log_id=log_entry.id,
-            token_type=token_type.value,
-            outcome=outcome,
-            payout_raw={
-                "result": outcome,
-                "reward_type": reward_type,
-                "reward_amount": reward_amount,
-            },
-        )
+    def play(self, db: Session, user_id: int, now: date | datetime, count: int = 1, request_id: str | None = None) -> DicePlayResponse:
+        """Roll ``count`` times in one transaction (one wallet update, bulk logs, one grant per reward type)."""
+
+        today = now.date() if isinstance(now, datetime) else now
+        if count < 1 or count > MAX_PLAY_BATCH:
+            raise InvalidConfigError("INVALID_PLAY_COUNT")
+        # A retried request (same Idempotency-Key) gets the original result; nothing is consumed twice.
+        replayed = self.idempotency_service.replay(db, user_id, FeatureType.DICE.value, request_id, DicePlayResponse)
+        if replayed is not None:
+            return replayed
+        self.feature_service.validate_feature_active(db, today, FeatureType.DICE)
+        config = self._get_today_config(db)
+        token_type = GameTokenType.DICE_TOKEN
+
+        results = [self._roll(config) for _ in range(count)]
 
-        # Trial: optionally route reward into Vault instead of direct payout.
         settings = get_settings()
-        if consumed_trial and bool(getattr(settings, "enable_trial_payout_to_vault", False)):
-            total_earn += self.vault_service.record_trial_result_earn_event(
+        trial_to_vault = bool(getattr(settings, "enable_trial_payout_to_vault", False))
+        ctx = GamePlayContext(
+            user_id=user_id, feature_type=FeatureType.DICE.value, today=today, request_id=request_id
+        )
+        total_earn = 0
+        # Wallet, log, vault, event log and reward share one transaction; side effects run after commit.
+        with play_unit_of_work(ctx, db):
+            _, trial_flags = self.wallet_service.consume_tokens_for_plays(
                 db,
-                user_id=user_id,
-                game_type=FeatureType.DICE.value,
-                game_log_id=log_entry.id,
-                token_type=token_type.value,
-                reward_type=reward_type,
-                reward_amount=reward_amount,
-                payout_raw={"result": outcome},
+                user_id,
+                token_type,
+                labels=[f"{config.name} - {game.outcome}" for game in results],
+                reason="DICE_PLAY",
+                metas=[{"result": game.outcome} for game in results],
+                commit=False,
             )
 
-        xp_award = self.WIN_GAME_XP if outcome == "WIN" else self.BASE_GAME_XP
-        ctx = GamePlayContext(user_id=user_id, feature_type=FeatureType.DICE.value, today=today)
-        log_game_play(
-            ctx,
-            db,
-            {
-                "result": outcome,
-                "reward_type": reward_type,
-                "reward_amount": reward_amount,
-                "reward_label": f"{config.name} - {outcome}",
-                "xp_from_reward": xp_award,
-            },
-        )
+            log_entries = [
+                DiceLog(
+                    user_id=user_id,
+                    config_id=config.id,
+                    user_dice_1=game.user_dice[0],
+                    user_dice_2=game.user_dice[1],
+                    user_sum=game.user_sum,
+                    dealer_dice_1=game.dealer_dice[0],
+                    dealer_dice_2=game.dealer_dice[1],
+                    dealer_sum=game.dealer_sum,
+                    result=game.outcome,
+                    reward_type=game.reward_type,
+                    reward_amount=game.reward_amount,
+                )
+                for game in results
+            ]
+            db.add_all(log_entries)
+            db.flush()
+
+            payouts = []
+            for game, log_entry, consumed_trial in zip(results, log_entries, trial_flags):
+                xp_award = self.WIN_GAME_XP if game.outcome == "WIN" else self.BASE_GAME_XP
+                # Vault Phase 1: idempotent game accrual (safe-guarded by feature flag).
+                total_earn += self.vault_service.record_game_play_earn_event(
+                    db,
+                    user_id=user_id,
+                    game_type=FeatureType.DICE.value,
+                    game_log_id=log_entry.id,
+                    token_type=token_type.value,
+                    outcome=game.outcome,
+                    payout_raw={
+                        "result": game.outcome,
+                        "reward_type": game.reward_type,
+                        "reward_amount": game.reward_amount,
+                    },
+                    commit=False,
+                )
+
+                # Trial: optionally route reward into Vault instead of direct payout.
+                if consumed_trial and trial_to_vault:
+                    total_earn += self.vault_service.record_trial_result_earn_event(
+                        db,
+                        user_id=user_id,
+                        game_type=FeatureType.DICE.value,
+                        game_log_id=log_entry.id,
+                        token_type=token_type.value,
+                        reward_type=game.reward_type,
+                        reward_amount=game.reward_amount,
+                        payout_raw={"result": game.outcome},
+                        commit=False,
+                    )
+                else:
+                    payouts.append((game.reward_type, game.reward_amount, xp_award))
+
+            log_game_play_many(
+                ctx,
+                db,
+                [
+                    {
+                        "result": game.outcome,
+                        "reward_type": game.reward_type,
+                        "reward_amount": game.reward_amount,
+                        "reward_label": f"{config.name} - {game.outcome}",
+                        "xp_from_reward": self.WIN_GAME_XP if game.outcome == "WIN" else self.BASE_GAME_XP,
+                    }
+                    for game in results
+                ],
+            )
 
-        if not (consumed_trial and bool(getattr(settings, "enable_trial_payout_to_vault", False))):
-            self.reward_service.deliver(
+            self.reward_service.deliver_many(
                 db,
                 user_id=user_id,
-                reward_type=reward_type,
-                reward_amount=reward_amount,
-                meta={"reason": "dice_play", "outcome": outcome, "game_xp": xp_award},
+                rewards=[
+                    RewardItem(reward_type, reward_amount, {"reason": "dice_play", "game_xp": game_xp, **({"outcome": results[0].outcome} if count == 1 else {"plays": count})})
+                    for reward_type, (reward_amount, game_xp) in aggregate_rewards(payouts).items()
+                ],
+                commit=False,
+                defer_game_xp=game_xp_deferrer(ctx, db),
             )
-        if outcome == "WIN":
-            self.season_pass_service.maybe_add_internal_win_stamp(db, user_id=user_id, now=today)
-        # 게임 설정 포인트를 레벨 XP 보너스로 반영
-        season_pass = None  # 게임 1회당 자동 스탬프 발급을 중단하고, 조건 달성 시 별도 로직으로 처리
-
-        return DicePlayResponse(
-            result="OK",
-            game=DiceResult(
-                user_dice=user_dice,
-                dealer_dice=dealer_dice,
-                user_sum=user_sum,
-                dealer_sum=dealer_sum,
-                outcome=outcome,
-                reward_type=reward_type,
-                reward_amount=reward_amount,
-            ),
-            season_pass=season_pass,
-            vault_earn=total_earn,
-        )
+            record_internal_wins(ctx, db, sum(1 for game in results if game.outcome == "WIN"))
+            # 게임 설정 포인트를 레벨 XP 보너스로 반영
+            season_pass = None  # 게임 1회당 자동 스탬프 발급을 중단하고, 조건 달성 시 별도 로직으로 처리
+
+            ctx.response = DicePlayResponse(
+                result="OK",
+                game=results[-1],
+                results=results,
+                season_pass=season_pass,
+                vault_earn=total_earn,
+            )
+        return ctx.response
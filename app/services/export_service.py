@@ -0,0 +1,129 @@
+"""Streaming exports of ledgers and game logs for finance reconciliation.
+
+Rows are read through a server-side cursor (``yield_per`` implies ``stream_results``) and
+encoded chunk by chunk, so memory stays flat regardless of how many rows are exported.
+"""
+from __future__ import annotations
+
+import csv
+import io
+import json
+import zlib
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from enum import Enum
+
+from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.dice import DiceLog
+from app.models.game_wallet_ledger import UserGameWalletLedger
+from app.models.lottery import LotteryLog
+from app.models.roulette import RouletteLog
+from app.models.user_cash_ledger import UserCashLedger
+from app.models.vault_earn_event import VaultEarnEvent
+from app.schemas.base import to_kst_iso
+
+EXPORT_DATASETS = {
+    "game-wallet-ledger": UserGameWalletLedger,
+    "cash-ledger": UserCashLedger,
+    "vault-earn-events": VaultEarnEvent,
+    "roulette-logs": RouletteLog,
+    "dice-logs": DiceLog,
+    "lottery-logs": LotteryLog,
+}
+
+EXPORT_FORMATS = ("csv", "jsonl")
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def _to_utc_naive(value: datetime | None) -> datetime | None:
+    """DB timestamps are naive UTC; aware inputs are converted, naive inputs are taken as UTC."""
+
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _cell(value):
+    if isinstance(value, datetime):
+        return to_kst_iso(value)
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _csv_cell(value):
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+class ExportService:
+    def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+        self.batch_size = max(int(batch_size), 1)
+
+    @staticmethod
+    def get_model(dataset: str):
+        model = EXPORT_DATASETS.get(dataset)
+        if model is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="EXPORT_DATASET_NOT_FOUND")
+        return model
+
+    @staticmethod
+    def columns(model) -> list[str]:
+        return [column.name for column in model.__table__.columns]
+
+    def iter_rows(
+        self,
+        db: Session,
+        model,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        user_id: int | None = None,
+    ) -> Iterator[dict]:
+        """Yield rows as plain dicts in (created_at, id) order, ``batch_size`` rows per fetch."""
+
+        table = model.__table__
+        stmt = select(table)
+        start, end = _to_utc_naive(start), _to_utc_naive(end)
+        if start is not None:
+            stmt = stmt.where(table.c.created_at >= start)
+        if end is not None:
+            stmt = stmt.where(table.c.created_at < end)
+        if user_id is not None:
+            stmt = stmt.where(table.c.user_id == user_id)
+        stmt = stmt.order_by(table.c.created_at, table.c.id).execution_options(yield_per=self.batch_size)
+        for row in db.execute(stmt):
+            yield {key: _cell(value) for key, value in row._mapping.items()}
+
+    def encode_csv(self, rows: Iterator[dict], columns: list[str]) -> Iterator[bytes]:
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore")
+        writer.writeheader()
+        pending = 0
+        for row in rows:
+            writer.writerow({key: _csv_cell(value) for key, value in row.items()})
+            pending += 1
+            if pending >= self.batch_size:
+                yield buffer.getvalue().encode("utf-8")
+                buffer.seek(0)
+                buffer.truncate()
+                pending = 0
+        yield buffer.getvalue().encode("utf-8")
+
+    def encode_jsonl_gzip(self, rows: Iterator[dict]) -> Iterator[bytes]:
+        compressor = zlib.compressobj(wbits=31)  # 31 = gzip container
+        lines: list[str] = []
+        for row in rows:
+            lines.append(json.dumps(row, ensure_ascii=False, default=str))
+            if len(lines) >= self.batch_size:
+                chunk = compressor.compress(("\n".join(lines) + "\n").encode("utf-8"))
+                lines.clear()
+                if chunk:
+                    yield chunk
+        if lines:
+            yield compressor.compress(("\n".join(lines) + "\n").encode("utf-8"))
+        yield compressor.flush()
@@ -1,15 +1,34 @@
 """Common helpers for game services (logging, season-pass hooks)."""
-from dataclasses import dataclass
+import logging
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import date
 from typing import Any, Optional
 
+from fastapi import HTTPException
 from sqlalchemy.orm import Session
 
+from app.core.config import get_settings
 from app.core.exceptions import DailyLimitReachedError
 from app.models.feature import UserEventLog
+from app.services.outbox_service import (
+    SEASON_PASS_GAME_XP,
+    SEASON_PASS_INTERNAL_WIN,
+    TEAM_BATTLE_GAME_PLAY,
+    OutboxService,
+)
+from app.services.play_counter_service import PlayCounterService
+from app.services.play_idempotency_service import PlayIdempotencyService
 from app.services.season_pass_service import SeasonPassService
 from app.services.team_battle_service import TeamBattleService
 
+logger = logging.getLogger(__name__)
+
+# Upper bound for `count` on batched /play requests.
+MAX_PLAY_BATCH = 50
+
+
 @dataclass
 class GamePlayContext:
     """Context container for a single game play action."""
@@ -19,6 +38,46 @@ class GamePlayContext:
     today: date
     request_id: Optional[str] = None
     metadata: Optional[dict[str, Any]] = None
+    # Side effects that must only run once the play transaction is durable.
+    post_commit_hooks: list[Callable[[], Any]] = field(default_factory=list)
+    # user_event_log ids written for this request; anchors outbox idempotency keys.
+    event_log_ids: list[int] = field(default_factory=list)
+    # Response stored for Idempotency-Key replays (set by the service before the block exits).
+    response: Any = None
+
+    def after_commit(self, hook: Callable[[], Any]) -> None:
+        """Declare a best-effort side effect to run after the play commits."""
+
+        self.post_commit_hooks.append(hook)
+
+
+@contextmanager
+def play_unit_of_work(ctx: GamePlayContext, db: Session) -> Iterator[GamePlayContext]:
+    """Run a game play as one transaction: a single commit, then post-commit hooks.
+
+    Every step inside the block must write with ``commit=False`` (flush only). If any step
+    raises, the whole play is rolled back so wallet/log/reward state never diverges.
+    With ``ctx.request_id`` the key is claimed first and ``ctx.response`` is stored in the same commit.
+    """
+
+    try:
+        dedupe = (
+            PlayIdempotencyService.claim(db, ctx.user_id, ctx.feature_type, ctx.request_id) if ctx.request_id else None
+        )
+        yield ctx
+        if dedupe is not None:
+            PlayIdempotencyService.complete(db, dedupe, ctx.response)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    for hook in ctx.post_commit_hooks:
+        try:
+            hook()
+        except Exception:  # noqa: BLE001 - post-commit side effects must never fail the play
+            logger.warning("post-commit hook failed for %s play (user_id=%s)", ctx.feature_type, ctx.user_id, exc_info=True)
+            db.rollback()
 
 
 def log_game_play(ctx: GamePlayContext, db: Session, result_payload: dict[str, Any]) -> None:
@@ -37,6 +96,115 @@ def log_game_play(ctx: GamePlayContext, db: Session, result_payload: dict[str, A
     _log_team_battle_points(ctx, db, result_payload)
 
 
+def log_game_play_many(ctx: GamePlayContext, db: Session, result_payloads: list[dict[str, Any]]) -> None:
+    """Batched ``log_game_play``: one user_event_log row per play, one team battle award for the batch.
+
+    Also bumps the user's daily play counter. Always joins the caller's transaction (flush only);
+    team battle scoring is deferred via ``defer_side_effect``.
+    """
+
+    entries = [
+        UserEventLog(user_id=ctx.user_id, feature_type=ctx.feature_type, event_name="PLAY", meta_json=payload)
+        for payload in result_payloads
+    ]
+    db.add_all(entries)
+    if not entries:
+        return
+    PlayCounterService().increment(db, ctx.user_id, ctx.feature_type, ctx.today, plays=len(entries))
+    db.flush()
+    ctx.event_log_ids.extend(entry.id for entry in entries)
+
+    last = result_payloads[-1]
+    defer_side_effect(
+        ctx,
+        db,
+        TEAM_BATTLE_GAME_PLAY,
+        {
+            "user_id": ctx.user_id,
+            "plays": len(entries),
+            "meta": {
+                "feature_type": ctx.feature_type,
+                "result": last.get("result"),
+                "reward_type": last.get("reward_type"),
+                "reward_amount": last.get("reward_amount"),
+                "plays": len(entries),
+            },
+        },
+    )
+
+
+def defer_side_effect(ctx: GamePlayContext, db: Session, event_type: str, payload: dict[str, Any]) -> None:
+    """Declare a post-play side effect handled by ``OutboxService``.
+
+    With PLAY_OUTBOX_ENABLED the effect is written to outbox_event inside the play transaction and
+    applied by the outbox worker; otherwise it runs in-request right after the play commits.
+    """
+
+    if get_settings().play_outbox_enabled:
+        # One effect of each type per request, anchored on the request's last event log row.
+        key = f"{event_type}:{ctx.feature_type}:{ctx.event_log_ids[-1]}"
+        OutboxService.enqueue(db, event_type, key, payload)
+        return
+
+    def _apply() -> None:
+        OutboxService.apply(db, event_type, payload)
+        db.commit()
+
+    ctx.after_commit(_apply)
+
+
+def defer_internal_win_check(ctx: GamePlayContext, db: Session) -> None:
+    """Check the season pass INTERNAL_WIN stamp after a winning play."""
+
+    defer_side_effect(ctx, db, SEASON_PASS_INTERNAL_WIN, {"user_id": ctx.user_id, "day": ctx.today.isoformat()})
+
+
+def record_internal_wins(ctx: GamePlayContext, db: Session, wins: int) -> None:
+    """Count winning plays toward INTERNAL_WIN_50 inside the play transaction, then schedule the stamp check."""
+
+    if wins <= 0:
+        return
+    try:
+        SeasonPassService().record_internal_wins(db, user_id=ctx.user_id, wins=wins, now=ctx.today)
+    except HTTPException as exc:
+        # Season misconfiguration (e.g. overlapping seasons) must not fail the play itself.
+        logger.warning("internal win counter skipped for user %s: %s", ctx.user_id, exc.detail)
+        return
+    defer_internal_win_check(ctx, db)
+
+
+def game_xp_deferrer(ctx: GamePlayContext, db: Session) -> Callable[[int], None] | None:
+    """Return a sink for game-reward XP when plays use the outbox; ``None`` keeps XP inline in deliver()."""
+
+    if not get_settings().play_outbox_enabled:
+        return None
+
+    def _defer(xp_amount: int) -> None:
+        defer_side_effect(
+            ctx,
+            db,
+            SEASON_PASS_GAME_XP,
+            {"user_id": ctx.user_id, "xp_amount": int(xp_amount), "day": ctx.today.isoformat()},
+        )
+
+    return _defer
+
+
+def aggregate_rewards(rewards: Iterable[tuple[str, int, int]]) -> dict[str, tuple[int, int]]:
+    """Sum ``(reward_type, reward_amount, game_xp)`` per reward type so a batch pays one grant per type.
+
+    Zero/NONE rewards are dropped, mirroring ``RewardService.deliver_many`` which skips them (and their XP).
+    """
+
+    totals: dict[str, tuple[int, int]] = {}
+    for reward_type, amount, game_xp in rewards:
+        if not amount or reward_type in {"NONE", "", None}:
+            continue
+        prev_amount, prev_xp = totals.get(reward_type, (0, 0))
+        totals[reward_type] = (prev_amount + amount, prev_xp + game_xp)
+    return totals
+
+
 def enforce_daily_limit(limit: int, played: int) -> None:
     """Raise when the played count exceeds or meets the daily limit."""
 
@@ -0,0 +1,358 @@
+"""Monte Carlo payout simulation for roulette, lottery and dice configs (admin tooling).
+
+Roulette and lottery draws use the production AliasSampler tables
+(``prob``/``alias``), vectorized with NumPy, so simulated frequencies match live plays.
+Lottery stock is depleted in play order and sold-out prizes are excluded exactly like
+``LotteryService`` does. NumPy is optional and only imported when a simulation runs.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import product
+
+from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.exceptions import InvalidConfigError
+from app.models.dice import DiceConfig
+from app.models.lottery import LotteryConfig, LotteryPrize
+from app.models.roulette import RouletteConfig, RouletteSegment
+from app.schemas.admin_simulation import (
+    DiceSimulationRequest,
+    LotterySimulationRequest,
+    RouletteSimulationRequest,
+    SimulationOptions,
+    SimulationOutcomeStats,
+    SimulationResponse,
+    StockDepletionPoint,
+)
+from app.services.lottery_service import LotteryConfigSnapshot
+from app.services.weighted_sampler import AliasSampler
+
+PERCENTILES = (1, 5, 25, 50, 75, 95, 99)
+CHUNK_SIZE = 1 << 18
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError as exc:  # pragma: no cover - depends on the deployment image
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="SIMULATION_REQUIRES_NUMPY") from exc
+    return numpy
+
+
+@dataclass(frozen=True)
+class SimulationOutcome:
+    """One drawable result with its payout."""
+
+    key: str
+    label: str
+    reward_type: str
+    reward_amount: int
+    weight: float = 0.0
+    stock: int | None = None
+    is_jackpot: bool = False
+
+
+def _alias_draw(np, rng, sampler: AliasSampler, size: int):
+    """Vectorized ``AliasSampler.sample_index``: same tables, same distribution."""
+
+    prob = np.asarray(sampler.prob)
+    alias = np.asarray(sampler.alias)
+    idx = rng.integers(0, len(sampler), size=size)
+    return np.where(rng.random(size) < prob[idx], idx, alias[idx])
+
+
+def _summarize(
+    np,
+    game: str,
+    options: SimulationOptions,
+    outcomes: list[SimulationOutcome],
+    expected: list[float],
+    draws,
+    stock_depletion: list[StockDepletionPoint] | None = None,
+    exhausted_at_play: int | None = None,
+) -> SimulationResponse:
+    plays_simulated = int(draws.size)
+    amounts = np.array(
+        [o.reward_amount if o.reward_type == options.payout_reward_type else 0 for o in outcomes], dtype=np.int64
+    )
+    counts = np.bincount(draws, minlength=len(outcomes)) if plays_simulated else np.zeros(len(outcomes), dtype=np.int64)
+
+    mean = variance = 0.0
+    percentiles: dict[str, float] = {}
+    if plays_simulated:
+        payouts = amounts[draws]
+        mean = float(payouts.mean())
+        variance = float(payouts.var())
+        blocks = plays_simulated // options.block_size
+        if blocks:
+            block_sums = payouts[: blocks * options.block_size].reshape(blocks, options.block_size).sum(axis=1)
+            values = np.percentile(block_sums, PERCENTILES)
+            percentiles = {f"p{p}": float(v) for p, v in zip(PERCENTILES, values)}
+
+    reward_type_means: dict[str, float] = {}
+    for outcome, count in zip(outcomes, counts):
+        if outcome.reward_amount and plays_simulated:
+            reward_type_means[outcome.reward_type] = reward_type_means.get(outcome.reward_type, 0.0) + (
+                outcome.reward_amount * int(count) / plays_simulated
+            )
+
+    jackpot_hits = sum(int(c) for o, c in zip(outcomes, counts) if o.is_jackpot)
+    has_jackpot = any(o.is_jackpot for o in outcomes)
+    jackpot_rate = jackpot_hits / plays_simulated if has_jackpot and plays_simulated else None
+
+    return SimulationResponse(
+        game=game,
+        plays=options.plays,
+        plays_simulated=plays_simulated,
+        seed=options.seed,
+        payout_reward_type=options.payout_reward_type,
+        mean_payout=mean,
+        payout_variance=variance,
+        payout_std=variance ** 0.5,
+        rtp=(mean / options.cost_per_play) if options.cost_per_play else None,
+        block_size=options.block_size,
+        block_payout_percentiles=percentiles,
+        jackpot_rate=jackpot_rate,
+        plays_per_jackpot=(1 / jackpot_rate) if jackpot_rate else None,
+        reward_type_means=reward_type_means,
+        outcomes=[
+            SimulationOutcomeStats(
+                key=o.key,
+                label=o.label,
+                reward_type=o.reward_type,
+                reward_amount=o.reward_amount,
+                expected_rate=exp,
+                observed_rate=(int(c) / plays_simulated) if plays_simulated else 0.0,
+                is_jackpot=o.is_jackpot,
+            )
+            for o, exp, c in zip(outcomes, expected, counts)
+        ],
+        stock_depletion=stock_depletion or [],
+        exhausted_at_play=exhausted_at_play,
+    )
+
+
+def _expected_rates(weights: list[float]) -> list[float]:
+    total = sum(w for w in weights if w > 0)
+    return [(max(w, 0) / total) if total else 0.0 for w in weights]
+
+
+class GameSimulationService:
+    """Simulate many plays of a saved or proposed game config without touching live data."""
+
+    @staticmethod
+    def _require_source(config_id: int | None, proposal) -> None:
+        if config_id is None and proposal is None:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="SIMULATION_CONFIG_REQUIRED")
+
+    # Roulette ---------------------------------------------------------------
+
+    @staticmethod
+    def _roulette_outcomes(db: Session, request: RouletteSimulationRequest) -> list[SimulationOutcome]:
+        GameSimulationService._require_source(request.config_id, request.segments)
+        if request.segments is not None:
+            return [
+                SimulationOutcome(
+                    key=str(seg.index),
+                    label=seg.label,
+                    reward_type=seg.reward_type,
+                    reward_amount=seg.reward_value,
+                    weight=seg.weight,
+                    is_jackpot=seg.is_jackpot,
+                )
+                for seg in request.segments
+            ]
+        if db.get(RouletteConfig, request.config_id) is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="ROULETTE_CONFIG_NOT_FOUND")
+        rows = db.execute(
+            select(RouletteSegment).where(RouletteSegment.config_id == request.config_id).order_by(RouletteSegment.slot_index)
+        ).scalars().all()
+        return [
+            SimulationOutcome(
+                key=str(seg.slot_index),
+                label=seg.label,
+                reward_type=seg.reward_type,
+                reward_amount=seg.reward_amount,
+                weight=seg.weight,
+                is_jackpot=bool(seg.is_jackpot),
+            )
+            for seg in rows
+        ]
+
+    @staticmethod
+    def simulate_roulette(db: Session, request: RouletteSimulationRequest) -> SimulationResponse:
+        np = _numpy()
+        outcomes = GameSimulationService._roulette_outcomes(db, request)
+        if any(o.weight < 0 for o in outcomes):
+            raise InvalidConfigError("INVALID_ROULETTE_CONFIG")
+        try:
+            sampler = AliasSampler(list(range(len(outcomes))), [int(o.weight) for o in outcomes])
+        except ValueError as exc:
+            raise InvalidConfigError("INVALID_ROULETTE_CONFIG") from exc
+
+        rng = np.random.default_rng(request.seed)
+        draws = np.concatenate(
+            [
+                _alias_draw(np, rng, sampler, min(CHUNK_SIZE, request.plays - start))
+                for start in range(0, request.plays, CHUNK_SIZE)
+            ]
+        )
+        return _summarize(np, "ROULETTE", request, outcomes, _expected_rates([o.weight for o in outcomes]), draws)
+
+    # Lottery ----------------------------------------------------------------
+
+    @staticmethod
+    def _lottery_outcomes(db: Session, request: LotterySimulationRequest) -> list[SimulationOutcome]:
+        GameSimulationService._require_source(request.config_id, request.prizes)
+        if request.prizes is not None:
+            rows = [
+                (str(i), p.label, p.reward_type, p.reward_value, p.weight, p.stock)
+                for i, p in enumerate(request.prizes)
+                if p.is_active
+            ]
+        else:
+            if db.get(LotteryConfig, request.config_id) is None:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="LOTTERY_CONFIG_NOT_FOUND")
+            prizes = db.execute(
+                select(LotteryPrize)
+                .where(LotteryPrize.config_id == request.config_id, LotteryPrize.is_active.is_(True))
+                .order_by(LotteryPrize.id)
+            ).scalars().all()
+            rows = [(str(p.id), p.label, p.reward_type, p.reward_amount, p.weight, p.stock) for p in prizes]
+
+        # Lottery prizes carry no jackpot flag: the top-paying prize(s) count as the jackpot.
+        top = max((row[3] for row in rows), default=0)
+        return [
+            SimulationOutcome(
+                key=key,
+                label=label,
+                reward_type=reward_type,
+                reward_amount=amount,
+                weight=weight,
+                stock=stock,
+                is_jackpot=top > 0 and amount == top,
+            )
+            for key, label, reward_type, amount, weight, stock in rows
+        ]
+
+    @staticmethod
+    def simulate_lottery(db: Session, request: LotterySimulationRequest) -> SimulationResponse:
+        np = _numpy()
+        outcomes = GameSimulationService._lottery_outcomes(db, request)
+        if any(o.weight < 0 for o in outcomes):
+            raise InvalidConfigError("INVALID_LOTTERY_CONFIG")
+        snapshot = LotteryConfigSnapshot(
+            config_id=request.config_id or 0,
+            version=0,
+            prize_ids=tuple(range(len(outcomes))),
+            weights=tuple(int(o.weight) for o in outcomes),
+        )
+
+        remaining = {i: int(o.stock) for i, o in enumerate(outcomes) if o.stock is not None}
+        sold_out = frozenset(i for i, left in remaining.items() if left <= 0)
+        sold_out_at: dict[int, int] = {}
+        rng = np.random.default_rng(request.seed)
+        chunks = []
+        played = 0
+        exhausted_at_play = None
+
+        while played < request.plays:
+            try:
+                sampler = snapshot.sampler(exclude=sold_out)
+            except InvalidConfigError:
+                if not sold_out:
+                    raise
+                exhausted_at_play = played
+                break
+            ids = np.asarray(sampler.items)
+            draws = ids[_alias_draw(np, rng, sampler, min(CHUNK_SIZE, request.plays - played))]
+
+            # Cut the chunk at the first sell-out; later draws must use the reduced prize pool.
+            cut, sold_now = draws.size, None
+            for prize, left in remaining.items():
+                if prize in sold_out:
+                    continue
+                hits = np.flatnonzero(draws == prize)
+                if hits.size >= left and hits[left - 1] + 1 < cut:
+                    cut, sold_now = int(hits[left - 1]) + 1, prize
+            draws = draws[:cut]
+            for prize in remaining:
+                remaining[prize] -= int(np.count_nonzero(draws == prize))
+            chunks.append(draws)
+            played += cut
+            if sold_now is not None:
+                sold_out = sold_out | {sold_now}
+                sold_out_at[sold_now] = played
+
+        draws = np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.int64)
+        depletion = [
+            StockDepletionPoint(
+                key=outcomes[i].key,
+                label=outcomes[i].label,
+                stock=int(outcomes[i].stock),
+                sold_out_at_play=sold_out_at.get(i, 0 if outcomes[i].stock <= 0 else None),
+                sold_out_at_hour=(
+                    sold_out_at[i] / request.plays_per_hour if i in sold_out_at and request.plays_per_hour else None
+                ),
+            )
+            for i in sorted(remaining, key=lambda i: sold_out_at.get(i, float("inf")))
+        ]
+        return _summarize(
+            np,
+            "LOTTERY",
+            request,
+            outcomes,
+            _expected_rates([o.weight if (o.stock is None or o.stock > 0) else 0 for o in outcomes]),
+            draws,
+            stock_depletion=depletion,
+            exhausted_at_play=exhausted_at_play,
+        )
+
+    # Dice -------------------------------------------------------------------
+
+    @staticmethod
+    def _dice_outcomes(db: Session, request: DiceSimulationRequest) -> list[SimulationOutcome]:
+        GameSimulationService._require_source(request.config_id, request.rewards)
+        saved = None
+        if request.config_id is not None:
+            saved = db.get(DiceConfig, request.config_id)
+            if saved is None:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="DICE_CONFIG_NOT_FOUND")
+        proposal = request.rewards.model_dump(exclude_none=True) if request.rewards else {}
+
+        outcomes = []
+        for outcome in ("WIN", "DRAW", "LOSE"):
+            prefix = outcome.lower()
+            reward_type = proposal.get(f"{prefix}_reward_type", getattr(saved, f"{prefix}_reward_type", None))
+            reward_amount = proposal.get(f"{prefix}_reward_value", getattr(saved, f"{prefix}_reward_amount", None))
+            if reward_type is None or reward_amount is None:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="SIMULATION_CONFIG_REQUIRED")
+            outcomes.append(SimulationOutcome(key=outcome, label=outcome, reward_type=reward_type, reward_amount=int(reward_amount)))
+        return outcomes
+
+    @staticmethod
+    def simulate_dice(db: Session, request: DiceSimulationRequest) -> SimulationResponse:
+        np = _numpy()
+        outcomes = GameSimulationService._dice_outcomes(db, request)
+
+        # Exact odds of 2d6 (user) vs 2d6 (dealer), as in DiceService._roll.
+        sums = [a + b for a, b in product(range(1, 7), repeat=2)]
+        pairs = [(u, d) for u in sums for d in sums]
+        expected = [
+            sum(u > d for u, d in pairs) / len(pairs),
+            sum(u == d for u, d in pairs) / len(pairs),
+            sum(u < d for u, d in pairs) / len(pairs),
+        ]
+
+        rng = np.random.default_rng(request.seed)
+        chunks = []
+        for start in range(0, request.plays, CHUNK_SIZE):
+            dice = rng.integers(1, 7, size=(min(CHUNK_SIZE, request.plays - start), 4))
+            user_sum = dice[:, 0] + dice[:, 1]
+            dealer_sum = dice[:, 2] + dice[:, 3]
+            # 0 = WIN, 1 = DRAW, 2 = LOSE (same order as `outcomes`).
+            chunks.append(np.where(user_sum > dealer_sum, 0, np.where(user_sum == dealer_sum, 1, 2)))
+        return _summarize(np, "DICE", request, outcomes, expected, np.concatenate(chunks))
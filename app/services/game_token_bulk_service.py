@@ -0,0 +1,211 @@
+"""Set-based game token grants/revokes for campaign drops (thousands of users per call)."""
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from fastapi import HTTPException, status
+from sqlalchemy import case, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.core.exceptions import InvalidConfigError
+from app.db.upsert import upsert_increment_many
+from app.models.game_wallet import GameTokenType, UserGameWallet
+from app.models.game_wallet_ledger import UserGameWalletLedger
+from app.models.user import User
+from app.models.user_segment import UserSegment
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 1000
+
+ProgressCallback = Callable[[int, int], None]
+
+
+@dataclass
+class BulkTokenResult:
+    requested: int = 0
+    applied: int = 0
+    skipped_user_ids: list[int] = field(default_factory=list)
+    not_found: list[str] = field(default_factory=list)
+
+
+def _chunks(items: Sequence, size: int) -> Iterable[Sequence]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+class GameTokenBulkService:
+    """Grant or revoke one token amount for many users, one transaction per chunk.
+
+    Each chunk is a multi-row wallet upsert (or conditional UPDATE), one balance SELECT and an
+    executemany ledger INSERT, instead of get-or-create + two commits + refresh per user.
+    """
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        self.chunk_size = max(int(chunk_size), 1)
+
+    def resolve_user_ids(
+        self,
+        db: Session,
+        user_ids: Sequence[int] = (),
+        external_ids: Sequence[str] = (),
+        segment: str | None = None,
+    ) -> tuple[list[int], list[str]]:
+        """Return (existing user ids, unknown identifiers) for explicit users and/or a user_segment name."""
+
+        if not user_ids and not external_ids and not segment:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="USER_REQUIRED")
+
+        resolved: set[int] = set()
+        not_found: list[str] = []
+
+        wanted_ids = sorted({int(uid) for uid in user_ids})
+        for chunk in _chunks(wanted_ids, self.chunk_size):
+            found = set(db.execute(select(User.id).where(User.id.in_(chunk))).scalars().all())
+            resolved |= found
+            not_found.extend(str(uid) for uid in chunk if uid not in found)
+
+        wanted_external = sorted(set(external_ids))
+        for chunk in _chunks(wanted_external, self.chunk_size):
+            rows = db.execute(select(User.external_id, User.id).where(User.external_id.in_(chunk))).all()
+            by_external = {row.external_id: row.id for row in rows}
+            resolved |= set(by_external.values())
+            not_found.extend(ext for ext in chunk if ext not in by_external)
+
+        if segment:
+            resolved |= set(db.execute(select(UserSegment.user_id).where(UserSegment.segment == segment)).scalars().all())
+
+        return sorted(resolved), not_found
+
+    def grant(
+        self,
+        db: Session,
+        user_ids: Sequence[int],
+        token_type: GameTokenType,
+        amount: int,
+        reason: str | None = None,
+        label: str | None = None,
+        meta: dict | None = None,
+        progress: ProgressCallback | None = None,
+    ) -> BulkTokenResult:
+        """Add ``amount`` to every user's wallet (creating missing wallets) and write one ledger row each."""
+
+        if amount <= 0:
+            raise InvalidConfigError("INVALID_TOKEN_AMOUNT")
+        result = BulkTokenResult(requested=len(user_ids))
+        for chunk in _chunks(list(user_ids), self.chunk_size):
+            now = datetime.utcnow()
+            upsert_increment_many(
+                db,
+                UserGameWallet.__table__,
+                [{"user_id": uid, "token_type": token_type, "balance": amount, "updated_at": now} for uid in chunk],
+                keys=["user_id", "token_type"],
+                increments=["balance"],
+                values=["updated_at"],
+            )
+            balances = self._balances(db, chunk, token_type)
+            self._write_ledger(db, balances, token_type, amount, reason or "BULK_GRANT", label, meta, now)
+            db.commit()
+            result.applied += len(chunk)
+            self._report(progress, result)
+        return result
+
+    def revoke(
+        self,
+        db: Session,
+        user_ids: Sequence[int],
+        token_type: GameTokenType,
+        amount: int,
+        reason: str | None = None,
+        label: str | None = None,
+        meta: dict | None = None,
+        progress: ProgressCallback | None = None,
+    ) -> BulkTokenResult:
+        """Take ``amount`` from every wallet that holds enough; users with less are skipped (never negative)."""
+
+        if amount <= 0:
+            raise InvalidConfigError("INVALID_TOKEN_AMOUNT")
+        result = BulkTokenResult(requested=len(user_ids))
+        for chunk in _chunks(list(user_ids), self.chunk_size):
+            now = datetime.utcnow()
+            stmt = select(UserGameWallet.user_id, UserGameWallet.balance).where(
+                UserGameWallet.token_type == token_type,
+                UserGameWallet.user_id.in_(chunk),
+                UserGameWallet.balance >= amount,
+            )
+            if db.get_bind().dialect.name != "sqlite":
+                stmt = stmt.with_for_update()
+            eligible = {row.user_id: int(row.balance) for row in db.execute(stmt).all()}
+            if eligible:
+                remaining = UserGameWallet.balance - amount
+                # trial_balance is clamped to the remaining balance and assigned first: MySQL evaluates
+                # SET left to right with already-updated values.
+                db.execute(
+                    update(UserGameWallet)
+                    .where(UserGameWallet.token_type == token_type, UserGameWallet.user_id.in_(list(eligible)))
+                    .ordered_values(
+                        (
+                            UserGameWallet.trial_balance,
+                            case((UserGameWallet.trial_balance > remaining, remaining), else_=UserGameWallet.trial_balance),
+                        ),
+                        (UserGameWallet.balance, remaining),
+                        (UserGameWallet.updated_at, now),
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+                balances = {uid: balance - amount for uid, balance in eligible.items()}
+                self._write_ledger(db, balances, token_type, -amount, reason or "BULK_REVOKE", label, meta, now)
+            db.commit()
+            result.applied += len(eligible)
+            result.skipped_user_ids.extend(uid for uid in chunk if uid not in eligible)
+            self._report(progress, result)
+        return result
+
+    @staticmethod
+    def _balances(db: Session, user_ids: Sequence[int], token_type: GameTokenType) -> dict[int, int]:
+        rows = db.execute(
+            select(UserGameWallet.user_id, UserGameWallet.balance).where(
+                UserGameWallet.token_type == token_type, UserGameWallet.user_id.in_(user_ids)
+            )
+        ).all()
+        return {row.user_id: int(row.balance) for row in rows}
+
+    @staticmethod
+    def _write_ledger(
+        db: Session,
+        balances: dict[int, int],
+        token_type: GameTokenType,
+        delta: int,
+        reason: str,
+        label: str | None,
+        meta: dict | None,
+        now: datetime,
+    ) -> None:
+        if not balances:
+            return
+        db.execute(
+            insert(UserGameWalletLedger),
+            [
+                {
+                    "user_id": uid,
+                    "token_type": token_type,
+                    "delta": delta,
+                    "balance_after": balance,
+                    "reason": reason,
+                    "label": label,
+                    "meta_json": dict(meta or {}),
+                    "created_at": now,
+                }
+                for uid, balance in balances.items()
+            ],
+        )
+
+    @staticmethod
+    def _report(progress: ProgressCallback | None, result: BulkTokenResult) -> None:
+        done = result.applied + len(result.skipped_user_ids)
+        logger.info("bulk token progress %s/%s (applied=%s)", done, result.requested, result.applied)
+        if progress is not None:
+            progress(done, result.requested)
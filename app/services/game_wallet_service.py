@@ -1,15 +1,32 @@
 """Game wallet service for per-feature tokens."""
+from collections.abc import Iterable
+from datetime import datetime
+
+from sqlalchemy import case, func, insert, select, update
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.core.config import get_settings
 from app.core.exceptions import InvalidConfigError, NotEnoughTokensError
+from app.db.upsert import upsert_increment, upsert_increment_many
+from app.db.write_buffer import buffer_insert
 from app.models.game_wallet import GameTokenType, UserGameWallet
 from app.models.game_wallet_ledger import UserGameWalletLedger
-from app.models.trial_token_bucket import TrialTokenBucket
 
 
 class GameWalletService:
-    def _get_or_create_wallet(self, db: Session, user_id: int, token_type: GameTokenType) -> UserGameWallet:
+    @staticmethod
+    def _persist(db: Session, commit: bool, *instances) -> None:
+        """Commit+refresh (legacy default) or only flush when running inside a caller's transaction."""
+
+        if commit:
+            db.commit()
+            for instance in instances:
+                db.refresh(instance)
+        else:
+            db.flush()
+
+    def _get_or_create_wallet(self, db: Session, user_id: int, token_type: GameTokenType, commit: bool = True) -> UserGameWallet:
         wallet = (
             db.query(UserGameWallet)
             .filter(UserGameWallet.user_id == user_id, UserGameWallet.token_type == token_type)
@@ -18,116 +35,368 @@ class GameWalletService:
         if wallet is None:
             wallet = UserGameWallet(user_id=user_id, token_type=token_type, balance=0)
             db.add(wallet)
-            db.commit()
-            db.refresh(wallet)
+            self._persist(db, commit, wallet)
         return wallet
 
-    def _log_ledger(self, db: Session, user_id: int, token_type: GameTokenType, delta: int, balance_after: int, reason: str | None = None, label: str | None = None, meta: dict | None = None) -> None:
-        entry = UserGameWalletLedger(
-            user_id=user_id,
-            token_type=token_type,
-            delta=delta,
-            balance_after=balance_after,
-            reason=reason,
-            label=label,
-            meta_json=meta or {},
-        )
-        db.add(entry)
-        db.commit()
+    def _log_ledger(self, db: Session, user_id: int, token_type: GameTokenType, delta: int, balance_after: int, reason: str | None = None, label: str | None = None, meta: dict | None = None, commit: bool = True, buffered: bool = False) -> None:
+        if buffered:
+            # Write-combining: the row is INSERTed with the rest of the transaction's rows at commit.
+            buffer_insert(
+                db,
+                UserGameWalletLedger.__table__,
+                {
+                    "user_id": user_id,
+                    "token_type": token_type,
+                    "delta": delta,
+                    "balance_after": balance_after,
+                    "reason": reason,
+                    "label": label,
+                    "meta_json": meta or {},
+                    "created_at": datetime.utcnow(),
+                },
+                max_rows=get_settings().wallet_ledger_buffer_max_rows,
+            )
+        else:
+            db.add(
+                UserGameWalletLedger(
+                    user_id=user_id,
+                    token_type=token_type,
+                    delta=delta,
+                    balance_after=balance_after,
+                    reason=reason,
+                    label=label,
+                    meta_json=meta or {},
+                )
+            )
+        if commit:
+            db.commit()
+        elif not buffered:
+            db.flush()
 
-    def get_balance(self, db: Session, user_id: int, token_type: GameTokenType) -> int:
-        wallet = self._get_or_create_wallet(db, user_id, token_type)
-        return wallet.balance
+    def get_balances(self, db: Session, user_id: int, token_types: Iterable[GameTokenType] | None = None) -> dict[GameTokenType, int]:
+        """Read-only snapshot of the user's wallets in one SELECT; missing rows count as 0.
 
-    def _get_or_create_trial_bucket(self, db: Session, user_id: int, token_type: GameTokenType) -> TrialTokenBucket:
-        bucket = (
-            db.query(TrialTokenBucket)
-            .filter(TrialTokenBucket.user_id == user_id, TrialTokenBucket.token_type == token_type)
-            .one_or_none()
-        )
-        if bucket is None:
-            bucket = TrialTokenBucket(user_id=user_id, token_type=token_type, balance=0)
-            db.add(bucket)
-            db.commit()
-            db.refresh(bucket)
-        return bucket
+        Never creates wallet rows: they are provisioned on the first grant/consume.
+        """
+
+        wanted = list(token_types) if token_types is not None else list(GameTokenType)
+        rows = db.execute(
+            select(UserGameWallet.token_type, UserGameWallet.balance).where(
+                UserGameWallet.user_id == user_id, UserGameWallet.token_type.in_(wanted)
+            )
+        ).all()
+        balances = {token_type: 0 for token_type in wanted}
+        balances.update({row.token_type: int(row.balance or 0) for row in rows})
+        return balances
+
+    def get_balance(self, db: Session, user_id: int, token_type: GameTokenType) -> int:
+        return self.get_balances(db, user_id, (token_type,))[token_type]
 
     def mark_trial_grant(self, db: Session, user_id: int, token_type: GameTokenType, amount: int) -> int:
-        """Increment trial bucket balance.
+        """Count ``amount`` tokens of the wallet as trial-origin (capped at the wallet balance).
 
         This should be called only when a TRIAL_GRANT was actually written to the wallet.
-        Returns the updated trial-bucket balance.
+        Returns the updated trial balance (0 if the user has no wallet row).
         """
 
         if amount <= 0:
             raise InvalidConfigError("INVALID_TOKEN_AMOUNT")
-        bucket = self._get_or_create_trial_bucket(db, user_id, token_type)
-        bucket.balance += amount
-        db.add(bucket)
+        # One atomic UPDATE: a consumption committed in between cannot be overwritten.
+        marked = UserGameWallet.trial_balance + amount
+        stmt = (
+            update(UserGameWallet)
+            .where(UserGameWallet.user_id == user_id, UserGameWallet.token_type == token_type)
+            .values(trial_balance=case((marked > UserGameWallet.balance, UserGameWallet.balance), else_=marked))
+            .execution_options(synchronize_session=False)
+        )
+        row = self._update_wallet_row(db, stmt, user_id, token_type)
         db.commit()
-        db.refresh(bucket)
-        return int(bucket.balance)
+        return int(row.trial_balance) if row is not None else 0
 
-    def require_and_consume_token(self, db: Session, user_id: int, token_type: GameTokenType, amount: int = 1, reason: str | None = None, label: str | None = None, meta: dict | None = None) -> tuple[int, bool]:
-        if amount <= 0:
-            raise InvalidConfigError("INVALID_TOKEN_AMOUNT")
+    @staticmethod
+    def _sync_loaded(db: Session, model, user_id: int, token_type: GameTokenType, **values: int) -> None:
+        """Mirror a Core UPDATE onto an instance already loaded in this session (no SELECT)."""
 
-        settings = get_settings()
-        wallet = self._get_or_create_wallet(db, user_id, token_type)
+        for obj in list(db.identity_map.values()):
+            if isinstance(obj, model) and obj.user_id == user_id and obj.token_type == token_type:
+                for key, value in values.items():
+                    set_committed_value(obj, key, value)
 
-        # In test mode, auto-top-up to avoid blocking tests/demos.
-        if settings.test_mode and wallet.balance < amount:
-            wallet.balance = max(wallet.balance, amount)
-            db.add(wallet)
-            db.commit()
-            db.refresh(wallet)
+    def _update_wallet_row(self, db: Session, stmt, user_id: int, token_type: GameTokenType):
+        """Run a single-wallet Core UPDATE; return the new (balance, trial_balance), or None if no row matched."""
 
-        if wallet.balance < amount:
-            raise NotEnoughTokensError("NOT_ENOUGH_TOKENS")
+        if db.get_bind().dialect.update_returning:
+            row = db.execute(stmt.returning(UserGameWallet.balance, UserGameWallet.trial_balance)).one_or_none()
+        else:
+            # MySQL has no UPDATE ... RETURNING; re-read the row this UPDATE has just locked.
+            if db.execute(stmt).rowcount != 1:
+                return None
+            row = db.execute(
+                select(UserGameWallet.balance, UserGameWallet.trial_balance).where(
+                    UserGameWallet.user_id == user_id, UserGameWallet.token_type == token_type
+                )
+            ).one()
+        if row is not None:
+            self._sync_loaded(db, UserGameWallet, user_id, token_type, balance=int(row.balance), trial_balance=int(row.trial_balance))
+        return row
 
-        # Determine whether this consumption used any trial-origin tokens.
-        # We treat it as trial consumption if we can decrement from the trial bucket.
-        consumed_trial_count = 0
-        try:
-            bucket = self._get_or_create_trial_bucket(db, user_id, token_type)
-            if bucket.balance > 0:
-                consumed_trial_count = min(int(bucket.balance), int(amount))
-                bucket.balance = max(int(bucket.balance) - consumed_trial_count, 0)
-                db.add(bucket)
-        except Exception:
-            # Fail-open: consuming tokens must not be blocked by trial bookkeeping.
-            consumed_trial_count = 0
-
-        wallet.balance -= amount
-        db.add(wallet)
-        db.commit()
-        db.refresh(wallet)
+    # LAST_INSERT_ID(old_balance * 2**32 + old_trial_balance) hands the pre-update values back on MySQL.
+    _PACK = 4294967296
+
+    def _decrement_wallet(self, db: Session, user_id: int, token_type: GameTokenType, amount: int) -> tuple[int, int]:
+        """Take ``amount`` tokens, trial-origin ones first. Returns (new balance, trial tokens spent).
+
+        ``UPDATE ... SET trial_balance = max(trial - n, 0), balance = balance - n WHERE ... AND balance >= n``;
+        trial tokens spent is ``min(trial_before, n)``. On MySQL that UPDATE is the only statement: it also
+        evaluates ``LAST_INSERT_ID(expr)`` over the old values, which come back in the OK packet. Other
+        dialects cannot return pre-update values (SQLite's RETURNING sees the new row), so they read the
+        row first. The row stays locked until the caller's transaction ends, so concurrent plays cannot overspend.
+        """
+
+        wallet = UserGameWallet.__table__
+        match = (wallet.c.user_id == user_id, wallet.c.token_type == token_type, wallet.c.balance >= amount)
+        dialect = db.get_bind().dialect.name
+        if dialect == "mysql":
+            packed = func.last_insert_id(wallet.c.balance * self._PACK + wallet.c.trial_balance)
+            # trial_balance is assigned first: MySQL evaluates SET left to right with already-updated values.
+            stmt = update(wallet).where(*match).ordered_values(
+                (wallet.c.trial_balance, case((packed % self._PACK > amount, wallet.c.trial_balance - amount), else_=0)),
+                (wallet.c.balance, wallet.c.balance - amount),
+            )
+            result = db.execute(stmt)
+            if result.rowcount != 1:
+                raise NotEnoughTokensError("NOT_ENOUGH_TOKENS")
+            balance_before, trial_before = divmod(int(result.lastrowid), self._PACK)
+        else:
+            read = select(wallet.c.balance, wallet.c.trial_balance).where(*match)
+            if dialect != "sqlite":
+                read = read.with_for_update()
+            current = db.execute(read).one_or_none()
+            if current is None:
+                raise NotEnoughTokensError("NOT_ENOUGH_TOKENS")
+            db.execute(
+                update(wallet)
+                .where(*match)
+                .values(
+                    balance=wallet.c.balance - amount,
+                    trial_balance=case((wallet.c.trial_balance > amount, wallet.c.trial_balance - amount), else_=0),
+                )
+            )
+            balance_before, trial_before = int(current.balance), int(current.trial_balance)
+
+        trial_before = max(trial_before, 0)
+        new_balance = balance_before - amount
+        self._sync_loaded(db, UserGameWallet, user_id, token_type, balance=new_balance, trial_balance=max(trial_before - amount, 0))
+        return new_balance, min(trial_before, amount)
+
+    def _consume(self, db: Session, user_id: int, token_type: GameTokenType, amount: int) -> tuple[int, int]:
+        """Atomically take ``amount`` tokens (flush-free Core statements). Returns (new balance, trial tokens spent)."""
+
+        if get_settings().test_mode:
+            # In test mode, auto-top-up to avoid blocking tests/demos.
+            wallet = self._get_or_create_wallet(db, user_id, token_type, commit=False)
+            if wallet.balance < amount:
+                wallet.balance = amount
+                db.add(wallet)
+                db.flush()
+        return self._decrement_wallet(db, user_id, token_type, amount)
+
+    def require_and_consume_token(self, db: Session, user_id: int, token_type: GameTokenType, amount: int = 1, reason: str | None = None, label: str | None = None, meta: dict | None = None, commit: bool = True) -> tuple[int, bool]:
+        if amount <= 0:
+            raise InvalidConfigError("INVALID_TOKEN_AMOUNT")
+
+        new_balance, consumed_trial_count = self._consume(db, user_id, token_type, amount)
         ledger_meta = dict(meta or {})
         ledger_meta["consumed_trial"] = bool(consumed_trial_count > 0)
-        self._log_ledger(db, user_id=user_id, token_type=token_type, delta=-amount, balance_after=wallet.balance, reason=reason or "CONSUME", label=label, meta=ledger_meta)
-        return wallet.balance, bool(consumed_trial_count > 0)
+        # Wallet, trial bucket and ledger land in one commit (or in the caller's transaction).
+        self._log_ledger(db, user_id=user_id, token_type=token_type, delta=-amount, balance_after=new_balance, reason=reason or "CONSUME", label=label, meta=ledger_meta, commit=commit, buffered=get_settings().wallet_ledger_write_combining)
+        return new_balance, bool(consumed_trial_count > 0)
+
+    def consume_tokens_for_plays(self, db: Session, user_id: int, token_type: GameTokenType, labels: list[str | None], reason: str | None = None, metas: list[dict] | None = None, commit: bool = True) -> tuple[int, list[bool]]:
+        """Consume one token per play with a single wallet update and one ledger row per play.
+
+        Returns the final balance and, per play, whether it consumed a trial-origin token.
+        """
+
+        count = len(labels)
+        if count <= 0:
+            raise InvalidConfigError("INVALID_TOKEN_AMOUNT")
+
+        new_balance, consumed_trial_count = self._consume(db, user_id, token_type, count)
+        balance_before = new_balance + count
+
+        # Trial-origin tokens are spent first, so the first `consumed_trial_count` plays are trial plays.
+        trial_flags = [i < consumed_trial_count for i in range(count)]
+        buffered = get_settings().wallet_ledger_write_combining
+        entries = []
+        for i, label in enumerate(labels):
+            ledger_meta = dict((metas[i] if metas else None) or {})
+            ledger_meta["consumed_trial"] = trial_flags[i]
+            if buffered:
+                self._log_ledger(db, user_id=user_id, token_type=token_type, delta=-1, balance_after=balance_before - (i + 1), reason=reason or "CONSUME", label=label, meta=ledger_meta, commit=False, buffered=True)
+                continue
+            entries.append(
+                UserGameWalletLedger(
+                    user_id=user_id,
+                    token_type=token_type,
+                    delta=-1,
+                    balance_after=balance_before - (i + 1),
+                    reason=reason or "CONSUME",
+                    label=label,
+                    meta_json=ledger_meta,
+                )
+            )
+        db.add_all(entries)
+        if commit:
+            db.commit()
+        else:
+            db.flush()
+        return new_balance, trial_flags
 
-    def grant_tokens(self, db: Session, user_id: int, token_type: GameTokenType, amount: int, reason: str | None = None, label: str | None = None, meta: dict | None = None) -> int:
+    def grant_tokens(self, db: Session, user_id: int, token_type: GameTokenType, amount: int, reason: str | None = None, label: str | None = None, meta: dict | None = None, commit: bool = True) -> int:
         if amount <= 0:
             raise InvalidConfigError("INVALID_TOKEN_AMOUNT")
-        wallet = self._get_or_create_wallet(db, user_id, token_type)
+        # First grant provisions the wallet row; flushed here, committed once below.
+        wallet = self._get_or_create_wallet(db, user_id, token_type, commit=False)
         wallet.balance += amount
         db.add(wallet)
-        db.commit()
-        db.refresh(wallet)
-        self._log_ledger(db, user_id=user_id, token_type=token_type, delta=amount, balance_after=wallet.balance, reason=reason or "GRANT", label=label, meta=meta)
+        self._persist(db, commit, wallet)
+        self._log_ledger(db, user_id=user_id, token_type=token_type, delta=amount, balance_after=wallet.balance, reason=reason or "GRANT", label=label, meta=meta, commit=commit)
         return wallet.balance
 
+    def grant_tokens_batch(self, db: Session, user_id: int, token_type: GameTokenType, grants: list[tuple[int, str | None, str | None, dict | None]], commit: bool = True) -> int:
+        """Apply several grants of one token type: one wallet upsert, one balance read, one ledger INSERT.
+
+        ``grants`` are (amount, reason, label, meta) tuples; each gets its own ledger row with a running
+        ``balance_after``. Returns the final balance.
+        """
+
+        if not grants:
+            return self.get_balance(db, user_id, token_type)
+        if any(amount <= 0 for amount, *_ in grants):
+            raise InvalidConfigError("INVALID_TOKEN_AMOUNT")
+        total = sum(amount for amount, *_ in grants)
+        now = datetime.utcnow()
+        upsert_increment(
+            db,
+            UserGameWallet.__table__,
+            keys={"user_id": user_id, "token_type": token_type},
+            increments={"balance": total},
+            values={"updated_at": now},
+        )
+        new_balance = int(
+            db.execute(
+                select(UserGameWallet.balance).where(UserGameWallet.user_id == user_id, UserGameWallet.token_type == token_type)
+            ).scalar_one()
+        )
+        self._sync_loaded(db, UserGameWallet, user_id, token_type, balance=new_balance)
+
+        balance = new_balance - total
+        rows = []
+        for amount, reason, label, meta in grants:
+            balance += amount
+            rows.append(
+                {
+                    "user_id": user_id,
+                    "token_type": token_type,
+                    "delta": amount,
+                    "balance_after": balance,
+                    "reason": reason or "GRANT",
+                    "label": label,
+                    "meta_json": dict(meta or {}),
+                    "created_at": now,
+                }
+            )
+        db.execute(insert(UserGameWalletLedger), rows)
+        if commit:
+            db.commit()
+        else:
+            db.flush()
+        return new_balance
+
+    def grant_tokens_bulk(
+        self,
+        db: Session,
+        grants: dict[tuple[int, GameTokenType], list[tuple[int, str | None, str | None, dict | None]]],
+    ) -> dict[tuple[int, GameTokenType], int]:
+        """``grant_tokens_batch`` across users: one multi-row wallet upsert, one balance read, one ledger INSERT.
+
+        ``grants`` maps (user_id, token_type) to (amount, reason, label, meta) tuples. Flushes only; returns
+        the final balance per wallet.
+        """
+
+        grants = {key: group for key, group in grants.items() if group}
+        if not grants:
+            return {}
+        if any(amount <= 0 for group in grants.values() for amount, *_ in group):
+            raise InvalidConfigError("INVALID_TOKEN_AMOUNT")
+        now = datetime.utcnow()
+        upsert_increment_many(
+            db,
+            UserGameWallet.__table__,
+            [
+                {"user_id": user_id, "token_type": token_type, "balance": sum(amount for amount, *_ in group), "updated_at": now}
+                for (user_id, token_type), group in grants.items()
+            ],
+            keys=["user_id", "token_type"],
+            increments=["balance"],
+            values=["updated_at"],
+        )
+        rows = db.execute(
+            select(UserGameWallet.user_id, UserGameWallet.token_type, UserGameWallet.balance).where(
+                UserGameWallet.user_id.in_({user_id for user_id, _ in grants}),
+                UserGameWallet.token_type.in_({token_type for _, token_type in grants}),
+            )
+        ).all()
+        balances = {(row.user_id, row.token_type): int(row.balance) for row in rows if (row.user_id, row.token_type) in grants}
+        for obj in list(db.identity_map.values()):
+            if isinstance(obj, UserGameWallet) and (obj.user_id, obj.token_type) in balances:
+                set_committed_value(obj, "balance", balances[(obj.user_id, obj.token_type)])
+
+        ledger_rows = []
+        for (user_id, token_type), group in grants.items():
+            balance = balances[(user_id, token_type)] - sum(amount for amount, *_ in group)
+            for amount, reason, label, meta in group:
+                balance += amount
+                ledger_rows.append(
+                    {
+                        "user_id": user_id,
+                        "token_type": token_type,
+                        "delta": amount,
+                        "balance_after": balance,
+                        "reason": reason or "GRANT",
+                        "label": label,
+                        "meta_json": dict(meta or {}),
+                        "created_at": now,
+                    }
+                )
+        db.execute(insert(UserGameWalletLedger), ledger_rows)
+        db.flush()
+        return balances
+
     def revoke_tokens(self, db: Session, user_id: int, token_type: GameTokenType, amount: int, reason: str | None = None, label: str | None = None, meta: dict | None = None) -> int:
         """Admin-only token revocation; prevents negative balance."""
         if amount <= 0:
             raise InvalidConfigError("INVALID_TOKEN_AMOUNT")
-        wallet = self._get_or_create_wallet(db, user_id, token_type)
-        if wallet.balance < amount:
+        remaining = UserGameWallet.balance - amount
+        # trial_balance is assigned first: MySQL evaluates SET left to right with already-updated values.
+        stmt = (
+            update(UserGameWallet)
+            .where(
+                UserGameWallet.user_id == user_id,
+                UserGameWallet.token_type == token_type,
+                UserGameWallet.balance >= amount,
+            )
+            .ordered_values(
+                (UserGameWallet.trial_balance, case((UserGameWallet.trial_balance > remaining, remaining), else_=UserGameWallet.trial_balance)),
+                (UserGameWallet.balance, remaining),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        row = self._update_wallet_row(db, stmt, user_id, token_type)
+        if row is None:
             raise NotEnoughTokensError("NOT_ENOUGH_TOKENS")
-        wallet.balance -= amount
-        db.add(wallet)
+        # Balance change and ledger row commit together.
+        self._log_ledger(db, user_id=user_id, token_type=token_type, delta=-amount, balance_after=int(row.balance), reason=reason or "REVOKE", label=label, meta=meta, commit=False)
         db.commit()
-        db.refresh(wallet)
-        self._log_ledger(db, user_id=user_id, token_type=token_type, delta=-amount, balance_after=wallet.balance, reason=reason or "REVOKE", label=label, meta=meta)
-        return wallet.balance
+        return int(row.balance)
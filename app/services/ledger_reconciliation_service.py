@@ -0,0 +1,173 @@
+"""Ledger/balance reconciliation over user-id ranges.
+
+Each check is one aggregate query per range (GROUP BY on the ledger, joined to the balance table),
+so a range costs a few index range scans no matter how many ledger rows it holds. Ranges are
+independent, which lets ``scripts/reconcile_ledgers.py`` fan them out over a process pool.
+
+Checks:
+- cash:   user.cash_balance             == SUM(user_cash_ledger.delta)
+- wallet: user_game_wallet.balance      == SUM(user_game_wallet_ledger.delta) per token type
+- vault:  user.vault_locked_balance     == SUM(vault_earn_event.amount) - SUM(VAULT_UNLOCK cash deltas)
+
+The vault check is report-only: seed/fill, new-member dice and expiry change the locked balance
+without an earn event, so a vault drift is expected for those users and is never "repaired".
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import func, insert, literal, select
+from sqlalchemy.engine import Connection
+
+from app.models.game_wallet import GameTokenType, UserGameWallet
+from app.models.game_wallet_ledger import UserGameWalletLedger
+from app.models.user import User
+from app.models.user_cash_ledger import UserCashLedger
+from app.models.vault_earn_event import VaultEarnEvent
+
+CHECKS = ("cash", "wallet", "vault")
+REPAIRABLE_CHECKS = ("cash", "wallet")
+REPAIR_REASON = "RECONCILE_ADJUST"
+VAULT_UNLOCK_REASON = "VAULT_UNLOCK"
+
+
+@dataclass(frozen=True)
+class Drift:
+    check: str
+    user_id: int
+    token_type: str | None
+    balance: int
+    ledger_total: int
+
+    @property
+    def diff(self) -> int:
+        return self.balance - self.ledger_total
+
+
+def user_id_ranges(conn: Connection, chunk_size: int) -> list[tuple[int, int]]:
+    """Split [min(user.id), max(user.id)] into inclusive ranges of ``chunk_size`` ids."""
+
+    user = User.__table__
+    lo, hi = conn.execute(select(func.min(user.c.id), func.max(user.c.id))).one()
+    if lo is None:
+        return []
+    size = max(int(chunk_size), 1)
+    return [(start, min(start + size - 1, hi)) for start in range(int(lo), int(hi) + 1, size)]
+
+
+def _cash_drifts(conn: Connection, lo: int, hi: int) -> list[Drift]:
+    user, ledger = User.__table__, UserCashLedger.__table__
+    totals = (
+        select(ledger.c.user_id, func.sum(ledger.c.delta).label("total"))
+        .where(ledger.c.user_id.between(lo, hi))
+        .group_by(ledger.c.user_id)
+        .subquery()
+    )
+    ledger_total = func.coalesce(totals.c.total, 0)
+    rows = conn.execute(
+        select(user.c.id, user.c.cash_balance, ledger_total)
+        .select_from(user.outerjoin(totals, totals.c.user_id == user.c.id))
+        .where(user.c.id.between(lo, hi), user.c.cash_balance != ledger_total)
+        .order_by(user.c.id)
+    ).all()
+    return [Drift("cash", int(uid), None, int(balance or 0), int(total or 0)) for uid, balance, total in rows]
+
+
+def _wallet_drifts(conn: Connection, lo: int, hi: int) -> list[Drift]:
+    wallet, ledger = UserGameWallet.__table__, UserGameWalletLedger.__table__
+    totals = (
+        select(ledger.c.user_id, ledger.c.token_type, func.sum(ledger.c.delta).label("total"))
+        .where(ledger.c.user_id.between(lo, hi))
+        .group_by(ledger.c.user_id, ledger.c.token_type)
+        .subquery()
+    )
+    on = (totals.c.user_id == wallet.c.user_id) & (totals.c.token_type == wallet.c.token_type)
+    ledger_total = func.coalesce(totals.c.total, 0)
+    rows = conn.execute(
+        select(wallet.c.user_id, wallet.c.token_type, wallet.c.balance, ledger_total)
+        .select_from(wallet.outerjoin(totals, on))
+        .where(wallet.c.user_id.between(lo, hi), wallet.c.balance != ledger_total)
+    ).all()
+    # Ledger rows whose wallet row is gone (or was never created) count against a zero balance.
+    rows += conn.execute(
+        select(totals.c.user_id, totals.c.token_type, literal(0), totals.c.total)
+        .select_from(totals.outerjoin(wallet, on))
+        .where(wallet.c.id.is_(None), totals.c.total != 0)
+    ).all()
+    drifts = [
+        Drift("wallet", int(uid), GameTokenType(token_type).value, int(balance or 0), int(total or 0))
+        for uid, token_type, balance, total in rows
+    ]
+    return sorted(drifts, key=lambda d: (d.user_id, d.token_type))
+
+
+def _vault_drifts(conn: Connection, lo: int, hi: int) -> list[Drift]:
+    user, events, cash = User.__table__, VaultEarnEvent.__table__, UserCashLedger.__table__
+    earned = (
+        select(events.c.user_id, func.sum(events.c.amount).label("total"))
+        .where(events.c.user_id.between(lo, hi))
+        .group_by(events.c.user_id)
+        .subquery()
+    )
+    unlocked = (
+        select(cash.c.user_id, func.sum(cash.c.delta).label("total"))
+        .where(cash.c.user_id.between(lo, hi), cash.c.reason == VAULT_UNLOCK_REASON)
+        .group_by(cash.c.user_id)
+        .subquery()
+    )
+    expected = func.coalesce(earned.c.total, 0) - func.coalesce(unlocked.c.total, 0)
+    rows = conn.execute(
+        select(user.c.id, user.c.vault_locked_balance, expected)
+        .select_from(
+            user.outerjoin(earned, earned.c.user_id == user.c.id).outerjoin(unlocked, unlocked.c.user_id == user.c.id)
+        )
+        .where(user.c.id.between(lo, hi), user.c.vault_locked_balance != expected)
+        .order_by(user.c.id)
+    ).all()
+    return [Drift("vault", int(uid), None, int(balance or 0), int(total or 0)) for uid, balance, total in rows]
+
+
+_CHECK_QUERIES = {"cash": _cash_drifts, "wallet": _wallet_drifts, "vault": _vault_drifts}
+
+
+def reconcile_range(conn: Connection, lo: int, hi: int, checks: tuple[str, ...] = CHECKS) -> list[Drift]:
+    """Return every drifted balance for users with ``lo <= id <= hi``."""
+
+    drifts: list[Drift] = []
+    for check in checks:
+        drifts.extend(_CHECK_QUERIES[check](conn, lo, hi))
+    return drifts
+
+
+def repair_drifts(conn: Connection, drifts: list[Drift], now: datetime | None = None) -> int:
+    """Write one RECONCILE_ADJUST ledger row per cash/wallet drift so the ledger sums to the balance.
+
+    Balances are left untouched: the balance is what users have been shown and spent against, the
+    ledger is the audit trail. Vault drifts are skipped (see module docstring). The caller owns the
+    transaction.
+    """
+
+    now_dt = now or datetime.utcnow()
+    cash_rows, wallet_rows = [], []
+    for drift in drifts:
+        if drift.check not in REPAIRABLE_CHECKS or drift.diff == 0:
+            continue
+        row = {
+            "user_id": drift.user_id,
+            "delta": drift.diff,
+            "balance_after": drift.balance,
+            "reason": REPAIR_REASON,
+            "label": REPAIR_REASON,
+            "meta_json": {"ledger_total": drift.ledger_total},
+            "created_at": now_dt,
+        }
+        if drift.check == "cash":
+            cash_rows.append(row)
+        else:
+            wallet_rows.append({**row, "token_type": GameTokenType(drift.token_type)})
+    if cash_rows:
+        conn.execute(insert(UserCashLedger.__table__), cash_rows)
+    if wallet_rows:
+        conn.execute(insert(UserGameWalletLedger.__table__), wallet_rows)
+    return len(cash_rows) + len(wallet_rows)
@@ -7,9 +7,10 @@ from typing import Any, Dict, List
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app.models.game_wallet import GameTokenType
+from app.db.upsert import insert_ignore_keys
 from app.models.level_xp import UserLevelProgress, UserLevelRewardLog, UserXpEventLog
-from app.services.reward_service import RewardService
+from app.services.reward_delivery_queue_service import RewardBatch, RewardDeliveryQueueService
+from app.services.reward_service import TICKET_REWARD_TYPES, RewardItem, RewardService
 
 
 class LevelXPService:
@@ -31,6 +32,7 @@ class LevelXPService:
 
     def __init__(self) -> None:
         self.reward_service = RewardService()
+        self.reward_queue = RewardDeliveryQueueService(self.reward_service)
 
     def _get_or_create_progress(self, db: Session, user_id: int) -> UserLevelProgress:
         progress = db.get(UserLevelProgress, user_id)
@@ -45,6 +47,32 @@ class LevelXPService:
         event = UserXpEventLog(user_id=user_id, source=source, delta=delta, meta=meta or {})
         db.add(event)
 
+    @staticmethod
+    def _level_reward_items(row: Dict[str, Any], reward_meta: dict) -> List[RewardItem]:
+        """Translate a LEVELS row into RewardService items (TICKET_MIX expands to one item per game)."""
+
+        reward_type = row["reward_type"]
+        payload = row.get("reward_payload") or {}
+        if reward_type.startswith("COUPON"):
+            return [RewardItem("COUPON", 1, {**reward_meta, "coupon_type": reward_type})]
+        if reward_type == "TICKET_MIX":
+            tickets = payload.get("tickets") or {}
+            return [
+                RewardItem(f"TICKET_{key}", amt, reward_meta)
+                for key, amt in tickets.items()
+                if f"TICKET_{key}" in TICKET_REWARD_TYPES and amt > 0
+            ]
+        if reward_type.startswith("TICKET"):
+            amount = payload.get("tickets") or payload.get("amount") or 0
+            if reward_type in TICKET_REWARD_TYPES and amount > 0:
+                return [RewardItem(reward_type, amount, reward_meta)]
+            return []
+        if reward_type.startswith("POINT"):
+            amount = payload.get("amount") or 0
+            if amount > 0:
+                return [RewardItem("POINT", amount, {**reward_meta, "reason": "LEVEL_REWARD"})]
+        return []
+
     def add_xp(self, db: Session, user_id: int, delta: int, source: str, meta: dict | None = None) -> dict:
         """Increment XP, log event, and emit reward logs for newly reached levels.
 
@@ -60,30 +88,40 @@ class LevelXPService:
         progress.xp += delta
         progress.updated_at = datetime.utcnow()
 
-        # Determine newly achieved levels
+        # Determine newly achieved levels against the user's claimed set (one SELECT, not one per level).
+        reached = [row for row in self.LEVELS if progress.xp >= row["required_xp"]]
+        current_level = max([progress.level, *(row["level"] for row in reached)])
+        claimed = (
+            set(db.execute(select(UserLevelRewardLog.level).where(UserLevelRewardLog.user_id == user_id)).scalars())
+            if reached
+            else set()
+        )
+        to_claim = [row for row in reached if row["level"] not in claimed]
+
         achieved = []
-        current_level = progress.level
-        for row in self.LEVELS:
-            if progress.xp < row["required_xp"]:
-                break
-            current_level = max(current_level, row["level"])
-            # Check duplicate reward
-            existing = db.execute(
-                select(UserLevelRewardLog).where(
-                    UserLevelRewardLog.user_id == user_id,
-                    UserLevelRewardLog.level == row["level"],
-                )
-            ).scalar_one_or_none()
-            if existing:
-                continue
-            reward_log = UserLevelRewardLog(
-                user_id=user_id,
-                level=row["level"],
-                reward_type=row["reward_type"],
-                reward_payload=row["reward_payload"],
-                auto_granted=row["auto_grant"],
+        deliveries: list[RewardBatch] = []
+        if to_claim:
+            now = datetime.utcnow()
+            # A concurrent XP event may claim some of these levels between the SELECT and the INSERT;
+            # only the levels this call actually inserted are reported and delivered.
+            inserted = insert_ignore_keys(
+                db,
+                UserLevelRewardLog.__table__,
+                [
+                    {
+                        "user_id": user_id,
+                        "level": row["level"],
+                        "reward_type": row["reward_type"],
+                        "reward_payload": row["reward_payload"],
+                        "auto_granted": row["auto_grant"],
+                        "created_at": now,
+                    }
+                    for row in to_claim
+                ],
+                keys=["user_id", "level"],
             )
-            db.add(reward_log)
+            to_claim = [row for row in to_claim if (user_id, row["level"]) in inserted]
+        for row in to_claim:
             achieved.append(
                 {
                     "level": row["level"],
@@ -92,44 +130,12 @@ class LevelXPService:
                     "auto_granted": row["auto_grant"],
                 }
             )
-            # Auto grant only for supported reward types; non-blocking
+            # Auto grant only for supported reward types; delivered together after the loop.
             if row["auto_grant"]:
                 reward_meta = {"source": source, "level": row["level"], **(row["reward_payload"] or {})}
-                try:
-                    if row["reward_type"].startswith("COUPON"):
-                        self.reward_service.grant_coupon(db, user_id=user_id, coupon_type=row["reward_type"], meta=reward_meta)
-                    elif row["reward_type"] == "TICKET_MIX":
-                        payload = row.get("reward_payload") or {}
-                        tickets = payload.get("tickets") or {}
-                        ticket_map = {
-                            "ROULETTE": GameTokenType.ROULETTE_COIN,
-                            "DICE": GameTokenType.DICE_TOKEN,
-                            "LOTTERY": GameTokenType.LOTTERY_TICKET,
-                        }
-                        for key, amt in tickets.items():
-                            token_type = ticket_map.get(key)
-                            if token_type and amt > 0:
-                                self.reward_service.grant_ticket(db, user_id=user_id, token_type=token_type, amount=amt, meta=reward_meta)
-                    elif row["reward_type"].startswith("TICKET"):
-                        ticket_map = {
-                            "TICKET_ROULETTE": GameTokenType.ROULETTE_COIN,
-                            "TICKET_DICE": GameTokenType.DICE_TOKEN,
-                            "TICKET_LOTTERY": GameTokenType.LOTTERY_TICKET,
-                            "TICKET_CC_COIN": GameTokenType.CC_COIN,
-                        }
-                        token_type = ticket_map.get(row["reward_type"])
-                        payload = row.get("reward_payload") or {}
-                        amount = payload.get("tickets") or payload.get("amount") or 0
-                        if token_type and amount > 0:
-                            self.reward_service.grant_ticket(db, user_id=user_id, token_type=token_type, amount=amount, meta=reward_meta)
-                    elif row["reward_type"].startswith("POINT"):
-                        payload = row.get("reward_payload") or {}
-                        amount = payload.get("amount") or 0
-                        if amount > 0:
-                            self.reward_service.grant_point(db, user_id=user_id, amount=amount, reason="LEVEL_REWARD", meta=reward_meta)
-                except Exception:
-                    # Delivery errors should not break XP accrual; rely on logs for retries.
-                    pass
+                deliveries.append((f"LEVEL_XP:{user_id}:{row['level']}", self._level_reward_items(row, reward_meta)))
+        # Delivery errors must not break XP accrual; failed grants are queued for the reward worker.
+        self.reward_queue.deliver_or_enqueue(db, user_id, "LEVEL_XP", deliveries, commit=False)
         progress.level = current_level
         return {"added_xp": delta, "new_rewards": achieved, "level": progress.level, "xp": progress.xp}
 
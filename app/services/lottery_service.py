@@ -1,24 +1,73 @@
 """Lottery service implementing status and play flows."""
+from dataclasses import dataclass, field
 from datetime import date, datetime
-import random
-import time
 
-from sqlalchemy import func, select
-from sqlalchemy.exc import DBAPIError
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
-from app.core.exceptions import InvalidConfigError, LockAcquisitionError
+from app.core.exceptions import InvalidConfigError
 from app.models.feature import FeatureType
 from app.models.game_wallet import GameTokenType
 from app.models.lottery import LotteryConfig, LotteryLog, LotteryPrize
 from app.schemas.lottery import LotteryPlayResponse, LotteryPrizeSchema, LotteryStatusResponse
+from app.services.config_snapshot import VersionedSnapshotCache
 from app.services.feature_service import FeatureService
-from app.services.game_common import GamePlayContext, log_game_play
+from app.services.game_common import (
+    MAX_PLAY_BATCH,
+    GamePlayContext,
+    aggregate_rewards,
+    game_xp_deferrer,
+    log_game_play_many,
+    play_unit_of_work,
+    record_internal_wins,
+)
 from app.services.game_wallet_service import GameWalletService
-from app.services.reward_service import RewardService
-from app.services.season_pass_service import SeasonPassService
+from app.services.play_counter_service import PlayCounterService
+from app.services.play_idempotency_service import PlayIdempotencyService
+from app.services.lottery_stock_service import LotteryStockService
+from app.services.reward_service import RewardItem, RewardService
 from app.services.vault_service import VaultService
+from app.services.weighted_sampler import AliasSampler
+
+
+@dataclass(frozen=True)
+class LotteryPrizeSnapshot:
+    """The static fields of an active prize a play needs (stock itself is reserved in the database)."""
+
+    id: int
+    label: str
+    reward_type: str
+    reward_amount: int
+    stock_limited: bool
+
+
+@dataclass(frozen=True)
+class LotteryConfigSnapshot:
+    """Active prize weights of a lottery config at a specific version."""
+
+    config_id: int
+    version: int
+    prize_ids: tuple[int, ...]
+    weights: tuple[int, ...]
+    prizes: dict[int, LotteryPrizeSnapshot] = field(default_factory=dict, compare=False, repr=False)
+    _samplers: dict[frozenset[int], AliasSampler[int]] = field(default_factory=dict, compare=False, repr=False)
+
+    def sampler(self, exclude: frozenset[int] = frozenset()) -> AliasSampler[int]:
+        """Sampler over prize ids, skipping ``exclude`` (e.g. sold-out prizes); memoized per exclusion set."""
+
+        sampler = self._samplers.get(exclude)
+        if sampler is None:
+            pairs = [(pid, w) for pid, w in zip(self.prize_ids, self.weights) if pid not in exclude]
+            try:
+                sampler = AliasSampler([pid for pid, _ in pairs], [w for _, w in pairs])
+            except ValueError as exc:
+                raise InvalidConfigError("INVALID_LOTTERY_CONFIG") from exc
+            self._samplers[exclude] = sampler
+        return sampler
+
+
+_snapshot_cache: VersionedSnapshotCache[LotteryConfigSnapshot] = VersionedSnapshotCache()
 
 
 class LotteryService:
@@ -30,8 +79,10 @@ class LotteryService:
         self.feature_service = FeatureService()
         self.reward_service = RewardService()
         self.wallet_service = GameWalletService()
-        self.season_pass_service = SeasonPassService()
         self.vault_service = VaultService()
+        self.play_counter_service = PlayCounterService()
+        self.idempotency_service = PlayIdempotencyService()
+        self.stock_service = LotteryStockService()
 
     def _get_today_config(self, db: Session) -> LotteryConfig:
         config = db.execute(select(LotteryConfig).where(LotteryConfig.is_active.is_(True))).scalar_one_or_none()
@@ -39,14 +90,9 @@ class LotteryService:
             raise InvalidConfigError("LOTTERY_CONFIG_MISSING")
         return config
 
-    def _eligible_prizes(self, db: Session, config_id: int, lock: bool = False) -> list[LotteryPrize]:
+    def _eligible_prizes(self, db: Session, config_id: int) -> list[LotteryPrize]:
         prizes_stmt = select(LotteryPrize).where(LotteryPrize.config_id == config_id, LotteryPrize.is_active.is_(True))
-        if lock and db.bind and db.bind.dialect.name != "sqlite":
-            prizes_stmt = prizes_stmt.with_for_update()
-        try:
-            prizes = db.execute(prizes_stmt).scalars().all()
-        except DBAPIError as exc:
-            raise LockAcquisitionError("LOTTERY_LOCK_FAILED") from exc
+        prizes = db.execute(prizes_stmt).scalars().all()
         eligible = [p for p in prizes if (p.stock is None or p.stock > 0)]
         for prize in eligible:
             if prize.weight < 0:
@@ -56,6 +102,70 @@ class LotteryService:
             raise InvalidConfigError("INVALID_LOTTERY_CONFIG")
         return eligible
 
+    def _get_snapshot(self, db: Session, config: LotteryConfig) -> LotteryConfigSnapshot:
+        """Return the cached prize-weight snapshot for the config's current version."""
+
+        version = int(config.version or 1)
+
+        def _build() -> LotteryConfigSnapshot:
+            rows = db.execute(
+                select(
+                    LotteryPrize.id,
+                    LotteryPrize.label,
+                    LotteryPrize.reward_type,
+                    LotteryPrize.reward_amount,
+                    LotteryPrize.weight,
+                    LotteryPrize.stock,
+                )
+                .where(LotteryPrize.config_id == config.id, LotteryPrize.is_active.is_(True))
+                .order_by(LotteryPrize.id)
+            ).all()
+            return LotteryConfigSnapshot(
+                config_id=config.id,
+                version=version,
+                prize_ids=tuple(row.id for row in rows),
+                weights=tuple(max(int(row.weight), 0) for row in rows),
+                prizes={
+                    row.id: LotteryPrizeSnapshot(
+                        id=row.id,
+                        label=row.label,
+                        reward_type=row.reward_type,
+                        reward_amount=int(row.reward_amount),
+                        stock_limited=row.stock is not None,
+                    )
+                    for row in rows
+                },
+            )
+
+        return _snapshot_cache.get_or_build(db, config.id, version, _build)
+
+    @staticmethod
+    def _sold_out(db: Session, snapshot: LotteryConfigSnapshot) -> frozenset[int]:
+        """Stock-limited prizes with no stock left (unlocked read; the reservation stays authoritative)."""
+
+        limited = [prize.id for prize in snapshot.prizes.values() if prize.stock_limited]
+        if not limited:
+            return frozenset()
+        rows = db.execute(select(LotteryPrize.id).where(LotteryPrize.id.in_(limited), LotteryPrize.stock <= 0))
+        return frozenset(rows.scalars())
+
+    def _draw_and_reserve(
+        self,
+        db: Session,
+        snapshot: LotteryConfigSnapshot,
+        sold_out: frozenset[int],
+    ) -> tuple[LotteryPrizeSnapshot, frozenset[int]]:
+        """Draw a prize; stock-limited prizes are reserved atomically, redrawing if one just sold out.
+
+        Returns the prize and the (possibly grown) sold-out set for subsequent draws in the batch.
+        """
+
+        while True:
+            chosen = snapshot.prizes[snapshot.sampler(exclude=sold_out).sample()]
+            if not chosen.stock_limited or self.stock_service.reserve(db, chosen.id):
+                return chosen, sold_out
+            sold_out = sold_out | {chosen.id}
+
     def get_status(self, db: Session, user_id: int, today: date) -> LotteryStatusResponse:
         self.feature_service.validate_feature_active(db, today, FeatureType.LOTTERY)
         config = self._get_today_config(db)
@@ -63,13 +173,7 @@ class LotteryService:
         token_balance = self.wallet_service.get_balance(db, user_id, token_type)
         prizes = self._eligible_prizes(db, config.id)
 
-        today_tickets = db.execute(
-            select(func.count()).select_from(LotteryLog).where(
-                LotteryLog.user_id == user_id,
-                LotteryLog.config_id == config.id,
-                func.date(LotteryLog.created_at) == today,
-            )
-        ).scalar_one()
+        today_tickets = self.play_counter_service.get_today(db, user_id, FeatureType.LOTTERY.value, today)
         # Daily cap removed: use 0 to denote unlimited.
         unlimited = 0
         remaining = 0
@@ -86,117 +190,125 @@ class LotteryService:
             feature_type=FeatureType.LOTTERY,
         )
 
-    def play(self, db: Session, user_id: int, now: date | datetime) -> LotteryPlayResponse:
+    def play(self, db: Session, user_id: int, now: date | datetime, count: int = 1, request_id: str | None = None) -> LotteryPlayResponse:
+        """Draw ``count`` tickets in one transaction (one wallet update, bulk logs, one grant per reward type)."""
+
         today = now.date() if isinstance(now, datetime) else now
+        if count < 1 or count > MAX_PLAY_BATCH:
+            raise InvalidConfigError("INVALID_PLAY_COUNT")
+        # A retried request (same Idempotency-Key) gets the original result; nothing is consumed twice.
+        replayed = self.idempotency_service.replay(db, user_id, FeatureType.LOTTERY.value, request_id, LotteryPlayResponse)
+        if replayed is not None:
+            return replayed
         self.feature_service.validate_feature_active(db, today, FeatureType.LOTTERY)
         config = self._get_today_config(db)
         token_type = GameTokenType.LOTTERY_TICKET
-        prizes = None
-        for attempt in range(3):
-            try:
-                prizes = self._eligible_prizes(db, config.id, lock=True)
-                break
-            except LockAcquisitionError:
-                if attempt == 2:
-                    raise
-                time.sleep(0.05)
-        assert prizes is not None
-
-        today_tickets = db.execute(
-            select(func.count()).select_from(LotteryLog).where(
-                LotteryLog.user_id == user_id,
-                LotteryLog.config_id == config.id,
-                func.date(LotteryLog.created_at) == today,
-            )
-        ).scalar_one()
-
-        weighted_pool: list[LotteryPrize] = []
-        for prize in prizes:
-            weighted_pool.extend([prize] * max(prize.weight, 0))
-        chosen = random.choice(weighted_pool)
-
-        _, consumed_trial = self.wallet_service.require_and_consume_token(
-            db,
-            user_id,
-            token_type,
-            amount=1,
-            reason="LOTTERY_PLAY",
-            label=chosen.label,
-            meta={"prize_id": chosen.id},
-        )
-
-        if chosen.stock is not None:
-            chosen.stock -= 1
-            db.add(chosen)
+        snapshot = self._get_snapshot(db, config)
+        # Stock is enforced by an atomic reservation on the chosen prize only.
+        sold_out = self._sold_out(db, snapshot)
 
-        log_entry = LotteryLog(
-            user_id=user_id,
-            config_id=config.id,
-            prize_id=chosen.id,
-            reward_type=chosen.reward_type,
-            reward_amount=chosen.reward_amount,
-        )
-        db.add(log_entry)
-        db.commit()
-        db.refresh(log_entry)
-
-        # Vault Phase 1: idempotent game accrual (safe-guarded by feature flag).
-        self.vault_service.record_game_play_earn_event(
-            db,
-            user_id=user_id,
-            game_type=FeatureType.LOTTERY.value,
-            game_log_id=log_entry.id,
-            token_type=token_type.value,
-            outcome=None,
-            payout_raw={
-                "prize_id": chosen.id,
-                "reward_type": chosen.reward_type,
-                "reward_amount": chosen.reward_amount,
-            },
+        settings = get_settings()
+        trial_to_vault = bool(getattr(settings, "enable_trial_payout_to_vault", False))
+        xp_award = self.BASE_GAME_XP
+        ctx = GamePlayContext(
+            user_id=user_id, feature_type=FeatureType.LOTTERY.value, today=today, request_id=request_id
         )
+        # Wallet, stock, log, vault, event log and reward share one transaction; side effects run after commit.
+        with play_unit_of_work(ctx, db):
+            results: list[LotteryPrizeSnapshot] = []
+            for _ in range(count):
+                chosen, sold_out = self._draw_and_reserve(db, snapshot, sold_out)
+                results.append(chosen)
 
-        # Trial: optionally route reward into Vault instead of direct payout.
-        settings = get_settings()
-        if consumed_trial and bool(getattr(settings, "enable_trial_payout_to_vault", False)):
-            self.vault_service.record_trial_result_earn_event(
+            _, trial_flags = self.wallet_service.consume_tokens_for_plays(
                 db,
-                user_id=user_id,
-                game_type=FeatureType.LOTTERY.value,
-                game_log_id=log_entry.id,
-                token_type=token_type.value,
-                reward_type=chosen.reward_type,
-                reward_amount=chosen.reward_amount,
-                payout_raw={"prize_id": chosen.id},
+                user_id,
+                token_type,
+                labels=[chosen.label for chosen in results],
+                reason="LOTTERY_PLAY",
+                metas=[{"prize_id": chosen.id} for chosen in results],
+                commit=False,
             )
 
-        xp_award = self.BASE_GAME_XP
-        ctx = GamePlayContext(user_id=user_id, feature_type=FeatureType.LOTTERY.value, today=today)
-        log_game_play(
-            ctx,
-            db,
-            {
-                "prize_id": chosen.id,
-                "reward_type": chosen.reward_type,
-                "reward_amount": chosen.reward_amount,
-                "label": chosen.label,
-                "xp_from_reward": xp_award,
-            },
-        )
+            log_entries = [
+                LotteryLog(
+                    user_id=user_id,
+                    config_id=config.id,
+                    prize_id=chosen.id,
+                    reward_type=chosen.reward_type,
+                    reward_amount=chosen.reward_amount,
+                )
+                for chosen in results
+            ]
+            db.add_all(log_entries)
+            db.flush()
 
-        if not (consumed_trial and bool(getattr(settings, "enable_trial_payout_to_vault", False))):
-            self.reward_service.deliver(
+            payouts = []
+            for chosen, log_entry, consumed_trial in zip(results, log_entries, trial_flags):
+                # Vault Phase 1: idempotent game accrual (safe-guarded by feature flag).
+                self.vault_service.record_game_play_earn_event(
+                    db,
+                    user_id=user_id,
+                    game_type=FeatureType.LOTTERY.value,
+                    game_log_id=log_entry.id,
+                    token_type=token_type.value,
+                    outcome=None,
+                    payout_raw={
+                        "prize_id": chosen.id,
+                        "reward_type": chosen.reward_type,
+                        "reward_amount": chosen.reward_amount,
+                    },
+                    commit=False,
+                )
+
+                # Trial: optionally route reward into Vault instead of direct payout.
+                if consumed_trial and trial_to_vault:
+                    self.vault_service.record_trial_result_earn_event(
+                        db,
+                        user_id=user_id,
+                        game_type=FeatureType.LOTTERY.value,
+                        game_log_id=log_entry.id,
+                        token_type=token_type.value,
+                        reward_type=chosen.reward_type,
+                        reward_amount=chosen.reward_amount,
+                        payout_raw={"prize_id": chosen.id},
+                        commit=False,
+                    )
+                else:
+                    payouts.append((chosen.reward_type, chosen.reward_amount, xp_award))
+
+            log_game_play_many(
+                ctx,
+                db,
+                [
+                    {
+                        "prize_id": chosen.id,
+                        "reward_type": chosen.reward_type,
+                        "reward_amount": chosen.reward_amount,
+                        "label": chosen.label,
+                        "xp_from_reward": xp_award,
+                    }
+                    for chosen in results
+                ],
+            )
+
+            self.reward_service.deliver_many(
                 db,
                 user_id=user_id,
-                reward_type=chosen.reward_type,
-                reward_amount=chosen.reward_amount,
-                meta={"reason": "lottery_play", "prize_id": chosen.id, "game_xp": xp_award},
+                rewards=[
+                    RewardItem(reward_type, reward_amount, {"reason": "lottery_play", "game_xp": game_xp, **({"prize_id": results[0].id} if count == 1 else {"plays": count})})
+                    for reward_type, (reward_amount, game_xp) in aggregate_rewards(payouts).items()
+                ],
+                commit=False,
+                defer_game_xp=game_xp_deferrer(ctx, db),
             )
-        if chosen.reward_amount > 0:
-            self.season_pass_service.maybe_add_internal_win_stamp(db, user_id=user_id, now=today)
-        season_pass = None  # 게임 1회당 자동 스탬프 발급 제거
-
-        return LotteryPlayResponse(
-            result="OK",
-            prize=LotteryPrizeSchema.from_orm(chosen),
-            season_pass=season_pass,
-        )
+            record_internal_wins(ctx, db, sum(1 for chosen in results if chosen.reward_amount > 0))
+            season_pass = None  # 게임 1회당 자동 스탬프 발급 제거
+
+            ctx.response = LotteryPlayResponse(
+                result="OK",
+                prize=LotteryPrizeSchema.from_orm(results[-1]),
+                results=[LotteryPrizeSchema.from_orm(chosen) for chosen in results],
+                season_pass=season_pass,
+            )
+        return ctx.response
@@ -0,0 +1,29 @@
+"""Atomic stock reservation for stock-limited lottery prizes."""
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.models.lottery import LotteryPrize
+
+
+class LotteryStockService:
+    """Reserve prize stock with a single conditional UPDATE instead of locking the prize pool.
+
+    Only the chosen stock-limited prize row is touched (and row-locked by the database until the
+    play commits); unlimited prizes (stock IS NULL) never need a reservation.
+    """
+
+    @staticmethod
+    def reserve(db: Session, prize_id: int, quantity: int = 1) -> bool:
+        """Decrement stock by ``quantity`` if enough remains. Returns False when sold out."""
+
+        result = db.execute(
+            update(LotteryPrize)
+            .where(
+                LotteryPrize.id == prize_id,
+                LotteryPrize.stock.is_not(None),
+                LotteryPrize.stock >= quantity,
+            )
+            .values(stock=LotteryPrize.stock - quantity)
+            .execution_options(synchronize_session="evaluate")
+        )
+        return result.rowcount == 1
@@ -0,0 +1,168 @@
+"""Transactional outbox: enqueue post-play side effects and drain them with retries."""
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from fastapi import HTTPException
+from sqlalchemy import and_, or_, select
+from sqlalchemy.orm import Session
+
+from app.models.outbox_event import OutboxEvent
+from app.services.season_pass_service import SeasonPassService
+from app.services.team_battle_service import TeamBattleService
+
+logger = logging.getLogger(__name__)
+
+TEAM_BATTLE_GAME_PLAY = "TEAM_BATTLE_GAME_PLAY"
+SEASON_PASS_INTERNAL_WIN = "SEASON_PASS_INTERNAL_WIN"
+SEASON_PASS_GAME_XP = "SEASON_PASS_GAME_XP"
+
+
+def _apply_team_battle_game_play(db: Session, payload: dict[str, Any]) -> None:
+    svc = TeamBattleService()
+    user_id = int(payload["user_id"])
+    member = svc.get_membership(db, user_id)
+    if not member:
+        return
+    season = svc.get_active_season(db) or svc.ensure_current_season(db)
+    plays = int(payload.get("plays") or 1)
+    try:
+        svc.add_points(
+            db,
+            team_id=member.team_id,
+            delta=svc.POINTS_PER_PLAY * plays,
+            action="GAME_PLAY",
+            user_id=user_id,
+            season_id=season.id,
+            meta=payload.get("meta"),
+            enforce_usage=False,
+            plays=plays,
+            commit=False,
+        )
+    except HTTPException as exc:
+        # Daily cap / membership changes are final outcomes, not transient failures.
+        if 400 <= exc.status_code < 500:
+            return
+        raise
+
+
+def _apply_internal_win(db: Session, payload: dict[str, Any]) -> None:
+    # Idempotent by itself: the stamp is issued once per season (period_key INTERNAL_WIN_50).
+    SeasonPassService().maybe_add_internal_win_stamp(
+        db, user_id=int(payload["user_id"]), now=date.fromisoformat(payload["day"])
+    )
+
+
+def _apply_game_xp(db: Session, payload: dict[str, Any]) -> None:
+    SeasonPassService().add_bonus_xp(
+        db,
+        user_id=int(payload["user_id"]),
+        xp_amount=int(payload["xp_amount"]),
+        now=date.fromisoformat(payload["day"]),
+        commit=False,
+    )
+
+
+class OutboxService:
+    """Write outbox rows inside the caller's transaction; apply them later (worker) or right after commit."""
+
+    MAX_ATTEMPTS = 8
+    BACKOFF_BASE_SECONDS = 5
+    BACKOFF_MAX_SECONDS = 3600
+    # A PROCESSING row whose worker died is reclaimed after this lease.
+    LEASE_SECONDS = 300
+
+    HANDLERS: dict[str, Callable[[Session, dict[str, Any]], None]] = {
+        TEAM_BATTLE_GAME_PLAY: _apply_team_battle_game_play,
+        SEASON_PASS_INTERNAL_WIN: _apply_internal_win,
+        SEASON_PASS_GAME_XP: _apply_game_xp,
+    }
+
+    @staticmethod
+    def enqueue(db: Session, event_type: str, idempotency_key: str, payload: dict[str, Any]) -> OutboxEvent:
+        """Add an outbox row to the current transaction (flush only)."""
+
+        if event_type not in OutboxService.HANDLERS:
+            raise ValueError(f"unknown outbox event type: {event_type}")
+        event = OutboxEvent(
+            event_type=event_type,
+            idempotency_key=idempotency_key,
+            payload_json=payload,
+            status="PENDING",
+            attempts=0,
+            next_attempt_at=datetime.utcnow(),
+        )
+        db.add(event)
+        db.flush()
+        return event
+
+    @staticmethod
+    def apply(db: Session, event_type: str, payload: dict[str, Any]) -> None:
+        """Run the handler for ``event_type`` without committing."""
+
+        OutboxService.HANDLERS[event_type](db, payload)
+
+    def _backoff(self, attempts: int) -> timedelta:
+        return timedelta(seconds=min(self.BACKOFF_BASE_SECONDS * (2 ** max(attempts - 1, 0)), self.BACKOFF_MAX_SECONDS))
+
+    def _claim(self, db: Session, batch_size: int, now: datetime) -> list[int]:
+        stale = now - timedelta(seconds=self.LEASE_SECONDS)
+        stmt = (
+            select(OutboxEvent)
+            .where(
+                or_(
+                    and_(OutboxEvent.status == "PENDING", OutboxEvent.next_attempt_at <= now),
+                    and_(OutboxEvent.status == "PROCESSING", OutboxEvent.locked_at < stale),
+                )
+            )
+            .order_by(OutboxEvent.id)
+            .limit(batch_size)
+        )
+        # Let concurrent workers split the backlog instead of blocking on each other.
+        if db.bind and db.bind.dialect.name != "sqlite":
+            stmt = stmt.with_for_update(skip_locked=True)
+        events = db.execute(stmt).scalars().all()
+        for event in events:
+            event.status = "PROCESSING"
+            event.locked_at = now
+        db.commit()
+        return [event.id for event in events]
+
+    def process_batch(self, db: Session, batch_size: int = 100, now: datetime | None = None) -> dict[str, int]:
+        """Claim up to ``batch_size`` due events and apply them; failures are rescheduled with backoff."""
+
+        now_dt = now or datetime.utcnow()
+        summary = {"claimed": 0, "done": 0, "retried": 0, "failed": 0}
+        event_ids = self._claim(db, batch_size, now_dt)
+        summary["claimed"] = len(event_ids)
+
+        for event_id in event_ids:
+            event = db.get(OutboxEvent, event_id)
+            if event is None:
+                continue
+            try:
+                self.apply(db, event.event_type, event.payload_json or {})
+                event.status = "DONE"
+                event.processed_at = datetime.utcnow()
+                event.last_error = None
+                db.commit()
+                summary["done"] += 1
+            except Exception as exc:  # noqa: BLE001 - every failure becomes a retry
+                db.rollback()
+                event = db.get(OutboxEvent, event_id)
+                event.attempts = int(event.attempts or 0) + 1
+                event.last_error = f"{type(exc).__name__}: {exc}"[:1000]
+                event.locked_at = None
+                if event.attempts >= self.MAX_ATTEMPTS:
+                    event.status = "FAILED"
+                    summary["failed"] += 1
+                    logger.error("outbox event %s (%s) failed permanently: %s", event.id, event.event_type, event.last_error)
+                else:
+                    event.status = "PENDING"
+                    event.next_attempt_at = now_dt + self._backoff(event.attempts)
+                    summary["retried"] += 1
+                db.commit()
+        return summary
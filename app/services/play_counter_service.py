@@ -0,0 +1,47 @@
+"""Per-user daily play counters for game status endpoints."""
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.db.upsert import upsert_increment
+from app.models.user_daily_play_counter import UserDailyPlayCounter
+
+
+class PlayCounterService:
+    """Maintain and read `user_daily_play_counter` (one row per user, feature and KST day)."""
+
+    @staticmethod
+    def kst_date(now: date | datetime | None = None) -> date:
+        """Resolve the KST calendar day; plain dates are treated as already KST-aligned."""
+
+        if now is None:
+            return datetime.now(ZoneInfo(get_settings().timezone)).date()
+        if isinstance(now, datetime):
+            if now.tzinfo is None:
+                now = now.replace(tzinfo=ZoneInfo("UTC"))
+            return now.astimezone(ZoneInfo(get_settings().timezone)).date()
+        return now
+
+    def increment(self, db: Session, user_id: int, feature_type: str, day: date | datetime, plays: int = 1) -> None:
+        """Upsert the counter within the caller's transaction (no commit)."""
+
+        upsert_increment(
+            db,
+            UserDailyPlayCounter.__table__,
+            keys={"user_id": user_id, "feature_type": feature_type, "kst_date": self.kst_date(day)},
+            increments={"play_count": plays},
+            values={"updated_at": datetime.utcnow()},
+        )
+
+    def get_today(self, db: Session, user_id: int, feature_type: str, day: date | datetime) -> int:
+        count = db.execute(
+            select(UserDailyPlayCounter.play_count).where(
+                UserDailyPlayCounter.user_id == user_id,
+                UserDailyPlayCounter.feature_type == feature_type,
+                UserDailyPlayCounter.kst_date == self.kst_date(day),
+            )
+        ).scalar_one_or_none()
+        return int(count or 0)
@@ -0,0 +1,94 @@
+"""Idempotent /play requests keyed by the client's Idempotency-Key header."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import TypeVar
+
+from pydantic import BaseModel
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.exceptions import PlayRequestInProgressError
+from app.models.play_request_dedupe import PlayRequestDedupe
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class PlayIdempotencyService:
+    """Remember the response of each keyed play so client retries replay it instead of re-running the play."""
+
+    @staticmethod
+    def _key_filter(user_id: int, feature_type: str, request_id: str):
+        return (
+            PlayRequestDedupe.user_id == user_id,
+            PlayRequestDedupe.feature_type == feature_type,
+            PlayRequestDedupe.request_id == request_id,
+        )
+
+    @staticmethod
+    def replay(db: Session, user_id: int, feature_type: str, request_id: str | None, response_type: type[T]) -> T | None:
+        """Return the stored response for a completed keyed play, or None when it must run."""
+
+        if not request_id:
+            return None
+        stored = db.execute(
+            select(PlayRequestDedupe.response_json).where(
+                *PlayIdempotencyService._key_filter(user_id, feature_type, request_id),
+                PlayRequestDedupe.expires_at > datetime.utcnow(),
+            )
+        ).scalar_one_or_none()
+        if stored is None:
+            return None
+        return response_type.model_validate(stored)
+
+    @staticmethod
+    def claim(db: Session, user_id: int, feature_type: str, request_id: str) -> PlayRequestDedupe:
+        """Insert the key in the play transaction (flush only), before any other write.
+
+        A concurrent request with the same key blocks on the unique index until the first one
+        finishes and then fails here, so it never consumes tokens.
+        """
+
+        now = datetime.utcnow()
+        # An expired key may be reused by the client; drop the stale row first.
+        db.execute(
+            delete(PlayRequestDedupe).where(
+                *PlayIdempotencyService._key_filter(user_id, feature_type, request_id),
+                PlayRequestDedupe.expires_at <= now,
+            )
+        )
+        entry = PlayRequestDedupe(
+            user_id=user_id,
+            feature_type=feature_type,
+            request_id=request_id,
+            created_at=now,
+            expires_at=now + timedelta(seconds=get_settings().play_idempotency_ttl_seconds),
+        )
+        db.add(entry)
+        try:
+            db.flush()
+        except IntegrityError as exc:
+            raise PlayRequestInProgressError() from exc
+        return entry
+
+    @staticmethod
+    def complete(db: Session, entry: PlayRequestDedupe, response: BaseModel | None) -> None:
+        """Store the response on the claimed row (committed together with the play)."""
+
+        entry.response_json = response.model_dump(mode="json") if response is not None else None
+        db.add(entry)
+
+    @staticmethod
+    def purge_expired(db: Session, now: datetime | None = None, batch_size: int = 5000) -> int:
+        """Delete up to ``batch_size`` expired keys and commit. Returns the number of rows removed."""
+
+        cutoff = now or datetime.utcnow()
+        ids = db.execute(
+            select(PlayRequestDedupe.id).where(PlayRequestDedupe.expires_at <= cutoff).limit(batch_size)
+        ).scalars().all()
+        if ids:
+            db.execute(delete(PlayRequestDedupe).where(PlayRequestDedupe.id.in_(ids)))
+        db.commit()
+        return len(ids)
@@ -0,0 +1,235 @@
+"""Durable retry queue for reward deliveries (season pass / level rewards)."""
+from __future__ import annotations
+
+import logging
+from collections.abc import Sequence
+from dataclasses import asdict
+from datetime import datetime, timedelta
+
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.models.reward_delivery_job import RewardDeliveryJob
+from app.services.reward_service import RewardItem, RewardService
+
+logger = logging.getLogger(__name__)
+
+RewardBatch = tuple[str, Sequence[RewardItem]]
+
+
+class RewardDeliveryQueueService:
+    """Deliver rewards inline when possible; queue them for the worker when delivery fails.
+
+    Inline delivery runs inside a SAVEPOINT, so a failure (lock timeout, deadlock, ...) rolls back
+    only the partial grant. The job row is then written in the caller's transaction next to the
+    claim record, and the worker marks it DONE in the same commit as the grant: exactly once.
+    """
+
+    MAX_ATTEMPTS = 8
+    BACKOFF_BASE_SECONDS = 10
+    BACKOFF_MAX_SECONDS = 3600
+    # A PROCESSING row whose worker died is reclaimed after this lease.
+    LEASE_SECONDS = 300
+
+    def __init__(self, reward_service: RewardService | None = None) -> None:
+        self.reward_service = reward_service or RewardService()
+
+    def deliver_or_enqueue(
+        self,
+        db: Session,
+        user_id: int,
+        source: str,
+        batches: Sequence[RewardBatch],
+        commit: bool = True,
+    ) -> bool:
+        """Deliver every (idempotency_key, rewards) batch; returns False when they were queued instead."""
+
+        items = [item for _, rewards in batches for item in rewards]
+        if not items:
+            return True
+        delivered = True
+        try:
+            with db.begin_nested():
+                self.reward_service.deliver_many(db, user_id=user_id, rewards=items, commit=False)
+        except Exception as exc:  # noqa: BLE001 - every failure becomes a retry
+            delivered = False
+            error = f"{type(exc).__name__}: {exc}"[:1000]
+            logger.warning("reward delivery for user %s (%s) queued for retry: %s", user_id, source, error)
+            for key, rewards in batches:
+                if rewards:
+                    self.enqueue(db, user_id=user_id, source=source, idempotency_key=key, rewards=rewards, error=error)
+        if commit:
+            db.commit()
+        else:
+            db.flush()
+        return delivered
+
+    def deliver_or_enqueue_many(
+        self,
+        db: Session,
+        source: str,
+        batches_by_user: dict[int, Sequence[RewardBatch]],
+        commit: bool = True,
+    ) -> bool:
+        """``deliver_or_enqueue`` for many users: one grouped ``RewardService.deliver_bulk`` in one SAVEPOINT.
+
+        If the grouped write fails, every user's batches are queued for the worker instead.
+        """
+
+        rewards_by_user = {
+            user_id: [item for _, rewards in batches for item in rewards] for user_id, batches in batches_by_user.items()
+        }
+        rewards_by_user = {user_id: items for user_id, items in rewards_by_user.items() if items}
+        if not rewards_by_user:
+            return True
+        delivered = True
+        try:
+            with db.begin_nested():
+                self.reward_service.deliver_bulk(db, rewards_by_user)
+        except Exception as exc:  # noqa: BLE001 - every failure becomes a retry
+            delivered = False
+            error = f"{type(exc).__name__}: {exc}"[:1000]
+            logger.warning("bulk reward delivery for %s users (%s) queued for retry: %s", len(rewards_by_user), source, error)
+            for user_id, batches in batches_by_user.items():
+                for key, rewards in batches:
+                    if rewards:
+                        self.enqueue(db, user_id=user_id, source=source, idempotency_key=key, rewards=rewards, error=error)
+        if commit:
+            db.commit()
+        else:
+            db.flush()
+        return delivered
+
+    @staticmethod
+    def enqueue(
+        db: Session,
+        user_id: int,
+        source: str,
+        idempotency_key: str,
+        rewards: Sequence[RewardItem],
+        error: str | None = None,
+    ) -> RewardDeliveryJob:
+        """Add a PENDING job to the current transaction (flush only); an existing key is returned as-is."""
+
+        existing = db.execute(
+            select(RewardDeliveryJob).where(RewardDeliveryJob.idempotency_key == idempotency_key)
+        ).scalar_one_or_none()
+        if existing is not None:
+            return existing
+        job = RewardDeliveryJob(
+            user_id=user_id,
+            source=source,
+            idempotency_key=idempotency_key,
+            rewards_json=[asdict(item) for item in rewards],
+            status="PENDING",
+            attempts=0,
+            next_attempt_at=datetime.utcnow(),
+            last_error=error,
+        )
+        db.add(job)
+        db.flush()
+        return job
+
+    def _backoff(self, attempts: int) -> timedelta:
+        return timedelta(seconds=min(self.BACKOFF_BASE_SECONDS * (2 ** max(attempts - 1, 0)), self.BACKOFF_MAX_SECONDS))
+
+    def _claim(self, db: Session, batch_size: int, now: datetime, lease: datetime) -> list[int]:
+        stale = now - timedelta(seconds=self.LEASE_SECONDS)
+        stmt = (
+            select(RewardDeliveryJob)
+            .where(
+                or_(
+                    and_(RewardDeliveryJob.status == "PENDING", RewardDeliveryJob.next_attempt_at <= now),
+                    and_(RewardDeliveryJob.status == "PROCESSING", RewardDeliveryJob.locked_at < stale),
+                )
+            )
+            .order_by(RewardDeliveryJob.id)
+            .limit(batch_size)
+        )
+        # Let concurrent workers split the backlog instead of blocking on each other.
+        if db.bind and db.bind.dialect.name != "sqlite":
+            stmt = stmt.with_for_update(skip_locked=True)
+        jobs = db.execute(stmt).scalars().all()
+        for job in jobs:
+            job.status = "PROCESSING"
+            job.locked_at = lease
+        db.commit()
+        return [job.id for job in jobs]
+
+    def process_batch(self, db: Session, batch_size: int = 100, now: datetime | None = None) -> dict[str, int]:
+        """Claim up to ``batch_size`` due jobs and re-deliver them; failures back off exponentially."""
+
+        now_dt = now or datetime.utcnow()
+        # locked_at doubles as this run's lease token; whole seconds so it survives a DATETIME column.
+        lease = now_dt.replace(microsecond=0)
+        summary = {"claimed": 0, "done": 0, "retried": 0, "failed": 0, "lost": 0}
+        job_ids = self._claim(db, batch_size, now_dt, lease)
+        summary["claimed"] = len(job_ids)
+
+        for job_id in job_ids:
+            job = db.get(RewardDeliveryJob, job_id)
+            if job is None:
+                continue
+            try:
+                rewards = [RewardItem(**item) for item in job.rewards_json or []]
+                self.reward_service.deliver_many(db, user_id=job.user_id, rewards=rewards, commit=False)
+                # Grant and DONE share one commit, and DONE is only written while the lease is still ours:
+                # if another worker reclaimed the job meanwhile, our grant is rolled back instead.
+                owned = db.execute(
+                    update(RewardDeliveryJob)
+                    .where(
+                        RewardDeliveryJob.id == job_id,
+                        RewardDeliveryJob.status == "PROCESSING",
+                        RewardDeliveryJob.locked_at == lease,
+                    )
+                    .values(status="DONE", delivered_at=datetime.utcnow(), last_error=None, locked_at=None)
+                    .execution_options(synchronize_session=False)
+                ).rowcount
+                if owned != 1:
+                    db.rollback()
+                    summary["lost"] += 1
+                    logger.warning("reward delivery job %s lease was reclaimed; skipping", job_id)
+                    continue
+                db.commit()
+                summary["done"] += 1
+            except Exception as exc:  # noqa: BLE001 - every failure becomes a retry
+                db.rollback()
+                job = db.get(RewardDeliveryJob, job_id)
+                if job is None or job.status != "PROCESSING" or job.locked_at != lease:
+                    summary["lost"] += 1
+                    continue
+                job.attempts = int(job.attempts or 0) + 1
+                job.last_error = f"{type(exc).__name__}: {exc}"[:1000]
+                job.locked_at = None
+                if job.attempts >= self.MAX_ATTEMPTS:
+                    job.status = "FAILED"
+                    summary["failed"] += 1
+                    logger.error("reward delivery job %s (%s) failed permanently: %s", job.id, job.idempotency_key, job.last_error)
+                else:
+                    job.status = "PENDING"
+                    job.next_attempt_at = now_dt + self._backoff(job.attempts)
+                    summary["retried"] += 1
+                db.commit()
+        return summary
+
+    @staticmethod
+    def retry(db: Session, job_id: int) -> RewardDeliveryJob | None:
+        """Put a FAILED job back in the queue (admin action); DONE jobs are never re-run."""
+
+        job = db.get(RewardDeliveryJob, job_id)
+        if job is None or job.status == "DONE":
+            return job
+        job.status = "PENDING"
+        job.attempts = 0
+        job.next_attempt_at = datetime.utcnow()
+        job.locked_at = None
+        db.commit()
+        db.refresh(job)
+        return job
+
+    @staticmethod
+    def status_counts(db: Session) -> dict[str, int]:
+        rows = db.execute(
+            select(RewardDeliveryJob.status, func.count(RewardDeliveryJob.id)).group_by(RewardDeliveryJob.status)
+        ).all()
+        return {status: int(count) for status, count in rows}
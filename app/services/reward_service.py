@@ -1,7 +1,13 @@
 """Reward service for coupons, points, and game tickets."""
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Any
 
+from sqlalchemy import case, insert, select, update
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.core.config import get_settings
 from app.core.exceptions import InvalidConfigError
@@ -10,6 +16,25 @@ from app.models.user import User
 from app.models.user_cash_ledger import UserCashLedger
 from app.services.game_wallet_service import GameWalletService
 
+TICKET_REWARD_TYPES: dict[str, GameTokenType] = {
+    "TICKET_ROULETTE": GameTokenType.ROULETTE_COIN,
+    "TICKET_DICE": GameTokenType.DICE_TOKEN,
+    "TICKET_LOTTERY": GameTokenType.LOTTERY_TICKET,
+    "CC_COIN": GameTokenType.CC_COIN,
+    "TICKET_CC_COIN": GameTokenType.CC_COIN,
+}
+
+GAME_REWARD_REASONS = {"dice_play", "roulette_spin", "lottery_play"}
+
+
+@dataclass
+class RewardItem:
+    """One reward for ``RewardService.deliver_many`` (same shape as ``deliver`` arguments)."""
+
+    reward_type: str
+    reward_amount: int
+    meta: dict[str, Any] | None = field(default=None)
+
 
 class RewardService:
     """Centralize reward delivery (points, coupons, game tickets)."""
@@ -17,6 +42,29 @@ class RewardService:
     def __init__(self) -> None:
         self.wallet_service = GameWalletService()
 
+    @staticmethod
+    def _lock_user(db: Session, user_id: int, commit: bool = True) -> User:
+        q = db.query(User).filter(User.id == user_id)
+        # Avoid races in MySQL/Postgres; SQLite used in tests doesn't support FOR UPDATE.
+        if db.bind and db.bind.dialect.name != "sqlite":
+            q = q.with_for_update()
+        user = q.one_or_none()
+
+        # In test sqlite environments, auto-create a placeholder user so existing tests/demos
+        # that rely on dependency overrides (user_id=1) don't fail.
+        if user is None and db.bind and db.bind.dialect.name == "sqlite":
+            user = User(id=user_id, external_id=f"test-user-{user_id}")
+            db.add(user)
+            if commit:
+                db.commit()
+                db.refresh(user)
+            else:
+                db.flush()
+
+        if user is None:
+            raise InvalidConfigError("USER_NOT_FOUND")
+        return user
+
     def grant_point(
         self,
         db: Session,
@@ -34,23 +82,7 @@ class RewardService:
         if amount < 0:
             raise InvalidConfigError("INVALID_POINT_AMOUNT")
 
-        q = db.query(User).filter(User.id == user_id)
-        # Avoid races in MySQL/Postgres; SQLite used in tests doesn't support FOR UPDATE.
-        if db.bind and db.bind.dialect.name != "sqlite":
-            q = q.with_for_update()
-        user = q.one_or_none()
-
-        # In test sqlite environments, auto-create a placeholder user so existing tests/demos
-        # that rely on dependency overrides (user_id=1) don't fail.
-        if user is None and db.bind and db.bind.dialect.name == "sqlite":
-            user = User(id=user_id, external_id=f"test-user-{user_id}")
-            db.add(user)
-            db.commit()
-            db.refresh(user)
-
-        if user is None:
-            raise InvalidConfigError("USER_NOT_FOUND")
-
+        user = self._lock_user(db, user_id, commit=commit)
         user.cash_balance = (user.cash_balance or 0) + amount
         entry = UserCashLedger(
             user_id=user_id,
@@ -76,7 +108,7 @@ class RewardService:
         # TODO: Integrate with coupon provider.
         _ = (db, user_id, coupon_type, meta)
 
-    def grant_ticket(self, db: Session, user_id: int, token_type: GameTokenType, amount: int, meta: dict[str, Any] | None = None) -> None:
+    def grant_ticket(self, db: Session, user_id: int, token_type: GameTokenType, amount: int, meta: dict[str, Any] | None = None, commit: bool = True) -> None:
         """Grant game tickets (roulette/dice/lottery) to the user wallet."""
 
         self.wallet_service.grant_tokens(
@@ -87,10 +119,24 @@ class RewardService:
             reason=(meta or {}).get("reason") or "LEVEL_REWARD",
             label=(meta or {}).get("label") or "AUTO_GRANT",
             meta=meta,
+            commit=commit,
         )
 
-    def deliver(self, db: Session, user_id: int, reward_type: str, reward_amount: int, meta: dict[str, Any] | None = None) -> None:
-        """Dispatch reward based on reward_type; no-op for NONE/zero."""
+    def deliver(
+        self,
+        db: Session,
+        user_id: int,
+        reward_type: str,
+        reward_amount: int,
+        meta: dict[str, Any] | None = None,
+        commit: bool = True,
+        defer_game_xp: Callable[[int], None] | None = None,
+    ) -> None:
+        """Dispatch reward based on reward_type; no-op for NONE/zero.
+
+        With ``commit=False`` every write is only flushed so the caller's transaction owns the commit.
+        ``defer_game_xp`` receives game-reward XP instead of applying it inline (outbox mode).
+        """
 
         if reward_amount == 0 or reward_type in {"NONE", "", None}:
             return
@@ -104,29 +150,204 @@ class RewardService:
             season_pass = SeasonPassService()
 
         if reward_type == "POINT":
-            self.grant_point(db, user_id=user_id, amount=reward_amount, reason=meta.get("reason") if meta else None)
+            self.grant_point(db, user_id=user_id, amount=reward_amount, reason=meta.get("reason") if meta else None, commit=commit)
             # 게임 보상 XP는 고정 상수로 부여 (기본 5, 메타에 game_xp가 있으면 우선)
             if xp_from_game_reward and season_pass:
                 reason = (meta or {}).get("reason") if meta else None
-                if reason in {"dice_play", "roulette_spin", "lottery_play"}:
+                if reason in GAME_REWARD_REASONS:
                     xp_amount = (meta or {}).get("game_xp") or 5
-                    season_pass.add_bonus_xp(db, user_id=user_id, xp_amount=xp_amount)
+                    if defer_game_xp is not None:
+                        defer_game_xp(xp_amount)
+                    else:
+                        season_pass.add_bonus_xp(db, user_id=user_id, xp_amount=xp_amount, commit=commit)
             return
         if reward_type == "COUPON":
             coupon_code = meta.get("coupon_type") if meta else "GENERIC"
             self.grant_coupon(db, user_id=user_id, coupon_type=coupon_code, meta=meta)
             return
 
-        ticket_map = {
-            "TICKET_ROULETTE": GameTokenType.ROULETTE_COIN,
-            "TICKET_DICE": GameTokenType.DICE_TOKEN,
-            "TICKET_LOTTERY": GameTokenType.LOTTERY_TICKET,
-            "CC_COIN": GameTokenType.CC_COIN,
-        }
-        if reward_type in ticket_map:
-            token_type = ticket_map[reward_type]
-            self.grant_ticket(db, user_id=user_id, token_type=token_type, amount=reward_amount, meta=meta)
+        if reward_type in TICKET_REWARD_TYPES:
+            token_type = TICKET_REWARD_TYPES[reward_type]
+            self.grant_ticket(db, user_id=user_id, token_type=token_type, amount=reward_amount, meta=meta, commit=commit)
             return
 
         # Unknown reward types are ignored but should be monitored.
         _ = (db, user_id, reward_type, reward_amount, meta)
+
+    def deliver_many(
+        self,
+        db: Session,
+        user_id: int,
+        rewards: Iterable[RewardItem],
+        commit: bool = True,
+        defer_game_xp: Callable[[int], None] | None = None,
+    ) -> None:
+        """Deliver several rewards to one user with grouped writes and a single commit.
+
+        Points become one cash update (one user row lock), tickets one wallet upsert per token type;
+        ledger rows are bulk-inserted, one per reward, with running ``balance_after`` values.
+        All amounts are validated before anything is written.
+        """
+
+        items = [item for item in rewards if item.reward_amount != 0 and item.reward_type not in {"NONE", "", None}]
+        points = [item for item in items if item.reward_type == "POINT"]
+        tickets: dict[GameTokenType, list[RewardItem]] = defaultdict(list)
+        for item in items:
+            if item.reward_type in TICKET_REWARD_TYPES:
+                tickets[TICKET_REWARD_TYPES[item.reward_type]].append(item)
+        if any(item.reward_amount < 0 for item in points):
+            raise InvalidConfigError("INVALID_POINT_AMOUNT")
+        if any(item.reward_amount < 0 for group in tickets.values() for item in group):
+            raise InvalidConfigError("INVALID_TOKEN_AMOUNT")
+
+        now = datetime.utcnow()
+        if points:
+            user = self._lock_user(db, user_id, commit=False)
+            balance = int(user.cash_balance or 0)
+            rows = []
+            for item in points:
+                balance += item.reward_amount
+                rows.append(
+                    {
+                        "user_id": user_id,
+                        "delta": item.reward_amount,
+                        "balance_after": balance,
+                        "reason": (item.meta or {}).get("reason") or "GRANT",
+                        "label": (item.meta or {}).get("label"),
+                        "meta_json": dict(item.meta or {}),
+                        "created_at": now,
+                    }
+                )
+            user.cash_balance = balance
+            db.add(user)
+            db.execute(insert(UserCashLedger), rows)
+
+        for token_type, group in tickets.items():
+            self.wallet_service.grant_tokens_batch(
+                db,
+                user_id=user_id,
+                token_type=token_type,
+                grants=[
+                    (
+                        item.reward_amount,
+                        (item.meta or {}).get("reason") or "LEVEL_REWARD",
+                        (item.meta or {}).get("label") or "AUTO_GRANT",
+                        item.meta,
+                    )
+                    for item in group
+                ],
+                commit=False,
+            )
+
+        for item in items:
+            if item.reward_type == "COUPON":
+                self.grant_coupon(db, user_id=user_id, coupon_type=(item.meta or {}).get("coupon_type") or "GENERIC", meta=item.meta)
+
+        xp_amount = 0
+        if get_settings().xp_from_game_reward:
+            xp_amount = sum(
+                (item.meta or {}).get("game_xp") or 5 for item in points if (item.meta or {}).get("reason") in GAME_REWARD_REASONS
+            )
+        if xp_amount:
+            if defer_game_xp is not None:
+                defer_game_xp(xp_amount)
+            else:
+                # Lazy import to avoid circular dependency with LevelXPService
+                from app.services.season_pass_service import SeasonPassService  # pylint: disable=import-outside-toplevel
+
+                SeasonPassService().add_bonus_xp(db, user_id=user_id, xp_amount=xp_amount, commit=False)
+
+        if commit:
+            db.commit()
+        else:
+            db.flush()
+
+    def deliver_bulk(self, db: Session, rewards_by_user: dict[int, Sequence[RewardItem]]) -> None:
+        """``deliver_many`` for many users at once, with writes grouped across users. Flushes only.
+
+        Points take one locking read of the users, one ``UPDATE user SET cash_balance = CASE id ...`` and one
+        cash-ledger INSERT; tickets go through ``GameWalletService.grant_tokens_bulk``.
+        """
+
+        points: dict[int, list[RewardItem]] = defaultdict(list)
+        tickets: dict[tuple[int, GameTokenType], list[RewardItem]] = defaultdict(list)
+        coupons: list[tuple[int, RewardItem]] = []
+        for user_id, rewards in rewards_by_user.items():
+            for item in rewards:
+                if item.reward_amount == 0 or item.reward_type in {"NONE", "", None}:
+                    continue
+                if item.reward_type == "POINT":
+                    points[user_id].append(item)
+                elif item.reward_type in TICKET_REWARD_TYPES:
+                    tickets[(user_id, TICKET_REWARD_TYPES[item.reward_type])].append(item)
+                elif item.reward_type == "COUPON":
+                    coupons.append((user_id, item))
+        if any(item.reward_amount < 0 for group in points.values() for item in group):
+            raise InvalidConfigError("INVALID_POINT_AMOUNT")
+        if any(item.reward_amount < 0 for group in tickets.values() for item in group):
+            raise InvalidConfigError("INVALID_TOKEN_AMOUNT")
+
+        now = datetime.utcnow()
+        if points:
+            users = User.__table__
+            stmt = select(users.c.id, users.c.cash_balance).where(users.c.id.in_(list(points)))
+            if db.get_bind().dialect.name != "sqlite":
+                stmt = stmt.with_for_update()
+            balances = {row.id: int(row.cash_balance or 0) for row in db.execute(stmt)}
+            if len(balances) != len(points):
+                raise InvalidConfigError("USER_NOT_FOUND")
+            rows = []
+            for user_id, group in points.items():
+                for item in group:
+                    balances[user_id] += item.reward_amount
+                    rows.append(
+                        {
+                            "user_id": user_id,
+                            "delta": item.reward_amount,
+                            "balance_after": balances[user_id],
+                            "reason": (item.meta or {}).get("reason") or "GRANT",
+                            "label": (item.meta or {}).get("label"),
+                            "meta_json": dict(item.meta or {}),
+                            "created_at": now,
+                        }
+                    )
+            db.execute(
+                update(users)
+                .where(users.c.id.in_(list(balances)))
+                .values(cash_balance=case(balances, value=users.c.id), updated_at=now)
+            )
+            db.execute(insert(UserCashLedger), rows)
+            for obj in list(db.identity_map.values()):
+                if isinstance(obj, User) and obj.id in balances:
+                    set_committed_value(obj, "cash_balance", balances[obj.id])
+
+        self.wallet_service.grant_tokens_bulk(
+            db,
+            {
+                key: [
+                    (
+                        item.reward_amount,
+                        (item.meta or {}).get("reason") or "LEVEL_REWARD",
+                        (item.meta or {}).get("label") or "AUTO_GRANT",
+                        item.meta,
+                    )
+                    for item in group
+                ]
+                for key, group in tickets.items()
+            },
+        )
+
+        for user_id, item in coupons:
+            self.grant_coupon(db, user_id=user_id, coupon_type=(item.meta or {}).get("coupon_type") or "GENERIC", meta=item.meta)
+
+        if get_settings().xp_from_game_reward:
+            for user_id, group in points.items():
+                xp_amount = sum(
+                    (item.meta or {}).get("game_xp") or 5 for item in group if (item.meta or {}).get("reason") in GAME_REWARD_REASONS
+                )
+                if xp_amount:
+                    # Lazy import to avoid circular dependency with LevelXPService
+                    from app.services.season_pass_service import SeasonPassService  # pylint: disable=import-outside-toplevel
+
+                    SeasonPassService().add_bonus_xp(db, user_id=user_id, xp_amount=xp_amount, commit=False)
+        db.flush()
@@ -1,24 +1,59 @@
 """Roulette service implementing status and play flows."""
+from dataclasses import dataclass
 from datetime import date, datetime
-import random
-import time
 
-from sqlalchemy import func, select
-from sqlalchemy.exc import DBAPIError
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
-from app.core.exceptions import InvalidConfigError, LockAcquisitionError
+from app.core.exceptions import InvalidConfigError
 from app.models.feature import FeatureType
 from app.models.game_wallet import GameTokenType
 from app.models.roulette import RouletteConfig, RouletteLog, RouletteSegment
 from app.schemas.roulette import RoulettePlayResponse, RouletteStatusResponse
+from app.services.config_snapshot import VersionedSnapshotCache
 from app.services.feature_service import FeatureService
-from app.services.game_common import GamePlayContext, log_game_play
+from app.services.game_common import (
+    MAX_PLAY_BATCH,
+    GamePlayContext,
+    aggregate_rewards,
+    game_xp_deferrer,
+    log_game_play_many,
+    play_unit_of_work,
+    record_internal_wins,
+)
 from app.services.game_wallet_service import GameWalletService
-from app.services.reward_service import RewardService
-from app.services.season_pass_service import SeasonPassService
+from app.services.play_counter_service import PlayCounterService
+from app.services.play_idempotency_service import PlayIdempotencyService
+from app.services.reward_service import RewardItem, RewardService
 from app.services.vault_service import VaultService
+from app.services.weighted_sampler import AliasSampler
+
+
+@dataclass(frozen=True)
+class RouletteSegmentSnapshot:
+    """Immutable copy of a roulette segment, safe to share across requests."""
+
+    id: int
+    slot_index: int
+    label: str
+    reward_type: str
+    reward_amount: int
+    weight: int
+    is_jackpot: bool
+
+
+@dataclass(frozen=True)
+class RouletteConfigSnapshot:
+    """Validated segments of a roulette config at a specific version."""
+
+    config_id: int
+    version: int
+    segments: tuple[RouletteSegmentSnapshot, ...]
+    sampler: AliasSampler[RouletteSegmentSnapshot]
+
+
+_snapshot_cache: VersionedSnapshotCache[RouletteConfigSnapshot] = VersionedSnapshotCache()
 
 
 class RouletteService:
@@ -30,8 +65,9 @@ class RouletteService:
         self.feature_service = FeatureService()
         self.reward_service = RewardService()
         self.wallet_service = GameWalletService()
-        self.season_pass_service = SeasonPassService()
         self.vault_service = VaultService()
+        self.play_counter_service = PlayCounterService()
+        self.idempotency_service = PlayIdempotencyService()
 
     def _seed_default_segments(self, db: Session, config_id: int) -> list[RouletteSegment]:
         """Ensure six default segments exist for the given config (TEST_MODE bootstrap)."""
@@ -69,15 +105,10 @@ class RouletteService:
             raise InvalidConfigError("ROULETTE_CONFIG_MISSING")
         return config
 
-    def _get_segments(self, db: Session, config_id: int, lock: bool = False) -> list[RouletteSegment]:
+    def _get_segments(self, db: Session, config_id: int) -> list[RouletteSegment]:
         settings = get_settings()
         stmt = select(RouletteSegment).where(RouletteSegment.config_id == config_id).order_by(RouletteSegment.slot_index)
-        if lock and db.bind and db.bind.dialect.name != "sqlite":
-            stmt = stmt.with_for_update()
-        try:
-            segments = db.execute(stmt).scalars().all()
-        except DBAPIError as exc:
-            raise LockAcquisitionError("ROULETTE_LOCK_FAILED") from exc
+        segments = db.execute(stmt).scalars().all()
         if len(segments) == 0 and settings.test_mode:
             return self._seed_default_segments(db, config_id)
         if len(segments) != 6:
@@ -90,20 +121,41 @@ class RouletteService:
             raise InvalidConfigError("INVALID_ROULETTE_CONFIG")
         return segments
 
+    def _get_snapshot(self, db: Session, config: RouletteConfig) -> RouletteConfigSnapshot:
+        """Return the immutable segment snapshot for the config's current version (no row locks)."""
+
+        version = int(config.version or 1)
+
+        def _build() -> RouletteConfigSnapshot:
+            segments = tuple(
+                RouletteSegmentSnapshot(
+                    id=seg.id,
+                    slot_index=seg.slot_index,
+                    label=seg.label,
+                    reward_type=seg.reward_type,
+                    reward_amount=seg.reward_amount,
+                    weight=seg.weight,
+                    is_jackpot=bool(seg.is_jackpot),
+                )
+                for seg in self._get_segments(db, config.id)
+            )
+            return RouletteConfigSnapshot(
+                config_id=config.id,
+                version=version,
+                segments=segments,
+                sampler=AliasSampler(segments, [seg.weight for seg in segments]),
+            )
+
+        return _snapshot_cache.get_or_build(db, config.id, version, _build)
+
     def get_status(self, db: Session, user_id: int, today: date) -> RouletteStatusResponse:
         self.feature_service.validate_feature_active(db, today, FeatureType.ROULETTE)
         config = self._get_today_config(db)
         token_type = GameTokenType.ROULETTE_COIN
         token_balance = self.wallet_service.get_balance(db, user_id, token_type)
-        segments = self._get_segments(db, config.id)
+        segments = list(self._get_snapshot(db, config).segments)
 
-        today_spins = db.execute(
-            select(func.count()).select_from(RouletteLog).where(
-                RouletteLog.user_id == user_id,
-                RouletteLog.config_id == config.id,
-                func.date(RouletteLog.created_at) == today,
-            )
-        ).scalar_one()
+        today_spins = self.play_counter_service.get_today(db, user_id, FeatureType.ROULETTE.value, today)
         # Daily cap removed: use 0 to denote unlimited.
         unlimited = 0
         remaining = 0
@@ -120,115 +172,123 @@ class RouletteService:
             feature_type=FeatureType.ROULETTE,
         )
 
-    def play(self, db: Session, user_id: int, now: date | datetime) -> RoulettePlayResponse:
+    def play(self, db: Session, user_id: int, now: date | datetime, count: int = 1, request_id: str | None = None) -> RoulettePlayResponse:
+        """Spin ``count`` times in one transaction (one wallet update, bulk logs, one grant per reward type)."""
+
         today = now.date() if isinstance(now, datetime) else now
+        if count < 1 or count > MAX_PLAY_BATCH:
+            raise InvalidConfigError("INVALID_PLAY_COUNT")
+        # A retried request (same Idempotency-Key) gets the original result; nothing is consumed twice.
+        replayed = self.idempotency_service.replay(db, user_id, FeatureType.ROULETTE.value, request_id, RoulettePlayResponse)
+        if replayed is not None:
+            return replayed
         self.feature_service.validate_feature_active(db, today, FeatureType.ROULETTE)
         config = self._get_today_config(db)
         token_type = GameTokenType.ROULETTE_COIN
-        segments = None
-        for attempt in range(3):
-            try:
-                segments = self._get_segments(db, config.id, lock=True)
-                break
-            except LockAcquisitionError:
-                if attempt == 2:
-                    raise
-                time.sleep(0.05)
-        assert segments is not None
-
-        today_spins = db.execute(
-            select(func.count()).select_from(RouletteLog).where(
-                RouletteLog.user_id == user_id,
-                RouletteLog.config_id == config.id,
-                func.date(RouletteLog.created_at) == today,
-            )
-        ).scalar_one()
-
-        weighted_segments = []
-        for seg in segments:
-            weighted_segments.extend([seg] * max(seg.weight, 0))
-        chosen = random.choice(weighted_segments)
-
-        _, consumed_trial = self.wallet_service.require_and_consume_token(
-            db,
-            user_id,
-            token_type,
-            amount=1,
-            reason="ROULETTE_PLAY",
-            label=chosen.label,
-            meta={"segment_id": getattr(chosen, "id", None)},
-        )
+        # Segments are immutable per config version, so spins never lock roulette_segment rows.
+        snapshot = self._get_snapshot(db, config)
+        results = [snapshot.sampler.sample() for _ in range(count)]
 
-        log_entry = RouletteLog(
-            user_id=user_id,
-            config_id=config.id,
-            segment_id=chosen.id,
-            reward_type=chosen.reward_type,
-            reward_amount=chosen.reward_amount,
+        settings = get_settings()
+        trial_to_vault = bool(getattr(settings, "enable_trial_payout_to_vault", False))
+        xp_award = self.BASE_GAME_XP
+        ctx = GamePlayContext(
+            user_id=user_id, feature_type=FeatureType.ROULETTE.value, today=today, request_id=request_id
         )
-        db.add(log_entry)
-        db.commit()
-        db.refresh(log_entry)
-
         total_earn = 0
-        # Vault Phase 1: idempotent game accrual (safe-guarded by feature flag).
-        total_earn += self.vault_service.record_game_play_earn_event(
-            db,
-            user_id=user_id,
-            game_type=FeatureType.ROULETTE.value,
-            game_log_id=log_entry.id,
-            token_type=token_type.value,
-            outcome=None,
-            payout_raw={
-                "segment_id": chosen.id,
-                "reward_type": chosen.reward_type,
-                "reward_amount": chosen.reward_amount,
-            },
-        )
-
-        settings = get_settings()
-        if consumed_trial and bool(getattr(settings, "enable_trial_payout_to_vault", False)):
-            total_earn += self.vault_service.record_trial_result_earn_event(
+        # Wallet, log, vault, event log and reward share one transaction; side effects run after commit.
+        with play_unit_of_work(ctx, db):
+            _, trial_flags = self.wallet_service.consume_tokens_for_plays(
                 db,
-                user_id=user_id,
-                game_type=FeatureType.ROULETTE.value,
-                game_log_id=log_entry.id,
-                token_type=token_type.value,
-                reward_type=chosen.reward_type,
-                reward_amount=chosen.reward_amount,
-                payout_raw={"segment_id": chosen.id},
+                user_id,
+                token_type,
+                labels=[chosen.label for chosen in results],
+                reason="ROULETTE_PLAY",
+                metas=[{"segment_id": chosen.id} for chosen in results],
+                commit=False,
             )
 
-        xp_award = self.BASE_GAME_XP
-        ctx = GamePlayContext(user_id=user_id, feature_type=FeatureType.ROULETTE.value, today=today)
-        log_game_play(
-            ctx,
-            db,
-            {
-                "segment_id": chosen.id,
-                "reward_type": chosen.reward_type,
-                "reward_amount": chosen.reward_amount,
-                "label": chosen.label,
-                "xp_from_reward": xp_award,
-            },
-        )
+            log_entries = [
+                RouletteLog(
+                    user_id=user_id,
+                    config_id=config.id,
+                    segment_id=chosen.id,
+                    reward_type=chosen.reward_type,
+                    reward_amount=chosen.reward_amount,
+                )
+                for chosen in results
+            ]
+            db.add_all(log_entries)
+            db.flush()
+
+            payouts = []
+            for chosen, log_entry, consumed_trial in zip(results, log_entries, trial_flags):
+                # Vault Phase 1: idempotent game accrual (safe-guarded by feature flag).
+                total_earn += self.vault_service.record_game_play_earn_event(
+                    db,
+                    user_id=user_id,
+                    game_type=FeatureType.ROULETTE.value,
+                    game_log_id=log_entry.id,
+                    token_type=token_type.value,
+                    outcome=None,
+                    payout_raw={
+                        "segment_id": chosen.id,
+                        "reward_type": chosen.reward_type,
+                        "reward_amount": chosen.reward_amount,
+                    },
+                    commit=False,
+                )
+
+                # Trial plays may route their reward into Vault instead of direct payout.
+                if consumed_trial and trial_to_vault:
+                    total_earn += self.vault_service.record_trial_result_earn_event(
+                        db,
+                        user_id=user_id,
+                        game_type=FeatureType.ROULETTE.value,
+                        game_log_id=log_entry.id,
+                        token_type=token_type.value,
+                        reward_type=chosen.reward_type,
+                        reward_amount=chosen.reward_amount,
+                        payout_raw={"segment_id": chosen.id},
+                        commit=False,
+                    )
+                else:
+                    payouts.append((chosen.reward_type, chosen.reward_amount, xp_award))
 
-        # Deliver reward according to segment definition (unless trial routing is enabled).
-        if not (consumed_trial and bool(getattr(settings, "enable_trial_payout_to_vault", False))):
-            self.reward_service.deliver(
+            log_game_play_many(
+                ctx,
+                db,
+                [
+                    {
+                        "segment_id": chosen.id,
+                        "reward_type": chosen.reward_type,
+                        "reward_amount": chosen.reward_amount,
+                        "label": chosen.label,
+                        "xp_from_reward": xp_award,
+                    }
+                    for chosen in results
+                ],
+            )
+
+            # Deliver rewards according to segment definitions, one grant per reward type.
+            self.reward_service.deliver_many(
                 db,
                 user_id=user_id,
-                reward_type=chosen.reward_type,
-                reward_amount=chosen.reward_amount,
-                meta={"reason": "roulette_spin", "segment_id": chosen.id, "game_xp": xp_award},
+                rewards=[
+                    RewardItem(reward_type, reward_amount, {"reason": "roulette_spin", "game_xp": game_xp, **({"segment_id": results[0].id} if count == 1 else {"plays": count})})
+                    for reward_type, (reward_amount, game_xp) in aggregate_rewards(payouts).items()
+                ],
+                commit=False,
+                defer_game_xp=game_xp_deferrer(ctx, db),
             )
-        if chosen.reward_amount > 0:
-            self.season_pass_service.maybe_add_internal_win_stamp(db, user_id=user_id, now=today)
-        season_pass = None  # 게임 1회당 자동 스탬프 발급을 중단하고, 조건 달성 시 별도 로직으로 처리
-
-        return RoulettePlayResponse(
-            result="OK",
-            segment=chosen,
-            season_pass=season_pass,
-            vault_earn=total_earn,
-        )
+            record_internal_wins(ctx, db, sum(1 for chosen in results if chosen.reward_amount > 0))
+            season_pass = None  # 게임 1회당 자동 스탬프 발급을 중단하고, 조건 달성 시 별도 로직으로 처리
+
+            ctx.response = RoulettePlayResponse(
+                result="OK",
+                segment=results[-1],
+                results=list(results),
+                season_pass=season_pass,
+                vault_earn=total_earn,
+            )
+        return ctx.response
@@ -0,0 +1,139 @@
+"""Process-local cache of the active season pass and its compiled level table.
+
+Season and level rows change a few times per season, but every stamp/XP grant used to
+re-query both. The season lookup is cached per date and each season's levels are compiled
+once per (season_id, updated_at) version into a table sorted by required_xp, so level-up
+detection is a ``bisect`` instead of a query.
+
+Admin season edits call ``season_pass_cache.invalidate()``. Other workers, and rows edited
+with raw SQL, pick up changes once an entry's TTL expires.
+"""
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from bisect import bisect_right
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import date, datetime
+
+from sqlalchemy.orm import Session
+
+DEFAULT_TTL_SECONDS = 60.0
+
+
+@dataclass(frozen=True)
+class SeasonSnapshot:
+    id: int
+    season_name: str
+    start_date: date
+    end_date: date
+    max_level: int
+    base_xp_per_stamp: int
+    is_active: bool
+    updated_at: datetime | None
+
+    @classmethod
+    def from_row(cls, row) -> "SeasonSnapshot":
+        return cls(
+            id=row.id,
+            season_name=row.season_name,
+            start_date=row.start_date,
+            end_date=row.end_date,
+            max_level=row.max_level,
+            base_xp_per_stamp=row.base_xp_per_stamp,
+            is_active=bool(row.is_active),
+            updated_at=row.updated_at,
+        )
+
+
+@dataclass(frozen=True)
+class SeasonLevelSnapshot:
+    level: int
+    required_xp: int
+    reward_type: str
+    reward_amount: int
+    auto_claim: bool
+
+    @classmethod
+    def from_row(cls, row) -> "SeasonLevelSnapshot":
+        return cls(
+            level=row.level,
+            required_xp=row.required_xp,
+            reward_type=row.reward_type,
+            reward_amount=row.reward_amount,
+            auto_claim=bool(row.auto_claim),
+        )
+
+
+@dataclass(frozen=True)
+class SeasonLevelTable:
+    """A season's levels, ordered by level, plus their required_xp thresholds in sorted order."""
+
+    levels: tuple[SeasonLevelSnapshot, ...]
+    _by_xp: tuple[SeasonLevelSnapshot, ...] = field(repr=False)
+    _thresholds: tuple[int, ...] = field(repr=False)
+    _by_level: dict[int, SeasonLevelSnapshot] = field(repr=False)
+
+    @classmethod
+    def compile(cls, rows: Sequence) -> "SeasonLevelTable":
+        levels = tuple(sorted((SeasonLevelSnapshot.from_row(row) for row in rows), key=lambda lvl: lvl.level))
+        by_xp = tuple(sorted(levels, key=lambda lvl: (lvl.required_xp, lvl.level)))
+        return cls(
+            levels=levels,
+            _by_xp=by_xp,
+            _thresholds=tuple(lvl.required_xp for lvl in by_xp),
+            _by_level={lvl.level: lvl for lvl in levels},
+        )
+
+    def reached(self, xp: int) -> list[SeasonLevelSnapshot]:
+        """Levels whose required XP is met, ordered by level."""
+
+        return sorted(self._by_xp[: bisect_right(self._thresholds, xp)], key=lambda lvl: lvl.level)
+
+    def get(self, level: int) -> SeasonLevelSnapshot | None:
+        return self._by_level.get(level)
+
+    @property
+    def max_required_xp(self) -> int:
+        return self._thresholds[-1] if self._thresholds else 0
+
+
+class SeasonPassCache:
+    """Per-bind cache: active seasons by date, level tables by (season_id, version)."""
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        # Keyed by engine so separate databases (e.g. per-test in-memory SQLite) never share entries.
+        self._by_bind: "weakref.WeakKeyDictionary[object, dict[tuple, tuple[float, object]]]" = weakref.WeakKeyDictionary()
+
+    def _get_or_load(self, db: Session, key: tuple, loader: Callable[[], object], cache_empty: bool = True):
+        bind = db.get_bind()
+        now = time.monotonic()
+        with self._lock:
+            cached = self._by_bind.setdefault(bind, {}).get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        # Loaded outside the lock: concurrent misses may both load, last writer wins with identical data.
+        value = loader()
+        if value or cache_empty:
+            with self._lock:
+                self._by_bind.setdefault(bind, {})[key] = (now + self.ttl_seconds, value)
+        return value
+
+    def seasons_on(self, db: Session, day: date, loader: Callable[[], tuple[SeasonSnapshot, ...]]) -> tuple[SeasonSnapshot, ...]:
+        # "No season" is not cached, so a newly created season is visible immediately.
+        return self._get_or_load(db, ("seasons", day), loader, cache_empty=False)
+
+    def level_table(self, db: Session, season: SeasonSnapshot, loader: Callable[[], SeasonLevelTable]) -> SeasonLevelTable:
+        return self._get_or_load(db, ("levels", season.id, season.updated_at), loader)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._by_bind.clear()
+
+
+season_pass_cache = SeasonPassCache()
@@ -1,13 +1,14 @@
 """Season pass domain service implementation aligned with design docs."""
 from __future__ import annotations
 
+from collections.abc import Callable
 from datetime import date, datetime
-from typing import Iterable
 
 from fastapi import HTTPException, status
-from sqlalchemy import and_, select
+from sqlalchemy import and_, bindparam, select, update
 from sqlalchemy.orm import Session
 
+from app.db.upsert import insert_ignore, insert_ignore_keys, insert_ignore_unless, upsert_increment
 from app.models.season_pass import (
     SeasonPassConfig,
     SeasonPassLevel,
@@ -15,24 +16,53 @@ from app.models.season_pass import (
     SeasonPassRewardLog,
     SeasonPassStampLog,
 )
+from app.models.user_internal_win_counter import UserInternalWinCounter
 from app.schemas.season_pass import SeasonPassStatusResponse
-from app.services.reward_service import RewardService
+from app.services.reward_delivery_queue_service import RewardBatch, RewardDeliveryQueueService
+from app.services.reward_service import RewardItem, RewardService
+from app.services.season_pass_cache import SeasonLevelSnapshot, SeasonLevelTable, SeasonSnapshot, season_pass_cache
+
+
+# Display labels for the default 10-level season; other levels fall back to "<reward_type> <amount>".
+REWARD_LABELS = {
+    1: "룰렛 티켓 1장",
+    2: "주사위 티켓 1장",
+    3: "룰렛 1장 + 주사위 1장",
+    4: "복권 티켓 1장",
+    5: "CC 코인 1개",
+    6: "주사위 2장 + 복권 1장",
+    7: "CC 코인 2개",
+    8: "쿠팡상품권 1만원",
+    9: "CC 포인트 2만",
+    10: "CC 포인트 5만",
+}
 
 
 class SeasonPassService:
     """Encapsulates season pass workflows (status, stamp, claim)."""
 
+    BULK_XP_CHUNK_SIZE = 500
+
     def __init__(self) -> None:
         self.reward_service = RewardService()
+        self.reward_queue = RewardDeliveryQueueService(self.reward_service)
+
+    @staticmethod
+    def _reward_job_key(season_id: int, user_id: int, level: int) -> str:
+        return f"SEASON_PASS:{season_id}:{user_id}:{level}"
 
-    def get_current_season(self, db: Session, now: date | datetime) -> SeasonPassConfig | None:
+    def get_current_season(self, db: Session, now: date | datetime) -> SeasonSnapshot | None:
         """Return the active season for the given date or None if not found."""
 
         today = now.date() if isinstance(now, datetime) else now
-        stmt = select(SeasonPassConfig).where(
-            and_(SeasonPassConfig.start_date <= today, SeasonPassConfig.end_date >= today)
-        )
-        seasons = db.execute(stmt).scalars().all()
+
+        def _load() -> tuple[SeasonSnapshot, ...]:
+            stmt = select(SeasonPassConfig).where(
+                and_(SeasonPassConfig.start_date <= today, SeasonPassConfig.end_date >= today)
+            )
+            return tuple(SeasonSnapshot.from_row(row) for row in db.execute(stmt).scalars().all())
+
+        seasons = season_pass_cache.seasons_on(db, today, _load)
         if not seasons:
             return None
         if len(seasons) > 1:
@@ -42,7 +72,18 @@ class SeasonPassService:
             )
         return seasons[0]
 
-    def get_or_create_progress(self, db: Session, user_id: int, season_id: int) -> SeasonPassProgress:
+    @staticmethod
+    def get_level_table(db: Session, season: SeasonSnapshot) -> SeasonLevelTable:
+        """Return the season's compiled level table (cached per season version)."""
+
+        def _load() -> SeasonLevelTable:
+            return SeasonLevelTable.compile(
+                db.execute(select(SeasonPassLevel).where(SeasonPassLevel.season_id == season.id)).scalars().all()
+            )
+
+        return season_pass_cache.level_table(db, season, _load)
+
+    def get_or_create_progress(self, db: Session, user_id: int, season_id: int, commit: bool = True) -> SeasonPassProgress:
         """Fetch existing progress or create an initial record."""
 
         stmt = select(SeasonPassProgress).where(
@@ -60,69 +101,86 @@ class SeasonPassService:
             total_stamps=0,
         )
         db.add(progress)
-        db.commit()
-        db.refresh(progress)
+        if commit:
+            db.commit()
+            db.refresh(progress)
+        else:
+            db.flush()
         return progress
 
+    def _load_status_row(self, db: Session, user_id: int, season_id: int, today: date) -> tuple[dict, set[int], bool]:
+        """Progress, claimed levels and today's daily stamp for one user in a single query.
+
+        Progress is outer-joined to the user's reward logs (one row per claimed level) and to today's
+        stamp log. A user who has not started the season gets the initial progress values without a
+        row being created; the first stamp/XP grant creates it.
+        """
+
+        progress = SeasonPassProgress.__table__
+        reward_log = SeasonPassRewardLog.__table__
+        stamp_log = SeasonPassStampLog.__table__
+        # "오늘 스탬프"는 일일 체크인(오늘 날짜 period_key)만 인정합니다.
+        stmt = (
+            select(
+                progress.c.current_level,
+                progress.c.current_xp,
+                progress.c.total_stamps,
+                progress.c.last_stamp_date,
+                reward_log.c.level.label("claimed_level"),
+                stamp_log.c.id.label("today_stamp_id"),
+            )
+            .select_from(progress)
+            .outerjoin(
+                reward_log,
+                and_(reward_log.c.user_id == progress.c.user_id, reward_log.c.season_id == progress.c.season_id),
+            )
+            .outerjoin(
+                stamp_log,
+                and_(
+                    stamp_log.c.user_id == progress.c.user_id,
+                    stamp_log.c.season_id == progress.c.season_id,
+                    stamp_log.c.period_key == today.isoformat(),
+                    stamp_log.c.date == today,
+                ),
+            )
+            .where(progress.c.user_id == user_id, progress.c.season_id == season_id)
+        )
+        rows = db.execute(stmt).all()
+        if not rows:
+            return {"current_level": 1, "current_xp": 0, "total_stamps": 0, "last_stamp_date": None}, set(), False
+
+        first = rows[0]
+        values = {
+            "current_level": first.current_level,
+            "current_xp": first.current_xp,
+            "total_stamps": first.total_stamps,
+            "last_stamp_date": first.last_stamp_date,
+        }
+        claimed_levels = {row.claimed_level for row in rows if row.claimed_level is not None}
+        stamped_today = any(row.today_stamp_id is not None for row in rows)
+        return values, claimed_levels, stamped_today
+
     def get_status(self, db: Session, user_id: int, now: date | datetime) -> dict:
-        """Return active season info, progress, levels, and today's stamp flag."""
+        """Return active season info, progress, levels, and today's stamp flag.
+
+        Read-only: season and levels come from the cache, everything per-user from one query.
+        """
 
         season = self.get_current_season(db, now)
         if season is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="NO_ACTIVE_SEASON")
 
-        progress = self.get_or_create_progress(db, user_id=user_id, season_id=season.id)
-        levels = (
-            db.execute(
-                select(SeasonPassLevel).where(SeasonPassLevel.season_id == season.id).order_by(SeasonPassLevel.level)
-            )
-            .scalars()
-            .all()
-        )
-        reward_logs = db.execute(
-            select(SeasonPassRewardLog).where(
-                SeasonPassRewardLog.season_id == season.id, SeasonPassRewardLog.user_id == user_id
-            )
-        ).scalars().all()
-        claimed_levels = {log.level for log in reward_logs}
-
         today = now.date() if isinstance(now, datetime) else now
-        # "오늘 스탬프"는 일일 체크인(오늘 날짜 period_key)만 인정합니다.
-        daily_key = today.isoformat()
-        stamped_today = (
-            db.execute(
-                select(SeasonPassStampLog).where(
-                    SeasonPassStampLog.user_id == user_id,
-                    SeasonPassStampLog.season_id == season.id,
-                    SeasonPassStampLog.period_key == daily_key,
-                    SeasonPassStampLog.date == today,
-                )
-            )
-            .scalars()
-            .first()
-        )
+        progress, claimed_levels, stamped_today = self._load_status_row(db, user_id, season.id, today)
+        level_table = self.get_level_table(db, season)
+        levels = level_table.levels
+        current_xp = progress["current_xp"]
 
-        max_required = max((lvl.required_xp for lvl in levels), default=0)
-        next_level_req = next((lvl.required_xp for lvl in levels if lvl.required_xp > progress.current_xp), max_required)
-
-        reward_labels = {
-            1: "룰렛 티켓 1장",
-            2: "주사위 티켓 1장",
-            3: "룰렛 1장 + 주사위 1장",
-            4: "복권 티켓 1장",
-            5: "CC 코인 1개",
-            6: "주사위 2장 + 복권 1장",
-            7: "CC 코인 2개",
-            8: "쿠팡상품권 1만원",
-            9: "CC 포인트 2만",
-            10: "CC 포인트 5만",
-        }
+        max_required = level_table.max_required_xp
+        next_level_req = next((lvl.required_xp for lvl in levels if lvl.required_xp > current_xp), max_required)
 
         level_payload = []
         for level in levels:
-            is_unlocked = progress.current_xp >= level.required_xp
-            is_claimed = level.level in claimed_levels
-            reward_label = reward_labels.get(level.level, f"{level.reward_type} {level.reward_amount}")
             level_payload.append(
                 {
                     "level": level.level,
@@ -130,9 +188,9 @@ class SeasonPassService:
                     "reward_type": level.reward_type,
                     "reward_amount": level.reward_amount,
                     "auto_claim": level.auto_claim,
-                    "is_unlocked": is_unlocked,
-                    "is_claimed": is_claimed,
-                    "reward_label": reward_label,
+                    "is_unlocked": current_xp >= level.required_xp,
+                    "is_claimed": level.level in claimed_levels,
+                    "reward_label": REWARD_LABELS.get(level.level, f"{level.reward_type} {level.reward_amount}"),
                 }
             )
 
@@ -145,15 +203,9 @@ class SeasonPassService:
                 "max_level": season.max_level,
                 "base_xp_per_stamp": season.base_xp_per_stamp,
             },
-            "progress": {
-                "current_level": progress.current_level,
-                "current_xp": progress.current_xp,
-                "total_stamps": progress.total_stamps,
-                "last_stamp_date": progress.last_stamp_date,
-                "next_level_xp": next_level_req,
-            },
+            "progress": {**progress, "next_level_xp": next_level_req},
             "levels": level_payload,
-            "today": {"date": today, "stamped": stamped_today is not None},
+            "today": {"date": today, "stamped": stamped_today},
         }
 
     def add_stamp(
@@ -165,8 +217,13 @@ class SeasonPassService:
         now: date | datetime | None = None,
         stamp_count: int = 1,
         period_key: str | None = None,
+        once_per_period: bool = False,
     ) -> dict:
-        """Apply stamp(s): prevent duplicates, update XP, level-up, and log rewards."""
+        """Apply stamp(s): prevent duplicates, update XP, level-up, and log rewards.
+
+        Daily check-ins (no ``period_key``) and ``once_per_period`` stamps raise ALREADY_STAMPED_TODAY
+        when the period is already stamped; other period keys accumulate onto the existing stamp log.
+        """
 
         today = (now or date.today())
         if isinstance(today, datetime):
@@ -183,18 +240,21 @@ class SeasonPassService:
 
         xp_to_add = season.base_xp_per_stamp * stamp_count + xp_bonus
         key = period_key or today.isoformat()
-
         # 일일 체크인(period_key=today.isoformat())은 하루 1회만 허용합니다.
-        if key == today.isoformat():
-            already = db.execute(
-                select(SeasonPassStampLog).where(
-                    SeasonPassStampLog.user_id == user_id,
-                    SeasonPassStampLog.season_id == season.id,
-                    SeasonPassStampLog.period_key == key,
-                )
-            ).scalar_one_or_none()
-            if already:
-                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="ALREADY_STAMPED_TODAY")
+        if not self._write_stamp_log(
+            db,
+            user_id=user_id,
+            season_id=season.id,
+            progress_id=progress.id,
+            source_feature_type=source_feature_type,
+            period_key=key,
+            today=today,
+            stamp_count=stamp_count,
+            xp_earned=xp_to_add,
+            once=once_per_period or key == today.isoformat(),
+        ):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="ALREADY_STAMPED_TODAY")
+
         previous_level = progress.current_level
         # Level 1 is the initial state; it should not be treated as a reward level.
         reward_baseline_level = max(previous_level, 1)
@@ -202,95 +262,25 @@ class SeasonPassService:
         progress.total_stamps += stamp_count
         progress.last_stamp_date = today
 
-        achieved_levels = self._eligible_levels(db, season.id, progress.current_xp)
+        achieved_levels = self.get_level_table(db, season).reached(progress.current_xp)
         new_levels = [level for level in achieved_levels if level.level > reward_baseline_level]
-        rewards: list[dict] = []
+        rewards, deliveries = self._claim_auto_levels(
+            db,
+            user_id=user_id,
+            season_id=season.id,
+            progress_id=progress.id,
+            levels=new_levels,
+            meta={"source": "SEASON_PASS_AUTO_CLAIM", "trigger": "STAMP", "stamp_count": stamp_count, "xp_added": xp_to_add, "feature": source_feature_type},
+        )
 
-        for level in new_levels:
-            reward_logged = db.execute(
-                select(SeasonPassRewardLog).where(
-                    SeasonPassRewardLog.user_id == user_id,
-                    SeasonPassRewardLog.season_id == season.id,
-                    SeasonPassRewardLog.level == level.level,
-                )
-            ).scalar_one_or_none()
-            if reward_logged:
-                continue
-
-            if level.auto_claim:
-                reward_log = SeasonPassRewardLog(
-                    user_id=user_id,
-                    season_id=season.id,
-                    progress_id=progress.id,
-                    level=level.level,
-                    reward_type=level.reward_type,
-                    reward_amount=level.reward_amount,
-                    claimed_at=datetime.utcnow(),
-                )
-                db.add(reward_log)
-                reward_meta = {
-                    "season_id": season.id,
-                    "level": level.level,
-                    "source": "SEASON_PASS_AUTO_CLAIM",
-                    "trigger": "STAMP",
-                    "stamp_count": stamp_count,
-                    "xp_added": xp_to_add,
-                    "feature": source_feature_type,
-                }
-                try:
-                    self.reward_service.deliver(
-                        db,
-                        user_id=user_id,
-                        reward_type=level.reward_type,
-                        reward_amount=level.reward_amount,
-                        meta=reward_meta,
-                    )
-                except Exception:
-                    # Reward delivery failure should not block stamp flow; rely on logs for retry.
-                    pass
-                rewards.append(
-                    {
-                        "level": level.level,
-                        "reward_type": level.reward_type,
-                        "reward_amount": level.reward_amount,
-                        "auto_claim": level.auto_claim,
-                        "claimed_at": reward_log.claimed_at,
-                    }
-                )
+        # Multi-level jumps deliver once; failures are queued for the reward delivery worker.
+        # The stamp commit below persists rewards (or their retry jobs) with the claim logs.
+        self.reward_queue.deliver_or_enqueue(db, user_id, "SEASON_PASS_AUTO_CLAIM", deliveries, commit=False)
 
         progress.current_level = max(progress.current_level, previous_level)
         if achieved_levels:
             progress.current_level = max(progress.current_level, max(level.level for level in achieved_levels))
 
-        existing_stamp = db.execute(
-            select(SeasonPassStampLog).where(
-                SeasonPassStampLog.user_id == user_id,
-                SeasonPassStampLog.season_id == season.id,
-                SeasonPassStampLog.source_feature_type == source_feature_type,
-                SeasonPassStampLog.period_key == key,
-            )
-        ).scalar_one_or_none()
-
-        if existing_stamp:
-            existing_stamp.stamp_count += stamp_count
-            existing_stamp.xp_earned += xp_to_add
-            existing_stamp.date = today
-            stamp_log = existing_stamp
-        else:
-            stamp_log = SeasonPassStampLog(
-                user_id=user_id,
-                season_id=season.id,
-                progress_id=progress.id,
-                date=today,
-                period_key=key,
-                stamp_count=stamp_count,
-                source_feature_type=source_feature_type,
-                xp_earned=xp_to_add,
-                reward_type="XP",
-                reward_amount=xp_to_add,
-            )
-            db.add(stamp_log)
-
         db.commit()
         db.refresh(progress)
 
@@ -303,6 +293,52 @@ class SeasonPassService:
             "rewards": rewards,
         }
 
+    @staticmethod
+    def _write_stamp_log(
+        db: Session,
+        *,
+        user_id: int,
+        season_id: int,
+        progress_id: int,
+        source_feature_type: str,
+        period_key: str,
+        today: date,
+        stamp_count: int,
+        xp_earned: int,
+        once: bool,
+    ) -> bool:
+        """Write the stamp log in one statement on ``uq_stamp_user_season_period``; False if already stamped.
+
+        ``once`` inserts or skips (the affected-row count is the "already stamped" decision); a daily
+        check-in also skips when another feature stamped the same day, which the unique key does not
+        cover. Otherwise the stamp accumulates onto an existing row.
+        """
+
+        table = SeasonPassStampLog.__table__
+        keys = {"user_id": user_id, "season_id": season_id, "source_feature_type": source_feature_type, "period_key": period_key}
+        insert_values = {"progress_id": progress_id, "reward_type": "XP", "reward_amount": xp_earned}
+        if not once:
+            upsert_increment(
+                db,
+                table,
+                keys=keys,
+                increments={"stamp_count": stamp_count, "xp_earned": xp_earned},
+                values={"date": today},
+                insert_values=insert_values,
+            )
+            return True
+
+        row = {**keys, **insert_values, "date": today, "stamp_count": stamp_count, "xp_earned": xp_earned}
+        if period_key != today.isoformat():
+            return insert_ignore(db, table, [row], keys=list(keys)) == 1
+        return insert_ignore_unless(
+            db,
+            table,
+            row,
+            keys=list(keys),
+            unless=[table.c.user_id == user_id, table.c.season_id == season_id, table.c.period_key == period_key],
+        )
+
     def maybe_add_stamp(
         self,
         db: Session,
@@ -312,6 +348,7 @@ class SeasonPassService:
         now: date | datetime | None = None,
         stamp_count: int = 1,
         period_key: str | None = None,
+        once_per_period: bool = False,
     ) -> dict | None:
         """Best-effort stamp: ignore no-season or already-stamped errors."""
 
@@ -324,12 +361,38 @@ class SeasonPassService:
                 now=now,
                 stamp_count=stamp_count,
                 period_key=period_key,
+                once_per_period=once_per_period,
             )
         except HTTPException as exc:
             if exc.detail in {"ALREADY_STAMPED_TODAY", "NO_ACTIVE_SEASON"}:
                 return None
             raise
 
+    def record_internal_wins(self, db: Session, user_id: int, wins: int, now: date | datetime | None = None) -> None:
+        """Add ``wins`` to the user's counter for the active season (no commit; no-op without a season)."""
+
+        if wins <= 0:
+            return
+        season = self.get_current_season(db, now or date.today())
+        if season is None:
+            return
+        upsert_increment(
+            db,
+            UserInternalWinCounter.__table__,
+            keys={"user_id": user_id, "season_id": season.id},
+            increments={"win_count": wins},
+            values={"updated_at": datetime.utcnow()},
+        )
+
+    def get_internal_win_count(self, db: Session, user_id: int, season_id: int) -> int:
+        count = db.execute(
+            select(UserInternalWinCounter.win_count).where(
+                UserInternalWinCounter.user_id == user_id,
+                UserInternalWinCounter.season_id == season_id,
+            )
+        ).scalar_one_or_none()
+        return int(count or 0)
+
     def maybe_add_internal_win_stamp(
         self,
         db: Session,
@@ -337,24 +400,16 @@ class SeasonPassService:
         threshold: int = 50,
         now: date | datetime | None = None,
     ) -> dict | None:
-        """Award one stamp when total internal 게임 승리 횟수 >= threshold (once per season)."""
+        """Award one stamp when the season's internal 게임 승리 횟수 >= threshold (once per season)."""
 
         today = (now or date.today())
         if isinstance(today, datetime):
             today = today.date()
 
-        progress = self.get_internal_win_progress(db, user_id=user_id, threshold=threshold, now=today)
-        if progress["total_wins"] < threshold:
+        season = self.get_current_season(db, today)
+        if season is None:
             return None
-
-        existing = db.execute(
-            select(SeasonPassStampLog).where(
-                SeasonPassStampLog.user_id == user_id,
-                SeasonPassStampLog.source_feature_type == "INTERNAL_WIN_50",
-                SeasonPassStampLog.period_key == "INTERNAL_WIN_50",
-            )
-        ).scalar_one_or_none()
-        if existing:
+        if self.get_internal_win_count(db, user_id=user_id, season_id=season.id) < threshold:
             return None
 
         return self.maybe_add_stamp(
@@ -365,36 +420,20 @@ class SeasonPassService:
             now=today,
             stamp_count=1,
             period_key="INTERNAL_WIN_50",
+            once_per_period=True,
         )
 
     def get_internal_win_progress(
         self, db: Session, user_id: int, threshold: int = 50, now: date | datetime | None = None
     ) -> dict:
-        """Return current internal win count and remaining to threshold."""
-
-        from sqlalchemy import func
-        from app.models.dice import DiceLog
-        from app.models.roulette import RouletteLog
-        from app.models.lottery import LotteryLog
+        """Return the active season's internal win count and remaining to threshold."""
 
         today = (now or date.today())
         if isinstance(today, datetime):
             today = today.date()
 
-        dice_wins = db.execute(
-            select(func.count()).select_from(DiceLog).where(DiceLog.user_id == user_id, DiceLog.result == "WIN")
-        ).scalar_one()
-        roulette_wins = db.execute(
-            select(func.count()).select_from(RouletteLog).where(
-                RouletteLog.user_id == user_id, RouletteLog.reward_amount > 0
-            )
-        ).scalar_one()
-        lottery_wins = db.execute(
-            select(func.count()).select_from(LotteryLog).where(
-                LotteryLog.user_id == user_id, LotteryLog.reward_amount > 0
-            )
-        ).scalar_one()
-        total_wins = dice_wins + roulette_wins + lottery_wins
+        season = self.get_current_season(db, today)
+        total_wins = self.get_internal_win_count(db, user_id=user_id, season_id=season.id) if season else 0
         remaining = max(threshold - total_wins, 0)
         return {"total_wins": total_wins, "threshold": threshold, "remaining": remaining}
 
@@ -410,11 +449,7 @@ class SeasonPassService:
         if progress.current_level < level:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="LEVEL_NOT_REACHED")
 
-        level_row = db.execute(
-            select(SeasonPassLevel).where(
-                SeasonPassLevel.season_id == season.id, SeasonPassLevel.level == level
-            )
-        ).scalar_one_or_none()
+        level_row = self.get_level_table(db, season).get(level)
         if level_row is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="LEVEL_NOT_FOUND")
         if level_row.auto_claim:
@@ -445,17 +480,14 @@ class SeasonPassService:
             "level": level,
             "source": "SEASON_PASS_MANUAL_CLAIM",
         }
-        try:
-            self.reward_service.deliver(
-                db,
-                user_id=user_id,
-                reward_type=level_row.reward_type,
-                reward_amount=level_row.reward_amount,
-                meta=reward_meta,
-            )
-        except Exception:
-            # Manual claim should still record the claim even if delivery fails; retry externally.
-            pass
+        # Manual claim still records the claim if delivery fails; the grant is queued for retry.
+        self.reward_queue.deliver_or_enqueue(
+            db,
+            user_id,
+            "SEASON_PASS_MANUAL_CLAIM",
+            [(self._reward_job_key(season.id, user_id, level), [RewardItem(level_row.reward_type, level_row.reward_amount, reward_meta)])],
+            commit=False,
+        )
         db.commit()
         db.refresh(reward_log)
 
@@ -466,14 +498,77 @@ class SeasonPassService:
             "claimed_at": reward_log.claimed_at,
         }
 
-    def _eligible_levels(self, db: Session, season_id: int, current_xp: int) -> Iterable[SeasonPassLevel]:
-        """Return levels whose required XP is met."""
+    def _claim_auto_levels(
+        self,
+        db: Session,
+        user_id: int,
+        season_id: int,
+        progress_id: int,
+        levels: list[SeasonLevelSnapshot],
+        meta: dict,
+    ) -> tuple[list[dict], list[RewardBatch]]:
+        """Write reward logs for newly reached auto-claim levels; returns (reward payloads, deliveries).
+
+        One SELECT loads the already-claimed set and one INSERT writes the rest, however many levels
+        were jumped. uq_reward_user_season_level backs the check against concurrent claims.
+        """
+
+        auto_levels = [level for level in levels if level.auto_claim]
+        if not auto_levels:
+            return [], []
+        claimed = set(
+            db.execute(
+                select(SeasonPassRewardLog.level).where(
+                    SeasonPassRewardLog.user_id == user_id,
+                    SeasonPassRewardLog.season_id == season_id,
+                    SeasonPassRewardLog.level.in_([level.level for level in auto_levels]),
+                )
+            ).scalars()
+        )
+        to_claim = [level for level in auto_levels if level.level not in claimed]
+        if not to_claim:
+            return [], []
 
-        return db.execute(
-            select(SeasonPassLevel)
-            .where(SeasonPassLevel.season_id == season_id, SeasonPassLevel.required_xp <= current_xp)
-            .order_by(SeasonPassLevel.level)
-        ).scalars().all()
+        claimed_at = datetime.utcnow()
+        inserted = insert_ignore_keys(
+            db,
+            SeasonPassRewardLog.__table__,
+            [
+                {
+                    "user_id": user_id,
+                    "season_id": season_id,
+                    "progress_id": progress_id,
+                    "level": level.level,
+                    "reward_type": level.reward_type,
+                    "reward_amount": level.reward_amount,
+                    "claimed_at": claimed_at,
+                    "created_at": claimed_at,
+                }
+                for level in to_claim
+            ],
+            keys=["user_id", "season_id", "level"],
+        )
+        # Another request may claim some of these levels between the SELECT and the INSERT; it delivers those.
+        to_claim = [level for level in to_claim if (user_id, season_id, level.level) in inserted]
+
+        rewards = [
+            {
+                "level": level.level,
+                "reward_type": level.reward_type,
+                "reward_amount": level.reward_amount,
+                "auto_claim": level.auto_claim,
+                "claimed_at": claimed_at,
+            }
+            for level in to_claim
+        ]
+        deliveries = [self._level_reward_batch(season_id, user_id, level, meta) for level in to_claim]
+        return rewards, deliveries
+
+    def _level_reward_batch(self, season_id: int, user_id: int, level: SeasonLevelSnapshot, meta: dict) -> RewardBatch:
+        return (
+            self._reward_job_key(season_id, user_id, level.level),
+            [RewardItem(level.reward_type, level.reward_amount, {"season_id": season_id, "level": level.level, **meta})],
+        )
 
     def add_bonus_xp(
         self,
@@ -481,8 +576,12 @@ class SeasonPassService:
         user_id: int,
         xp_amount: int,
         now: date | datetime | None = None,
+        commit: bool = True,
     ) -> dict:
-        """Add raw XP without stamping (used for game 보상 포인트 → XP)."""
+        """Add raw XP without stamping (used for game 보상 포인트 → XP).
+
+        ``commit=False`` flushes only, letting a game play fold the XP into its own transaction.
+        """
 
         if xp_amount <= 0:
             return {"added_xp": 0, "leveled_up": False, "rewards": []}
@@ -495,7 +594,7 @@ class SeasonPassService:
         if season is None:
             return {"added_xp": 0, "leveled_up": False, "rewards": []}
 
-        progress = self.get_or_create_progress(db, user_id=user_id, season_id=season.id)
+        progress = self.get_or_create_progress(db, user_id=user_id, season_id=season.id, commit=commit)
         previous_level = progress.current_level
         # Level 1 is the initial state; it should not be treated as a reward level.
         reward_baseline_level = max(previous_level, 1)
@@ -505,66 +604,28 @@ class SeasonPassService:
         # Do not mirror to global LevelXP here; external/bonus XP would double-grant game tokens
         # via LevelXPService auto rewards, causing overpayment.
 
-        achieved_levels = self._eligible_levels(db, season.id, progress.current_xp)
+        achieved_levels = self.get_level_table(db, season).reached(progress.current_xp)
         new_levels = [level for level in achieved_levels if level.level > reward_baseline_level]
-        rewards: list[dict] = []
+        rewards, deliveries = self._claim_auto_levels(
+            db,
+            user_id=user_id,
+            season_id=season.id,
+            progress_id=progress.id,
+            levels=new_levels,
+            meta={"source": "SEASON_PASS_AUTO_CLAIM", "trigger": "BONUS_XP", "xp_added": xp_amount},
+        )
 
-        for level in new_levels:
-            reward_logged = db.execute(
-                select(SeasonPassRewardLog).where(
-                    SeasonPassRewardLog.user_id == user_id,
-                    SeasonPassRewardLog.season_id == season.id,
-                    SeasonPassRewardLog.level == level.level,
-                )
-            ).scalar_one_or_none()
-            if reward_logged:
-                continue
-
-            if level.auto_claim:
-                reward_log = SeasonPassRewardLog(
-                    user_id=user_id,
-                    season_id=season.id,
-                    progress_id=progress.id,
-                    level=level.level,
-                    reward_type=level.reward_type,
-                    reward_amount=level.reward_amount,
-                    claimed_at=datetime.utcnow(),
-                )
-                db.add(reward_log)
-                reward_meta = {
-                    "season_id": season.id,
-                    "level": level.level,
-                    "source": "SEASON_PASS_AUTO_CLAIM",
-                    "trigger": "BONUS_XP",
-                    "xp_added": xp_amount,
-                }
-                try:
-                    self.reward_service.deliver(
-                        db,
-                        user_id=user_id,
-                        reward_type=level.reward_type,
-                        reward_amount=level.reward_amount,
-                        meta=reward_meta,
-                    )
-                except Exception:
-                    # Reward delivery failure should not block XP flow; rely on logs for retry.
-                    pass
-                rewards.append(
-                    {
-                        "level": level.level,
-                        "reward_type": level.reward_type,
-                        "reward_amount": level.reward_amount,
-                        "auto_claim": level.auto_claim,
-                        "claimed_at": reward_log.claimed_at,
-                    }
-                )
+        self.reward_queue.deliver_or_enqueue(db, user_id, "SEASON_PASS_AUTO_CLAIM", deliveries, commit=False)
 
         progress.current_level = max(progress.current_level, previous_level)
         if achieved_levels:
             progress.current_level = max(progress.current_level, max(level.level for level in achieved_levels))
 
-        db.commit()
-        db.refresh(progress)
+        if commit:
+            db.commit()
+            db.refresh(progress)
+        else:
+            db.flush()
 
         leveled_up = progress.current_level > previous_level
         return {
@@ -573,3 +634,136 @@ class SeasonPassService:
             "current_level": progress.current_level,
             "rewards": rewards,
         }
+
+    def apply_bonus_xp_bulk(
+        self,
+        db: Session,
+        season_id: int,
+        xp_by_user: dict[int, int],
+        chunk_size: int | None = None,
+        before_commit: Callable[[list[int]], None] | None = None,
+    ) -> dict[str, int]:
+        """``add_bonus_xp`` for many users of one season (external ranking imports).
+
+        Users are processed in chunks, one transaction each: one locking read of the chunk's progress
+        rows, level-ups computed in memory against the cached level table, then one INSERT for missing
+        progress rows, one for reward logs and one executemany UPDATE for progress. The chunk's rewards
+        are delivered with grouped cash/wallet/ledger writes (queued per user if that fails). Commits;
+        pending caller changes go with the first chunk. ``before_commit`` is called with each chunk's
+        user ids so caller bookkeeping for those users commits together with their XP.
+        """
+
+        xp_by_user = {user_id: int(xp) for user_id, xp in xp_by_user.items() if xp and int(xp) > 0}
+        summary = {"users": 0, "leveled_up": 0, "rewards": 0}
+        if not xp_by_user:
+            return summary
+
+        season_row = db.get(SeasonPassConfig, season_id)
+        if season_row is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="SEASON_NOT_FOUND")
+        level_table = self.get_level_table(db, SeasonSnapshot.from_row(season_row))
+
+        user_ids = sorted(xp_by_user)
+        size = max(int(chunk_size or self.BULK_XP_CHUNK_SIZE), 1)
+        for start in range(0, len(user_ids), size):
+            chunk = {user_id: xp_by_user[user_id] for user_id in user_ids[start : start + size]}
+            chunk_summary = self._apply_bonus_xp_chunk(db, season_id, level_table, chunk)
+            if before_commit is not None:
+                before_commit(list(chunk))
+            db.commit()
+            for key, value in chunk_summary.items():
+                summary[key] += value
+        return summary
+
+    def _load_progress_rows(self, db: Session, season_id: int, user_ids) -> dict[int, object]:
+        progress = SeasonPassProgress.__table__
+        stmt = select(progress.c.id, progress.c.user_id, progress.c.current_level, progress.c.current_xp).where(
+            progress.c.season_id == season_id, progress.c.user_id.in_(list(user_ids))
+        )
+        if db.get_bind().dialect.name != "sqlite":
+            stmt = stmt.with_for_update()
+        return {row.user_id: row for row in db.execute(stmt)}
+
+    def _apply_bonus_xp_chunk(
+        self, db: Session, season_id: int, level_table: SeasonLevelTable, chunk: dict[int, int]
+    ) -> dict[str, int]:
+        progress = SeasonPassProgress.__table__
+        rows = self._load_progress_rows(db, season_id, chunk)
+        missing = [user_id for user_id in chunk if user_id not in rows]
+        if missing:
+            insert_ignore(
+                db,
+                progress,
+                [
+                    {"user_id": user_id, "season_id": season_id, "current_level": 1, "current_xp": 0, "total_stamps": 0}
+                    for user_id in missing
+                ],
+                keys=["user_id", "season_id"],
+            )
+            rows.update(self._load_progress_rows(db, season_id, missing))
+
+        updates: list[dict] = []
+        candidates: dict[int, list[SeasonLevelSnapshot]] = {}
+        leveled_up = 0
+        for user_id, xp in chunk.items():
+            row = rows[user_id]
+            new_xp = int(row.current_xp) + xp
+            reached = level_table.reached(new_xp)
+            new_level = max([int(row.current_level), *(level.level for level in reached)])
+            leveled_up += int(new_level > row.current_level)
+            updates.append({"progress_id": row.id, "xp": new_xp, "level": new_level})
+            # Level 1 is the initial state; it should not be treated as a reward level.
+            baseline = max(int(row.current_level), 1)
+            auto_levels = [level for level in reached if level.level > baseline and level.auto_claim]
+            if auto_levels:
+                candidates[user_id] = auto_levels
+
+        deliveries: dict[int, list[RewardBatch]] = {}
+        if candidates:
+            claimed = set(
+                db.execute(
+                    select(SeasonPassRewardLog.user_id, SeasonPassRewardLog.level).where(
+                        SeasonPassRewardLog.season_id == season_id,
+                        SeasonPassRewardLog.user_id.in_(list(candidates)),
+                    )
+                ).tuples()
+            )
+            claimed_at = datetime.utcnow()
+            logs: list[dict] = []
+            batches: list[tuple[int, int, RewardBatch]] = []
+            for user_id, levels in candidates.items():
+                meta = {"source": "SEASON_PASS_AUTO_CLAIM", "trigger": "BONUS_XP", "xp_added": chunk[user_id]}
+                for level in levels:
+                    if (user_id, level.level) in claimed:
+                        continue
+                    logs.append(
+                        {
+                            "user_id": user_id,
+                            "season_id": season_id,
+                            "progress_id": rows[user_id].id,
+                            "level": level.level,
+                            "reward_type": level.reward_type,
+                            "reward_amount": level.reward_amount,
+                            "claimed_at": claimed_at,
+                            "created_at": claimed_at,
+                        }
+                    )
+                    batches.append((user_id, level.level, self._level_reward_batch(season_id, user_id, level, meta)))
+            # Levels a concurrent XP grant claimed first are left to that grant.
+            inserted = insert_ignore_keys(db, SeasonPassRewardLog.__table__, logs, keys=["user_id", "season_id", "level"])
+            for user_id, level_no, batch in batches:
+                if (user_id, season_id, level_no) in inserted:
+                    deliveries.setdefault(user_id, []).append(batch)
+
+        db.execute(
+            update(progress)
+            .where(progress.c.id == bindparam("progress_id"))
+            .values(current_xp=bindparam("xp"), current_level=bindparam("level"), updated_at=datetime.utcnow()),
+            updates,
+        )
+        self.reward_queue.deliver_or_enqueue_many(db, "SEASON_PASS_AUTO_CLAIM", deliveries, commit=False)
+        return {
+            "users": len(chunk),
+            "leveled_up": leveled_up,
+            "rewards": sum(len(batches) for batches in deliveries.values()),
+        }
@@ -6,7 +6,7 @@ from typing import Any
 from sqlalchemy.orm import Session
 
 from app.models.survey import Survey, SurveyResponse, SurveyRewardStatus
-from app.services.reward_service import RewardService
+from app.services.reward_service import RewardItem, RewardService
 
 
 class SurveyRewardService:
@@ -46,13 +46,20 @@ class SurveyRewardService:
         db.refresh(response)
 
         try:
-            self.reward_service.deliver(db, user_id=response.user_id, reward_type=reward_type, reward_amount=amount, meta=reward_cfg)
+            # Reward writes and the GRANTED status land in one commit.
+            self.reward_service.deliver_many(
+                db,
+                user_id=response.user_id,
+                rewards=[RewardItem(reward_type, amount, reward_cfg)],
+                commit=False,
+            )
             response.reward_status = SurveyRewardStatus.GRANTED
             db.add(response)
             db.commit()
             db.refresh(response)
             return True, toast_message or "설문 보상이 지급되었습니다."
         except Exception:
+            db.rollback()
             response.reward_status = SurveyRewardStatus.FAILED
             db.add(response)
             db.commit()
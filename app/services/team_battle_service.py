@@ -468,6 +468,8 @@ class TeamBattleService:
         enforce_usage: bool = True,
         auto_join_if_missing: bool = False,
         now: datetime | None = None,
+        plays: int = 1,
+        commit: bool = True,
     ) -> TeamScore:
         if delta == 0:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="ZERO_DELTA")
@@ -488,7 +490,8 @@ class TeamBattleService:
         if action == "GAME_PLAY" and user_id:
             if enforce_usage:
                 self._assert_today_usage(db, user_id=user_id, now=now)
-            delta = self.POINTS_PER_PLAY
+            # GAME_PLAY is always scored per play (batched plays pass plays=N), capped daily below.
+            delta = self.POINTS_PER_PLAY * max(plays, 1)
             start, end = self._day_bounds(now)
             points_today = db.execute(
                 select(func.coalesce(func.sum(TeamEventLog.delta), 0)).where(
@@ -524,8 +527,11 @@ class TeamBattleService:
         )
         db.add(log)
         db.add(score)
-        db.commit()
-        db.refresh(score)
+        if commit:
+            db.commit()
+            db.refresh(score)
+        else:
+            db.flush()
         return score
 
     def settle_daily_rewards(self, db: Session, season_id: int) -> dict:
@@ -62,8 +62,7 @@ class TrialGrantService:
         """
 
         if not bool(getattr(self.settings, "enable_trial_grant_auto", True)):
-            balance_now = self.wallet_service.get_balance(db, user_id, token_type)
-            return 0, balance_now, None
+            return 0, self.wallet_service.get_balance(db, user_id, token_type), None
 
         balance = self.wallet_service.get_balance(db, user_id, token_type)
         if balance > 0:
@@ -85,14 +84,12 @@ class TrialGrantService:
                 end_utc=now_utc,
             )
             if granted_this_week >= weekly_cap:
-                balance_now = self.wallet_service.get_balance(db, user_id, token_type)
-                return 0, balance_now, None
+                return 0, balance, None
 
         # Daily cap (default 1; legacy behavior was effectively 1/day)
         daily_cap = max(int(getattr(self.settings, "trial_daily_cap", 1) or 1), 0)
         if daily_cap == 0:
-            balance_now = self.wallet_service.get_balance(db, user_id, token_type)
-            return 0, balance_now, None
+            return 0, balance, None
 
         start_utc, end_utc = self._kst_day_bounds_utc(today_kst)
         granted_today = self._sum_grants_in_window(
@@ -103,8 +100,7 @@ class TrialGrantService:
             end_utc=end_utc,
         )
         if granted_today >= daily_cap:
-            balance_now = self.wallet_service.get_balance(db, user_id, token_type)
-            return 0, balance_now, None
+            return 0, balance, None
 
         label = f"TRIAL_{token_type.value}_{today_kst.isoformat()}"
 
@@ -117,8 +113,7 @@ class TrialGrantService:
             )
         ).first()
         if already is not None:
-            balance_now = self.wallet_service.get_balance(db, user_id, token_type)
-            return 0, balance_now, label
+            return 0, balance, label
 
         balance_after = self.wallet_service.grant_tokens(
             db,
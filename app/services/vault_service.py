@@ -223,6 +223,14 @@ class VaultService:
             return False
         return True
 
+    @staticmethod
+    def _persist_placeholder_user(db: Session, user: User, commit: bool) -> None:
+        if commit:
+            db.commit()
+            db.refresh(user)
+        else:
+            db.flush()
+
     def _get_or_create_user(self, db: Session, user_id: int) -> User:
         user = db.query(User).filter(User.id == user_id).one_or_none()
         if user is None and db.bind and db.bind.dialect.name == "sqlite":
@@ -465,6 +473,7 @@ class VaultService:
         outcome: str | None = None,
         payout_raw: dict | None = None,
         now: datetime | None = None,
+        commit: bool = True,
     ) -> int:
         """Idempotently accrue Phase 1 vault locked balance for a game play.
 
@@ -473,6 +482,8 @@ class VaultService:
         - Eligibility required (same as Phase 1 vault funnel).
         - Expires-at is set only when absent/expired; never refreshed while active.
 
+        - With ``commit=False`` the event is only flushed; a duplicate then fails the caller's transaction.
+
         Returns the amount actually added (0 if skipped / duplicate / not eligible).
         """
 
@@ -520,8 +531,7 @@ class VaultService:
         if user is None and db.bind and db.bind.dialect.name == "sqlite":
             user = User(id=user_id, external_id=f"test-user-{user_id}")
             db.add(user)
-            db.commit()
-            db.refresh(user)
+            self._persist_placeholder_user(db, user, commit)
         if user is None:
             return 0
 
@@ -558,6 +568,10 @@ class VaultService:
         except Exception:
             pass
 
+        if not commit:
+            db.flush()
+            return int(amount)
+
         try:
             db.commit()
         except IntegrityError:
@@ -579,6 +593,7 @@ class VaultService:
         reward_amount: int | None,
         payout_raw: dict | None = None,
         now: datetime | None = None,
+        commit: bool = True,
     ) -> int:
         """Idempotently route a TRIAL play reward into Vault (Phase 1 locked).
 
@@ -654,8 +669,7 @@ class VaultService:
             if user is None and db.bind and db.bind.dialect.name == "sqlite":
                 user = User(id=user_id, external_id=f"test-user-{user_id}")
                 db.add(user)
-                db.commit()
-                db.refresh(user)
+                self._persist_placeholder_user(db, user, commit)
             if user is None:
                 return 0
 
@@ -692,6 +706,10 @@ class VaultService:
             except Exception:
                 pass
 
+        if not commit:
+            db.flush()
+            return int(amount) if amount > 0 else 0
+
         try:
             db.commit()
         except IntegrityError:
@@ -0,0 +1,66 @@
+"""Weighted random selection shared by games (roulette segments, lottery prizes).
+
+Uses Vose's alias method: O(n) build, O(1) draw and O(n) memory regardless of how large the
+admin-configured weights are. Samplers are immutable, so game services build one per config
+version (see ``config_snapshot``) and reuse it for every play.
+"""
+from __future__ import annotations
+
+import random
+from collections.abc import Sequence
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class AliasSampler(Generic[T]):
+    """Immutable weighted sampler over ``items`` using Vose's alias method."""
+
+    __slots__ = ("items", "weights", "prob", "alias")
+
+    def __init__(self, items: Sequence[T], weights: Sequence[int | float]) -> None:
+        if len(items) != len(weights):
+            raise ValueError("items and weights must have the same length")
+        if any(w < 0 for w in weights):
+            raise ValueError("weights must be non-negative")
+        total = float(sum(weights))
+        if not items or total <= 0:
+            raise ValueError("at least one positive weight is required")
+
+        n = len(items)
+        scaled = [float(w) * n / total for w in weights]
+        prob = [0.0] * n
+        alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            prob[s] = scaled[s]
+            alias[s] = l
+            scaled[l] = (scaled[l] + scaled[s]) - 1.0
+            (small if scaled[l] < 1.0 else large).append(l)
+        # Leftovers are 1.0 up to floating-point error; zero-weight items must still never be drawn.
+        heaviest = max(range(n), key=lambda i: weights[i])
+        for i in large + small:
+            if weights[i] > 0:
+                prob[i] = 1.0
+            else:
+                prob[i], alias[i] = 0.0, heaviest
+
+        self.items: tuple[T, ...] = tuple(items)
+        self.weights: tuple[float, ...] = tuple(float(w) for w in weights)
+        self.prob: tuple[float, ...] = tuple(prob)
+        self.alias: tuple[int, ...] = tuple(alias)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def sample_index(self, rng: random.Random | None = None) -> int:
+        r = rng or random
+        i = r.randrange(len(self.items))
+        return i if r.random() < self.prob[i] else self.alias[i]
+
+    def sample(self, rng: random.Random | None = None) -> T:
+        return self.items[self.sample_index(rng)]
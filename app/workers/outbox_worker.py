@@ -0,0 +1,69 @@
+"""Outbox worker: applies post-play side effects written to outbox_event.
+
+Usage:
+  python -m app.workers.outbox_worker                 # poll forever
+  python -m app.workers.outbox_worker --once          # drain one batch and exit (cron/debug)
+  python -m app.workers.outbox_worker --batch-size 500 --interval 0.5
+
+Several workers can run concurrently on MySQL (claims use FOR UPDATE SKIP LOCKED).
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import signal
+import time
+
+from app.db.session import SessionLocal
+from app.services.outbox_service import OutboxService
+
+logger = logging.getLogger("app.workers.outbox_worker")
+
+
+def run(batch_size: int = 100, interval: float = 1.0, once: bool = False) -> None:
+    service = OutboxService()
+    stopping = False
+
+    def _stop(signum, _frame) -> None:
+        nonlocal stopping
+        logger.info("received signal %s; finishing current batch", signum)
+        stopping = True
+
+    signal.signal(signal.SIGTERM, _stop)
+    signal.signal(signal.SIGINT, _stop)
+
+    while not stopping:
+        db = SessionLocal()
+        try:
+            summary = service.process_batch(db, batch_size=batch_size)
+        except Exception:  # noqa: BLE001 - keep the worker alive across DB hiccups
+            logger.exception("outbox batch failed")
+            db.rollback()
+            summary = {"claimed": 0}
+        finally:
+            db.close()
+
+        if summary.get("claimed"):
+            logger.info("outbox batch: %s", summary)
+        if once:
+            break
+        # Drain continuously while there is backlog; otherwise poll.
+        if summary.get("claimed", 0) < batch_size:
+            time.sleep(interval)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Drain outbox_event side effects")
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--interval", type=float, default=1.0, help="Seconds to sleep when the outbox is empty")
+    parser.add_argument("--once", action="store_true", help="Process a single batch and exit")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+    run(batch_size=args.batch_size, interval=args.interval, once=args.once)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
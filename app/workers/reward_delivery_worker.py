@@ -0,0 +1,69 @@
+"""Reward delivery worker: re-delivers rewards queued in reward_delivery_job.
+
+Usage:
+  python -m app.workers.reward_delivery_worker                 # poll forever
+  python -m app.workers.reward_delivery_worker --once          # drain one batch and exit (cron/debug)
+  python -m app.workers.reward_delivery_worker --batch-size 200 --interval 5
+
+Several workers can run concurrently on MySQL (claims use FOR UPDATE SKIP LOCKED).
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import signal
+import time
+
+from app.db.session import SessionLocal
+from app.services.reward_delivery_queue_service import RewardDeliveryQueueService
+
+logger = logging.getLogger("app.workers.reward_delivery_worker")
+
+
+def run(batch_size: int = 100, interval: float = 5.0, once: bool = False) -> None:
+    service = RewardDeliveryQueueService()
+    stopping = False
+
+    def _stop(signum, _frame) -> None:
+        nonlocal stopping
+        logger.info("received signal %s; finishing current batch", signum)
+        stopping = True
+
+    signal.signal(signal.SIGTERM, _stop)
+    signal.signal(signal.SIGINT, _stop)
+
+    while not stopping:
+        db = SessionLocal()
+        try:
+            summary = service.process_batch(db, batch_size=batch_size)
+        except Exception:  # noqa: BLE001 - keep the worker alive across DB hiccups
+            logger.exception("reward delivery batch failed")
+            db.rollback()
+            summary = {"claimed": 0}
+        finally:
+            db.close()
+
+        if summary.get("claimed"):
+            logger.info("reward delivery batch: %s", summary)
+        if once:
+            break
+        # Drain continuously while there is backlog; otherwise poll.
+        if summary.get("claimed", 0) < batch_size:
+            time.sleep(interval)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Re-deliver queued season pass / level rewards")
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--interval", type=float, default=5.0, help="Seconds to sleep when the queue is empty")
+    parser.add_argument("--once", action="store_true", help="Process a single batch and exit")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+    run(batch_size=args.batch_size, interval=args.interval, once=args.once)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,137 @@
+"""Backfill user_internal_win_counter from the game log tables.
+
+A win is counted the same way the play pipeline counts it:
+- dice_log: result = 'WIN'
+- roulette_log / lottery_log: reward_amount > 0
+
+Season windows are the KST calendar days [start_date, end_date]; log created_at is UTC.
+Counters never decrease, so it is safe to re-run while plays keep incrementing them.
+
+Usage:
+  python scripts/backfill_internal_win_counter.py --dry-run
+  python scripts/backfill_internal_win_counter.py --apply
+  python scripts/backfill_internal_win_counter.py --apply --season-id 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from collections import Counter
+from datetime import date, datetime, time, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+# Add project root to path (so `import app...` works when running as a script)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.db.session import SessionLocal
+from app.models.dice import DiceLog
+from app.models.lottery import LotteryLog
+from app.models.roulette import RouletteLog
+from app.models.season_pass import SeasonPassConfig
+from app.models.user_internal_win_counter import UserInternalWinCounter
+
+
+def _utc_window(start: date, end: date) -> tuple[datetime, datetime]:
+    tz = ZoneInfo(get_settings().timezone)
+    start_utc = datetime.combine(start, time.min, tzinfo=tz).astimezone(timezone.utc).replace(tzinfo=None)
+    end_utc = datetime.combine(end + timedelta(days=1), time.min, tzinfo=tz).astimezone(timezone.utc).replace(tzinfo=None)
+    return start_utc, end_utc
+
+
+def _load_wins(db: Session, start_utc: datetime, end_utc: datetime) -> Counter:
+    wins: Counter = Counter()
+    for model, condition in (
+        (DiceLog, DiceLog.result == "WIN"),
+        (RouletteLog, RouletteLog.reward_amount > 0),
+        (LotteryLog, LotteryLog.reward_amount > 0),
+    ):
+        rows = db.execute(
+            select(model.user_id, func.count(model.id))
+            .where(condition, model.created_at >= start_utc, model.created_at < end_utc)
+            .group_by(model.user_id)
+        ).all()
+        for user_id, cnt in rows:
+            wins[int(user_id)] += int(cnt or 0)
+    return wins
+
+
+def backfill(db: Session, *, apply: bool, season_id: int | None = None) -> dict[str, int]:
+    now = datetime.utcnow()
+
+    stmt = select(SeasonPassConfig)
+    if season_id is not None:
+        stmt = stmt.where(SeasonPassConfig.id == season_id)
+    seasons = db.execute(stmt).scalars().all()
+
+    created = 0
+    updated = 0
+    unchanged = 0
+
+    for season in seasons:
+        wins = _load_wins(db, *_utc_window(season.start_date, season.end_date))
+        counters = {
+            c.user_id: c
+            for c in db.execute(
+                select(UserInternalWinCounter).where(UserInternalWinCounter.season_id == season.id)
+            ).scalars().all()
+        }
+
+        for user_id, computed in wins.items():
+            row = counters.get(user_id)
+            if row is None:
+                row = UserInternalWinCounter(user_id=user_id, season_id=season.id, win_count=computed, updated_at=now)
+                created += 1
+                if apply:
+                    db.add(row)
+                continue
+
+            # Counts: never decrease
+            if computed > int(row.win_count or 0):
+                updated += 1
+                if apply:
+                    row.win_count = computed
+                    row.updated_at = now
+                    db.add(row)
+            else:
+                unchanged += 1
+
+    if apply:
+        db.commit()
+
+    return {
+        "seasons": len(seasons),
+        "created": created,
+        "updated": updated,
+        "unchanged": unchanged,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Backfill user_internal_win_counter from game logs")
+    parser.add_argument("--dry-run", action="store_true", help="Do not write DB changes")
+    parser.add_argument("--apply", action="store_true", help="Write DB changes")
+    parser.add_argument("--season-id", type=int, default=None, help="Only backfill this season")
+    args = parser.parse_args()
+
+    if args.dry_run and args.apply:
+        raise SystemExit("Choose one: --dry-run or --apply")
+    apply = bool(args.apply) and not bool(args.dry_run)
+
+    db = SessionLocal()
+    try:
+        stats = backfill(db, apply=apply, season_id=args.season_id)
+    finally:
+        db.close()
+
+    mode = "APPLY" if apply else "DRY_RUN"
+    print(f"[{mode}] backfill_internal_win_counter seasons={stats['seasons']} created={stats['created']} updated={stats['updated']} unchanged={stats['unchanged']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Benchmark wallet-ledger write combining against per-row ORM inserts.
+
+Each "play" is one transaction that consumes ``--plays-per-tx`` tokens through
+GameWalletService.consume_tokens_for_plays and commits. Without write combining every ledger row
+is an ORM object (one INSERT each on MySQL, which has no RETURNING to batch the primary keys);
+with WALLET_LEDGER_WRITE_COMBINING the transaction's rows go out as one multi-row INSERT at commit.
+
+Runs against a throwaway SQLite file by default. Point --database-url at a scratch MySQL schema
+for production-like numbers (tables are created if missing; the benchmark user's rows are deleted).
+
+Usage:
+  python scripts/benchmark_wallet_ledger.py
+  python scripts/benchmark_wallet_ledger.py --transactions 2000 --plays-per-tx 10
+  python scripts/benchmark_wallet_ledger.py --database-url mysql+pymysql://user:pw@localhost/bench
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# Add project root to path (so `import app...` works when running as a script)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, delete
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import get_settings
+from app.db.base import Base
+from app.models.game_wallet import GameTokenType, UserGameWallet
+from app.models.game_wallet_ledger import UserGameWalletLedger
+from app.models.user import User
+from app.services.game_wallet_service import GameWalletService
+
+BENCH_USER_ID = 990_001
+
+
+def _reset(Session, balance: int) -> None:
+    with Session() as db:
+        db.execute(delete(UserGameWalletLedger).where(UserGameWalletLedger.user_id == BENCH_USER_ID))
+        db.execute(delete(UserGameWallet).where(UserGameWallet.user_id == BENCH_USER_ID))
+        if db.get(User, BENCH_USER_ID) is None:
+            db.add(User(id=BENCH_USER_ID, external_id=f"bench-{BENCH_USER_ID}"))
+        db.add(UserGameWallet(user_id=BENCH_USER_ID, token_type=GameTokenType.DICE_TOKEN, balance=balance))
+        db.commit()
+
+
+def _run(Session, label: str, combining: bool, transactions: int, plays_per_tx: int) -> float:
+    get_settings().wallet_ledger_write_combining = combining
+    _reset(Session, transactions * plays_per_tx)
+    service = GameWalletService()
+    labels = [f"bench-{i}" for i in range(plays_per_tx)]
+    metas = [{"game": "DICE", "bench": True}] * plays_per_tx
+
+    start = time.perf_counter()
+    with Session() as db:
+        for _ in range(transactions):
+            service.consume_tokens_for_plays(db, BENCH_USER_ID, GameTokenType.DICE_TOKEN, labels, reason="BENCH", metas=metas)
+    elapsed = time.perf_counter() - start
+
+    rows = transactions * plays_per_tx
+    print(f"{label:<22} {elapsed * 1000:10.1f} ms total  {rows / elapsed:10.0f} ledger rows/s")
+    return elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--transactions", type=int, default=500)
+    parser.add_argument("--plays-per-tx", type=int, default=10)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    url = args.database_url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench_wallet_ledger.db')}"
+    engine = create_engine(url, future=True)
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+    print(f"url={engine.url.render_as_string(hide_password=True)} transactions={args.transactions} plays/tx={args.plays_per_tx}")
+    baseline = _run(Session, "per-row ORM insert", False, args.transactions, args.plays_per_tx)
+    combined = _run(Session, "write combining", True, args.transactions, args.plays_per_tx)
+    print(f"speedup x{baseline / combined:.2f}")
+
+    _reset(Session, 0)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,75 @@
+"""Benchmark the alias-method sampler against the legacy list-expansion draw.
+
+The legacy roulette/lottery draw built a list repeating each item `weight` times and called
+random.choice on it for every play. AliasSampler is built once per config version and draws
+in O(1).
+
+Usage:
+  python scripts/benchmark_weighted_sampler.py
+  python scripts/benchmark_weighted_sampler.py --draws 20000 --weights 30,25,20,15,8,2
+  python scripts/benchmark_weighted_sampler.py --weights 10000,5000,2500,1000,100,1
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+from collections import Counter
+
+# Add project root to path (so `import app...` works when running as a script)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.weighted_sampler import AliasSampler
+
+
+def legacy_draw(items: list[int], weights: list[int]) -> int:
+    pool: list[int] = []
+    for item, weight in zip(items, weights):
+        pool.extend([item] * max(weight, 0))
+    return random.choice(pool)
+
+
+def _time(label: str, draws: int, fn) -> Counter:
+    counts: Counter = Counter()
+    start = time.perf_counter()
+    for _ in range(draws):
+        counts[fn()] += 1
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed * 1000:10.1f} ms total  {elapsed / draws * 1e6:8.2f} us/draw")
+    return counts
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--draws", type=int, default=10000)
+    parser.add_argument("--weights", type=str, default="10000,5000,2500,1000,100,1")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    weights = [int(w) for w in args.weights.split(",") if w.strip()]
+    items = list(range(len(weights)))
+    total = sum(weights)
+    random.seed(args.seed)
+
+    print(f"weights={weights} (sum={total}) draws={args.draws}")
+    legacy_counts = _time("legacy list expansion", args.draws, lambda: legacy_draw(items, weights))
+
+    build_start = time.perf_counter()
+    sampler = AliasSampler(items, weights)
+    print(f"{'alias build (once/version)':<28} {(time.perf_counter() - build_start) * 1e6:10.1f} us")
+    alias_counts = _time("alias sampler", args.draws, sampler.sample)
+
+    print("\nitem  expected  legacy   alias")
+    for item, weight in zip(items, weights):
+        expected = weight / total
+        print(
+            f"{item:>4}  {expected:8.4f}  {legacy_counts[item] / args.draws:6.4f}  {alias_counts[item] / args.draws:6.4f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
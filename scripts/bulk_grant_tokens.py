@@ -0,0 +1,89 @@
+"""Grant or revoke game tokens for many users at once (campaign drops).
+
+Targets are the union of --segment (user_segment.segment), --user-ids-file and
+--external-ids-file (one id per line). Writes go in chunks: one multi-row wallet upsert,
+one balance read and one executemany ledger insert per chunk, committed per chunk.
+
+Usage:
+  python scripts/bulk_grant_tokens.py --token-type LOTTERY_TICKET --amount 1 --segment VIP --dry-run
+  python scripts/bulk_grant_tokens.py --token-type LOTTERY_TICKET --amount 1 --segment VIP --apply
+  python scripts/bulk_grant_tokens.py --token-type DICE_TOKEN --amount 2 --external-ids-file ids.txt --apply
+  python scripts/bulk_grant_tokens.py --token-type DICE_TOKEN --amount 2 --user-ids-file ids.txt --revoke --apply
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+# Add project root to path (so `import app...` works when running as a script)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.session import SessionLocal
+from app.models.game_wallet import GameTokenType
+from app.services.game_token_bulk_service import DEFAULT_CHUNK_SIZE, GameTokenBulkService
+
+
+def _read_lines(path: str | None) -> list[str]:
+    if not path:
+        return []
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bulk grant/revoke game tokens")
+    parser.add_argument("--token-type", required=True, choices=[t.value for t in GameTokenType])
+    parser.add_argument("--amount", type=int, required=True)
+    parser.add_argument("--segment", type=str, default=None, help="user_segment.segment value")
+    parser.add_argument("--user-ids-file", type=str, default=None)
+    parser.add_argument("--external-ids-file", type=str, default=None)
+    parser.add_argument("--revoke", action="store_true", help="Revoke instead of grant (skips wallets below amount)")
+    parser.add_argument("--reason", type=str, default=None)
+    parser.add_argument("--label", type=str, default=None)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--dry-run", action="store_true", help="Only resolve targets")
+    parser.add_argument("--apply", action="store_true", help="Write DB changes")
+    args = parser.parse_args()
+
+    if args.dry_run and args.apply:
+        raise SystemExit("Choose one: --dry-run or --apply")
+    apply = bool(args.apply) and not bool(args.dry_run)
+
+    service = GameTokenBulkService(chunk_size=args.chunk_size)
+    token_type = GameTokenType(args.token_type)
+    started = time.perf_counter()
+
+    def _progress(done: int, total: int) -> None:
+        print(f"  {done}/{total} ({time.perf_counter() - started:.1f}s)", flush=True)
+
+    db = SessionLocal()
+    try:
+        user_ids, not_found = service.resolve_user_ids(
+            db,
+            user_ids=[int(v) for v in _read_lines(args.user_ids_file)],
+            external_ids=_read_lines(args.external_ids_file),
+            segment=args.segment,
+        )
+        print(f"targets={len(user_ids)} not_found={len(not_found)}")
+        if not apply:
+            print("[DRY_RUN] no changes written")
+            return
+
+        run = service.revoke if args.revoke else service.grant
+        meta = {"source": "CLI_BULK", **({"segment": args.segment} if args.segment else {})}
+        result = run(db, user_ids, token_type, args.amount, reason=args.reason, label=args.label, meta=meta, progress=_progress)
+    finally:
+        db.close()
+
+    mode = "REVOKE" if args.revoke else "GRANT"
+    print(
+        f"[{mode}] bulk_grant_tokens token_type={token_type.value} amount={args.amount} "
+        f"applied={result.applied} skipped={len(result.skipped_user_ids)} elapsed={time.perf_counter() - started:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
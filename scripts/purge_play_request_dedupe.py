@@ -0,0 +1,44 @@
+"""Delete expired /play Idempotency-Key rows (play_request_dedupe).
+
+Keys live for PLAY_IDEMPOTENCY_TTL_SECONDS (default 24h). Run periodically (e.g. hourly cron);
+deletes in batches so it never holds long locks on the table.
+
+Usage:
+  python scripts/purge_play_request_dedupe.py
+  python scripts/purge_play_request_dedupe.py --batch-size 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+# Add project root to path (so `import app...` works when running as a script)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.session import SessionLocal
+from app.services.play_idempotency_service import PlayIdempotencyService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Purge expired play idempotency keys")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    total = 0
+    try:
+        while True:
+            removed = PlayIdempotencyService.purge_expired(db, batch_size=args.batch_size)
+            total += removed
+            if removed < args.batch_size:
+                break
+    finally:
+        db.close()
+
+    print(f"purge_play_request_dedupe removed={total}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Reconcile balances against their ledgers (cash, game wallet, vault).
+
+Users are split into id ranges; each range is checked with aggregate SQL in a worker process
+(one engine per process), so millions of ledger rows are summed inside the database and only
+drifted users travel back. See app/services/ledger_reconciliation_service.py for the checks.
+
+--apply writes RECONCILE_ADJUST ledger rows for cash/wallet drifts (balances are not changed),
+one transaction per range. Run it in a maintenance window: a play landing between the aggregate
+and the repair would be double-counted. The vault check is always report-only.
+
+Usage:
+  python scripts/reconcile_ledgers.py --dry-run
+  python scripts/reconcile_ledgers.py --dry-run --checks cash,wallet --workers 8 --output drift.csv
+  python scripts/reconcile_ledgers.py --apply --checks cash
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+# Add project root to path (so `import app...` works when running as a script)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+
+from app.core.config import get_settings
+from app.services.ledger_reconciliation_service import (
+    CHECKS,
+    Drift,
+    reconcile_range,
+    repair_drifts,
+    user_id_ranges,
+)
+
+_engine: Engine | None = None
+
+
+def _init_worker() -> None:
+    # Engines cannot cross a fork safely; every worker opens its own single-connection pool.
+    global _engine
+    _engine = create_engine(get_settings().database_url, future=True, pool_size=1, max_overflow=0)
+
+
+def _check_range(lo: int, hi: int, checks: tuple[str, ...], apply: bool) -> tuple[list[Drift], int]:
+    assert _engine is not None
+    with _engine.begin() as conn:
+        drifts = reconcile_range(conn, lo, hi, checks)
+        repaired = repair_drifts(conn, drifts) if apply else 0
+    return drifts, repaired
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--dry-run", action="store_true")
+    mode.add_argument("--apply", action="store_true")
+    parser.add_argument("--checks", default=",".join(CHECKS), help=f"comma-separated subset of {','.join(CHECKS)}")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="user ids per range")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--output", help="write drifted rows to this CSV file")
+    args = parser.parse_args()
+
+    checks = tuple(c.strip() for c in args.checks.split(",") if c.strip())
+    unknown = set(checks) - set(CHECKS)
+    if unknown:
+        parser.error(f"unknown checks: {','.join(sorted(unknown))}")
+
+    started = time.monotonic()
+    engine = create_engine(get_settings().database_url, future=True)
+    with engine.connect() as conn:
+        ranges = user_id_ranges(conn, args.chunk_size)
+    engine.dispose()
+
+    drifts: list[Drift] = []
+    repaired = 0
+    with ProcessPoolExecutor(max_workers=max(args.workers, 1), initializer=_init_worker) as pool:
+        futures = [pool.submit(_check_range, lo, hi, checks, args.apply) for lo, hi in ranges]
+        for future in futures:
+            range_drifts, range_repaired = future.result()
+            drifts.extend(range_drifts)
+            repaired += range_repaired
+
+    for drift in drifts[:50]:
+        print(
+            f"  {drift.check} user_id={drift.user_id} token_type={drift.token_type or '-'} "
+            f"balance={drift.balance} ledger={drift.ledger_total} diff={drift.diff}"
+        )
+    if len(drifts) > 50:
+        print(f"  ... {len(drifts) - 50} more")
+
+    if args.output:
+        with open(args.output, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["check", "user_id", "token_type", "balance", "ledger_total", "diff"])
+            for drift in drifts:
+                writer.writerow([drift.check, drift.user_id, drift.token_type or "", drift.balance, drift.ledger_total, drift.diff])
+
+    counts = Counter(drift.check for drift in drifts)
+    mode_label = "APPLY" if args.apply else "DRY-RUN"
+    print(
+        f"[{mode_label}] reconcile_ledgers ranges={len(ranges)} "
+        + " ".join(f"{check}_drift={counts.get(check, 0)}" for check in checks)
+        + f" repaired={repaired} elapsed={time.monotonic() - started:.1f}s"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,105 @@
+"""Simulate payouts of a roulette/lottery/dice config before publishing it.
+
+Runs the same simulation as POST /admin/api/simulation/{game}. A proposal JSON file holds the
+request body (e.g. {"segments": [...]}, {"prizes": [...]} or {"rewards": {...}}) so unsaved
+edits can be checked; --config-id loads the saved config instead (or as dice fallback).
+
+Requires NumPy.
+
+Usage:
+  python scripts/simulate_game_config.py roulette --config-id 1 --plays 2000000
+  python scripts/simulate_game_config.py lottery --proposal proposal.json --plays-per-hour 30000
+  python scripts/simulate_game_config.py dice --config-id 1 --cost-per-play 100 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+
+# Add project root to path (so `import app...` works when running as a script)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.session import SessionLocal
+from app.schemas.admin_simulation import DiceSimulationRequest, LotterySimulationRequest, RouletteSimulationRequest
+from app.services.game_simulation_service import GameSimulationService
+
+GAMES = {
+    "roulette": (RouletteSimulationRequest, GameSimulationService.simulate_roulette),
+    "lottery": (LotterySimulationRequest, GameSimulationService.simulate_lottery),
+    "dice": (DiceSimulationRequest, GameSimulationService.simulate_dice),
+}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("game", choices=sorted(GAMES))
+    parser.add_argument("--config-id", type=int, default=None)
+    parser.add_argument("--proposal", type=str, default=None, help="JSON file with proposed (unsaved) config fields")
+    parser.add_argument("--plays", type=int, default=1_000_000)
+    parser.add_argument("--block-size", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--payout-reward-type", type=str, default="POINT")
+    parser.add_argument("--cost-per-play", type=float, default=None)
+    parser.add_argument("--plays-per-hour", type=int, default=None)
+    parser.add_argument("--json", action="store_true", help="Print the full result as JSON")
+    args = parser.parse_args()
+
+    body: dict = {}
+    if args.proposal:
+        with open(args.proposal, encoding="utf-8") as f:
+            body.update(json.load(f))
+    body.update(
+        {
+            "config_id": args.config_id,
+            "plays": args.plays,
+            "block_size": args.block_size,
+            "seed": args.seed,
+            "payout_reward_type": args.payout_reward_type,
+            "cost_per_play": args.cost_per_play,
+            "plays_per_hour": args.plays_per_hour,
+        }
+    )
+    request_cls, simulate = GAMES[args.game]
+    request = request_cls.model_validate(body)
+
+    db = SessionLocal()
+    try:
+        start = time.perf_counter()
+        result = simulate(db, request)
+        elapsed = time.perf_counter() - start
+    finally:
+        db.close()
+
+    if args.json:
+        print(result.model_dump_json(indent=2))
+        return 0
+
+    print(f"[{result.game}] plays={result.plays_simulated}/{result.plays} in {elapsed:.2f}s")
+    print(f"mean payout ({result.payout_reward_type}) = {result.mean_payout:.4f}  std = {result.payout_std:.4f}")
+    if result.rtp is not None:
+        print(f"RTP = {result.rtp:.2%}")
+    if result.jackpot_rate is not None:
+        print(f"jackpot rate = {result.jackpot_rate:.6f} (1 in {result.plays_per_jackpot or float('inf'):.0f})")
+    if result.block_payout_percentiles:
+        pcts = "  ".join(f"{k}={v:.0f}" for k, v in result.block_payout_percentiles.items())
+        print(f"payout per {result.block_size} plays: {pcts}")
+    print("\noutcome                     expected  observed")
+    for o in result.outcomes:
+        print(f"{o.label[:26]:<26}  {o.expected_rate:8.4f}  {o.observed_rate:8.4f}")
+    if result.stock_depletion:
+        print("\nstock depletion")
+        for point in result.stock_depletion:
+            at = "never" if point.sold_out_at_play is None else f"play {point.sold_out_at_play}"
+            hours = f" (~{point.sold_out_at_hour:.1f}h)" if point.sold_out_at_hour is not None else ""
+            print(f"  {point.label[:26]:<26} stock={point.stock:<8} sold out: {at}{hours}")
+    if result.exhausted_at_play is not None:
+        print(f"\nall prizes sold out at play {result.exhausted_at_play}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,80 @@
+"""Streaming admin exports (CSV / gzip JSONL)."""
+import csv
+import gzip
+import io
+import json
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.game_wallet import GameTokenType
+from app.models.game_wallet_ledger import UserGameWalletLedger
+from app.models.user import User
+from app.services.export_service import ExportService
+
+
+def _seed_ledger(session_factory) -> None:
+    session: Session = session_factory()
+    session.add_all([User(id=31, external_id="exp-31", status="ACTIVE"), User(id=32, external_id="exp-32", status="ACTIVE")])
+    base = datetime(2025, 12, 20, 0, 0, 0)
+    for i in range(5):
+        session.add(
+            UserGameWalletLedger(
+                user_id=31 if i % 2 == 0 else 32,
+                token_type=GameTokenType.ROULETTE_COIN,
+                delta=1,
+                balance_after=i,
+                reason="EXPORT_TEST",
+                meta_json={"n": i},
+                created_at=base + timedelta(hours=i),
+            )
+        )
+    session.commit()
+    session.close()
+
+
+def test_export_csv_filters_by_time_and_user(client: TestClient, session_factory) -> None:
+    _seed_ledger(session_factory)
+
+    resp = client.get(
+        "/admin/api/exports/game-wallet-ledger",
+        params={"format": "csv", "external_id": "exp-31", "start": "2025-12-20T01:00:00", "end": "2025-12-20T13:00:00+09:00"},
+    )
+
+    assert resp.status_code == 200, resp.text
+    assert resp.headers["content-type"].startswith("text/csv")
+    assert "attachment" in resp.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(resp.text)))
+    # end 13:00 KST == 04:00 UTC (exclusive) drops i=4; start drops i=0; the user filter keeps even i.
+    assert [row["balance_after"] for row in rows] == ["2"]
+    assert rows[0]["token_type"] == "ROULETTE_COIN"
+    assert json.loads(rows[0]["meta_json"]) == {"n": 2}
+    assert rows[0]["created_at"].endswith("+09:00")
+
+
+def test_export_jsonl_gzip_streams_all_rows(client: TestClient, session_factory) -> None:
+    _seed_ledger(session_factory)
+
+    resp = client.get("/admin/api/exports/game-wallet-ledger", params={"format": "jsonl", "user_id": 32})
+
+    assert resp.status_code == 200, resp.text
+    lines = gzip.decompress(resp.content).decode("utf-8").splitlines()
+    assert [json.loads(line)["balance_after"] for line in lines] == [1, 3]
+
+
+def test_export_encoders_flush_per_batch() -> None:
+    service = ExportService(batch_size=2)
+    rows = [{"id": i, "meta_json": {"i": i}} for i in range(5)]
+
+    csv_chunks = list(service.encode_csv(iter(rows), ["id", "meta_json"]))
+    gz_chunks = list(service.encode_jsonl_gzip(iter(rows)))
+
+    assert len(csv_chunks) == 3
+    assert len(list(csv.DictReader(io.StringIO(b"".join(csv_chunks).decode())))) == 5
+    assert len(gzip.decompress(b"".join(gz_chunks)).decode().splitlines()) == 5
+
+
+def test_export_rejects_unknown_dataset_and_format(client: TestClient) -> None:
+    assert client.get("/admin/api/exports/users").json()["error"]["code"] == "EXPORT_DATASET_NOT_FOUND"
+    assert client.get("/admin/api/exports/cash-ledger", params={"format": "xml"}).json()["error"]["code"] == "INVALID_EXPORT_FORMAT"
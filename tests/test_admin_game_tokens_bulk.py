@@ -0,0 +1,98 @@
+"""Admin bulk token grant/revoke with set-based writes."""
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.game_wallet import GameTokenType, UserGameWallet
+from app.models.game_wallet_ledger import UserGameWalletLedger
+from app.models.user import User
+from app.models.user_segment import UserSegment
+from app.services.game_token_bulk_service import GameTokenBulkService
+
+
+def _seed_users(session_factory) -> None:
+    session: Session = session_factory()
+    # Users 11..15 (user 1 gets default wallets from the test client).
+    session.add_all([User(id=i, external_id=f"u{i}", status="ACTIVE") for i in range(11, 16)])
+    session.add_all([UserSegment(user_id=i, segment="VIP") for i in (14, 15)])
+    # User 12 already holds tickets; the others have no wallet row yet.
+    session.add(UserGameWallet(user_id=12, token_type=GameTokenType.LOTTERY_TICKET, balance=3))
+    session.commit()
+    session.close()
+
+
+def _balances(session: Session) -> dict[int, int]:
+    rows = session.query(UserGameWallet.user_id, UserGameWallet.balance).filter(
+        UserGameWallet.token_type == GameTokenType.LOTTERY_TICKET
+    )
+    return {user_id: balance for user_id, balance in rows}
+
+
+def test_bulk_grant_upserts_wallets_and_writes_ledger(client: TestClient, session_factory) -> None:
+    _seed_users(session_factory)
+
+    resp = client.post(
+        "/admin/api/game-tokens/bulk-grant",
+        json={"user_ids": [12, 13], "external_ids": ["u11", "nobody"], "segment": "VIP", "token_type": "LOTTERY_TICKET", "amount": 2},
+    )
+    assert resp.status_code == 200, resp.text
+    data = resp.json()
+    assert (data["requested"], data["applied"]) == (5, 5)
+    assert data["not_found"] == ["nobody"]
+
+    session: Session = session_factory()
+    balances = _balances(session)
+    assert {uid: balances[uid] for uid in range(11, 16)} == {11: 2, 12: 5, 13: 2, 14: 2, 15: 2}
+    ledger = session.query(UserGameWalletLedger).filter(UserGameWalletLedger.reason == "BULK_GRANT").all()
+    assert sorted((row.user_id, row.balance_after) for row in ledger) == [(11, 2), (12, 5), (13, 2), (14, 2), (15, 2)]
+    session.close()
+
+
+def test_bulk_revoke_skips_wallets_below_amount(client: TestClient, session_factory) -> None:
+    _seed_users(session_factory)
+
+    resp = client.post(
+        "/admin/api/game-tokens/bulk-revoke",
+        json={"user_ids": [11, 12], "token_type": "LOTTERY_TICKET", "amount": 2},
+    )
+    assert resp.status_code == 200, resp.text
+    data = resp.json()
+    assert data["applied"] == 1
+    assert data["skipped_user_ids"] == [11]
+
+    session: Session = session_factory()
+    assert _balances(session)[12] == 1
+    row = session.query(UserGameWalletLedger).filter(UserGameWalletLedger.reason == "BULK_REVOKE").one()
+    assert (row.user_id, row.delta, row.balance_after) == (12, -2, 1)
+    session.close()
+
+
+def test_bulk_revoke_clamps_trial_balance_to_remaining_balance(session_factory) -> None:
+    _seed_users(session_factory)
+    session: Session = session_factory()
+    session.query(UserGameWallet).filter(UserGameWallet.user_id == 12).update({"trial_balance": 3})
+    session.commit()
+
+    GameTokenBulkService().revoke(session, [12], GameTokenType.LOTTERY_TICKET, 2)
+
+    wallet = session.query(UserGameWallet).filter(UserGameWallet.user_id == 12).one()
+    session.refresh(wallet)
+    assert (wallet.balance, wallet.trial_balance) == (1, 1)
+    session.close()
+
+
+def test_bulk_grant_reports_progress_per_chunk(session_factory) -> None:
+    _seed_users(session_factory)
+    session: Session = session_factory()
+    progress = []
+
+    GameTokenBulkService(chunk_size=2).grant(
+        session, [11, 12, 13, 14, 15], GameTokenType.LOTTERY_TICKET, 1, progress=lambda done, total: progress.append((done, total))
+    )
+
+    assert progress == [(2, 5), (4, 5), (5, 5)]
+    session.close()
+
+
+def test_bulk_grant_requires_targets(client: TestClient) -> None:
+    resp = client.post("/admin/api/game-tokens/bulk-grant", json={"token_type": "LOTTERY_TICKET", "amount": 1})
+    assert resp.status_code == 400
@@ -0,0 +1,106 @@
+"""Keyset (cursor) pagination for admin ledger and play-log browsing."""
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.dice import DiceConfig, DiceLog
+from app.models.game_wallet import GameTokenType
+from app.models.game_wallet_ledger import UserGameWalletLedger
+from app.models.lottery import LotteryConfig, LotteryLog, LotteryPrize
+from app.models.user import User
+
+
+def _walk(client: TestClient, path: str, limit: int, **params) -> list[dict]:
+    items: list[dict] = []
+    cursor = None
+    for _ in range(20):
+        query = {"limit": limit, **params}
+        if cursor:
+            query["cursor"] = cursor
+        resp = client.get(path, params=query)
+        assert resp.status_code == 200, resp.text
+        items.extend(resp.json())
+        cursor = resp.headers.get("X-Next-Cursor")
+        if not cursor:
+            return items
+    raise AssertionError("cursor pagination did not terminate")
+
+
+def test_ledger_cursor_pages_cover_offset_order_without_gaps(client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    session.add(User(id=21, external_id="ledger-user", status="ACTIVE"))
+    base = datetime(2025, 12, 20, 12, 0, 0)
+    # Two rows per timestamp so pages split inside a created_at tie.
+    session.add_all(
+        [
+            UserGameWalletLedger(
+                user_id=21,
+                token_type=GameTokenType.DICE_TOKEN,
+                delta=1,
+                balance_after=i,
+                reason="TEST",
+                created_at=base + timedelta(minutes=i // 2),
+            )
+            for i in range(7)
+        ]
+    )
+    session.commit()
+    session.close()
+
+    full = client.get("/admin/api/game-tokens/ledger", params={"user_id": 21, "limit": 500}).json()
+    assert len(full) == 7
+
+    paged = _walk(client, "/admin/api/game-tokens/ledger", 2, user_id=21)
+    assert [row["id"] for row in paged] == [row["id"] for row in full]
+    assert [row["balance_after"] for row in paged] == [6, 5, 4, 3, 2, 1, 0]
+
+
+def test_play_log_cursor_merges_games_on_equal_timestamps(client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    user = User(id=22, external_id="log-user", status="ACTIVE")
+    dice_cfg = DiceConfig(
+        name="PAGED_DICE",
+        is_active=True,
+        max_daily_plays=0,
+        win_reward_type="POINT",
+        win_reward_amount=1,
+        draw_reward_type="POINT",
+        draw_reward_amount=1,
+        lose_reward_type="NONE",
+        lose_reward_amount=0,
+    )
+    lotto_cfg = LotteryConfig(name="PAGED_LOTTERY", is_active=True, max_daily_tickets=0)
+    prize = LotteryPrize(config=lotto_cfg, label="P1", reward_type="POINT", reward_amount=5, weight=1, is_active=True)
+    session.add_all([user, dice_cfg, lotto_cfg, prize])
+    session.flush()
+    base = datetime(2025, 12, 20, 12, 0, 0)
+    for i in range(4):
+        at = base + timedelta(minutes=i)
+        session.add(
+            DiceLog(
+                user_id=22, config_id=dice_cfg.id, user_dice_1=1, user_dice_2=2, user_sum=3,
+                dealer_dice_1=1, dealer_dice_2=1, dealer_sum=2, result="WIN",
+                reward_type="POINT", reward_amount=1, created_at=at,
+            )
+        )
+        session.add(LotteryLog(user_id=22, config_id=lotto_cfg.id, prize_id=prize.id, reward_type="POINT", reward_amount=5, created_at=at))
+    session.commit()
+    session.close()
+
+    full = client.get("/admin/api/game-tokens/play-logs", params={"external_id": "log-user", "limit": 200}).json()
+    assert len(full) == 8
+    assert [row["game"] for row in full[:2]] == ["LOTTERY", "DICE"]
+
+    paged = _walk(client, "/admin/api/game-tokens/play-logs", 3, external_id="log-user")
+    assert [(row["game"], row["id"]) for row in paged] == [(row["game"], row["id"]) for row in full]
+
+    # Legacy offset paging still matches.
+    second = client.get("/admin/api/game-tokens/play-logs", params={"external_id": "log-user", "limit": 3, "offset": 3}).json()
+    assert [(row["game"], row["id"]) for row in second] == [(row["game"], row["id"]) for row in full[3:6]]
+
+
+def test_invalid_cursor_is_rejected(client: TestClient) -> None:
+    resp = client.get("/admin/api/game-tokens/ledger", params={"cursor": "not-a-cursor"})
+    assert resp.status_code == 400
+    assert resp.json()["error"]["code"] == "INVALID_CURSOR"
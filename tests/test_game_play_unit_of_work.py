@@ -0,0 +1,93 @@
+"""Game plays run as a single transaction: a failing step leaves no partial state."""
+from datetime import date
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.models.feature import FeatureConfig, FeatureSchedule, FeatureType, UserEventLog
+from app.models.game_wallet import GameTokenType, UserGameWallet
+from app.models.game_wallet_ledger import UserGameWalletLedger
+from app.models.outbox_event import OutboxEvent
+from app.models.roulette import RouletteConfig, RouletteLog, RouletteSegment
+from app.models.user import User
+from app.services.reward_service import RewardService
+from app.services.roulette_service import RouletteService
+
+
+@pytest.fixture()
+def seeded_session(session_factory) -> Session:
+    session: Session = session_factory()
+    today = date.today()
+    config = RouletteConfig(name="UOW_ROULETTE", is_active=True, max_daily_spins=0)
+    session.add_all(
+        [
+            User(id=1, external_id="tester", status="ACTIVE"),
+            FeatureSchedule(date=today, feature_type=FeatureType.ROULETTE, is_active=True),
+            FeatureConfig(feature_type=FeatureType.ROULETTE, title="Roulette", page_path="/roulette", is_enabled=True),
+            config,
+            UserGameWallet(user_id=1, token_type=GameTokenType.ROULETTE_COIN, balance=3),
+        ]
+    )
+    session.flush()
+    session.add_all(
+        [
+            RouletteSegment(config_id=config.id, slot_index=i, label=f"S{i}", reward_type="POINT", reward_amount=10, weight=1)
+            for i in range(6)
+        ]
+    )
+    session.commit()
+    yield session
+    session.close()
+
+
+def _roulette_balance(session: Session) -> int:
+    return (
+        session.query(UserGameWallet.balance)
+        .filter(UserGameWallet.user_id == 1, UserGameWallet.token_type == GameTokenType.ROULETTE_COIN)
+        .scalar()
+    )
+
+
+def test_failed_reward_delivery_rolls_back_entire_play(seeded_session: Session, monkeypatch) -> None:
+    def _boom(*_args, **_kwargs):
+        raise RuntimeError("delivery failed")
+
+    monkeypatch.setattr(RewardService, "deliver_many", _boom)
+
+    with pytest.raises(RuntimeError):
+        RouletteService().play(seeded_session, user_id=1, now=date.today())
+
+    seeded_session.expire_all()
+    assert _roulette_balance(seeded_session) == 3
+    assert seeded_session.query(RouletteLog).count() == 0
+    assert seeded_session.query(UserEventLog).count() == 0
+    assert seeded_session.query(UserGameWalletLedger).count() == 0
+
+
+def test_successful_play_commits_once_with_outbox(seeded_session: Session, monkeypatch) -> None:
+    monkeypatch.setenv("PLAY_OUTBOX_ENABLED", "true")
+    get_settings.cache_clear()
+    commits = []
+    original_commit = seeded_session.commit
+
+    def _counting_commit() -> None:
+        commits.append(1)
+        original_commit()
+
+    seeded_session.commit = _counting_commit  # type: ignore[method-assign]
+
+    try:
+        RouletteService().play(seeded_session, user_id=1, now=date.today())
+    finally:
+        monkeypatch.delenv("PLAY_OUTBOX_ENABLED")
+        get_settings.cache_clear()
+
+    seeded_session.expire_all()
+    assert _roulette_balance(seeded_session) == 2
+    assert seeded_session.query(RouletteLog).count() == 1
+    assert seeded_session.query(UserEventLog).count() == 1
+    # Wallet, ledger, logs, point reward and outbox rows land in a single commit.
+    assert len(commits) == 1
+    assert seeded_session.query(User).filter(User.id == 1).one().cash_balance == 10
+    assert {e.event_type for e in seeded_session.query(OutboxEvent).all()} == {"TEAM_BATTLE_GAME_PLAY", "SEASON_PASS_INTERNAL_WIN"}
@@ -0,0 +1,98 @@
+"""Admin payout simulator: vectorized draws match configured odds and stock depletion."""
+import pytest
+from fastapi.testclient import TestClient
+
+pytest.importorskip("numpy")
+
+
+def _segments(weights: list[int]) -> list[dict]:
+    return [
+        {
+            "slot_index": i,
+            "label": f"S{i}",
+            "weight": w,
+            "reward_type": "POINT",
+            "reward_amount": (i + 1) * 100,
+            "is_jackpot": i == len(weights) - 1,
+        }
+        for i, w in enumerate(weights)
+    ]
+
+
+def test_roulette_simulation_matches_weights(client: TestClient) -> None:
+    weights = [30, 25, 20, 15, 8, 2]
+    resp = client.post(
+        "/admin/api/simulation/roulette",
+        json={"segments": _segments(weights), "plays": 200_000, "seed": 7, "cost_per_play": 500},
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+
+    assert data["plays_simulated"] == 200_000
+    for outcome, weight in zip(data["outcomes"], weights):
+        assert outcome["expected_rate"] == pytest.approx(weight / 100)
+        assert outcome["observed_rate"] == pytest.approx(weight / 100, abs=0.005)
+    expected_mean = sum(w / 100 * (i + 1) * 100 for i, w in enumerate(weights))
+    assert data["mean_payout"] == pytest.approx(expected_mean, rel=0.02)
+    assert data["rtp"] == pytest.approx(data["mean_payout"] / 500)
+    assert data["jackpot_rate"] == pytest.approx(0.02, abs=0.003)
+    assert list(data["block_payout_percentiles"]) == ["p1", "p5", "p25", "p50", "p75", "p95", "p99"]
+
+
+def test_lottery_simulation_depletes_stock_in_play_order(client: TestClient) -> None:
+    prizes = [
+        {"label": "Limited", "weight": 50, "stock": 100, "reward_type": "POINT", "reward_amount": 1000},
+        {"label": "Common", "weight": 50, "stock": None, "reward_type": "POINT", "reward_amount": 10},
+        {"label": "Inactive", "weight": 50, "stock": None, "reward_type": "POINT", "reward_amount": 5, "is_active": False},
+    ]
+    resp = client.post(
+        "/admin/api/simulation/lottery",
+        json={"prizes": prizes, "plays": 10_000, "seed": 1, "plays_per_hour": 1000},
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+
+    limited, common = data["outcomes"]
+    assert (limited["label"], common["label"]) == ("Limited", "Common")
+    # Exactly the stock is won, then the prize leaves the pool.
+    assert round(limited["observed_rate"] * data["plays_simulated"]) == 100
+    depletion = data["stock_depletion"][0]
+    assert depletion["label"] == "Limited"
+    assert 100 <= depletion["sold_out_at_play"] < 1000
+    assert depletion["sold_out_at_hour"] == pytest.approx(depletion["sold_out_at_play"] / 1000)
+    assert limited["is_jackpot"] is True
+    assert data["exhausted_at_play"] is None
+
+
+def test_lottery_simulation_reports_exhaustion(client: TestClient) -> None:
+    prizes = [{"label": "Only", "weight": 1, "stock": 5, "reward_type": "POINT", "reward_amount": 1}]
+    data = client.post("/admin/api/simulation/lottery", json={"prizes": prizes, "plays": 100, "seed": 3}).json()
+
+    assert data["plays_simulated"] == 5
+    assert data["exhausted_at_play"] == 5
+
+
+def test_dice_simulation_uses_exact_two_dice_odds(client: TestClient) -> None:
+    rewards = {
+        "win_reward_type": "POINT",
+        "win_reward_value": 200,
+        "draw_reward_type": "POINT",
+        "draw_reward_value": 50,
+        "lose_reward_type": "NONE",
+        "lose_reward_value": 0,
+    }
+    data = client.post("/admin/api/simulation/dice", json={"rewards": rewards, "plays": 200_000, "seed": 11}).json()
+
+    win, draw, lose = data["outcomes"]
+    assert win["expected_rate"] == pytest.approx(575 / 1296)
+    assert draw["expected_rate"] == pytest.approx(146 / 1296)
+    assert lose["expected_rate"] == pytest.approx(575 / 1296)
+    assert win["observed_rate"] == pytest.approx(win["expected_rate"], abs=0.005)
+    assert data["reward_type_means"] == {"POINT": pytest.approx(data["mean_payout"])}
+
+
+def test_simulation_requires_a_config(client: TestClient) -> None:
+    resp = client.post("/admin/api/simulation/roulette", json={})
+    assert resp.status_code == 400
+    assert resp.json()["error"]["code"] == "SIMULATION_CONFIG_REQUIRED"
+    assert client.post("/admin/api/simulation/dice", json={"config_id": 999}).status_code == 404
@@ -0,0 +1,142 @@
+"""GameWalletService consume path: one conditional UPDATE per wallet, one commit."""
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.exceptions import NotEnoughTokensError
+from app.models.game_wallet import GameTokenType, UserGameWallet
+from app.models.game_wallet_ledger import UserGameWalletLedger
+from app.services.game_wallet_service import GameWalletService
+
+
+def _set_balance(session: Session, balance: int) -> UserGameWallet:
+    wallet = (
+        session.query(UserGameWallet)
+        .filter(UserGameWallet.user_id == 1, UserGameWallet.token_type == GameTokenType.DICE_TOKEN)
+        .one_or_none()
+    ) or UserGameWallet(user_id=1, token_type=GameTokenType.DICE_TOKEN)
+    wallet.balance = balance
+    session.add(wallet)
+    session.commit()
+    return wallet
+
+
+def test_consume_commits_once_and_updates_loaded_wallet(session_factory) -> None:
+    session: Session = session_factory()
+    wallet = _set_balance(session, 3)
+    commits = []
+    original_commit = session.commit
+
+    def _counting_commit() -> None:
+        commits.append(1)
+        original_commit()
+
+    session.commit = _counting_commit  # type: ignore[method-assign]
+
+    balance, consumed_trial = GameWalletService().require_and_consume_token(
+        session, user_id=1, token_type=GameTokenType.DICE_TOKEN, amount=2, reason="DICE_PLAY"
+    )
+
+    assert (balance, consumed_trial) == (1, False)
+    assert len(commits) == 1
+    # The already-loaded instance reflects the UPDATE without a refresh.
+    assert wallet.balance == 1
+    ledger = session.query(UserGameWalletLedger).filter(UserGameWalletLedger.reason == "DICE_PLAY").one()
+    assert (ledger.delta, ledger.balance_after) == (-2, 1)
+    session.close()
+
+
+def test_consume_rejects_overspend_without_writes(session_factory) -> None:
+    session: Session = session_factory()
+    _set_balance(session, 1)
+
+    with pytest.raises(NotEnoughTokensError):
+        GameWalletService().require_and_consume_token(session, user_id=1, token_type=GameTokenType.DICE_TOKEN, amount=2)
+    session.rollback()
+
+    balance = (
+        session.query(UserGameWallet.balance)
+        .filter(UserGameWallet.user_id == 1, UserGameWallet.token_type == GameTokenType.DICE_TOKEN)
+        .scalar()
+    )
+    assert balance == 1
+    assert session.query(UserGameWalletLedger).count() == 0
+    session.close()
+
+
+def test_get_balances_reads_all_types_without_creating_wallets(session_factory) -> None:
+    session: Session = session_factory()
+    session.query(UserGameWallet).filter(
+        UserGameWallet.user_id == 1, UserGameWallet.token_type == GameTokenType.CC_COIN
+    ).delete()
+    session.commit()
+    _set_balance(session, 4)
+    service = GameWalletService()
+
+    balances = service.get_balances(session, user_id=1)
+
+    assert set(balances) == set(GameTokenType)
+    assert balances[GameTokenType.DICE_TOKEN] == 4
+    assert balances[GameTokenType.CC_COIN] == 0
+    assert service.get_balance(session, user_id=1, token_type=GameTokenType.CC_COIN) == 0
+    assert not session.new and not session.dirty
+    assert (
+        session.query(UserGameWallet)
+        .filter(UserGameWallet.user_id == 1, UserGameWallet.token_type == GameTokenType.CC_COIN)
+        .count()
+        == 0
+    )
+
+    # The first grant provisions the row.
+    assert service.grant_tokens(session, user_id=1, token_type=GameTokenType.CC_COIN, amount=2) == 2
+    session.close()
+
+
+def _count_ledger_inserts(session: Session) -> list[int]:
+    inserts: list[int] = []
+
+    @event.listens_for(session.get_bind(), "before_cursor_execute")
+    def _on_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        if statement.startswith("INSERT INTO user_game_wallet_ledger"):
+            inserts.append(len(parameters) if executemany else 1)
+
+    return inserts
+
+
+def test_write_combining_inserts_consumption_rows_once_at_commit(session_factory, monkeypatch) -> None:
+    monkeypatch.setattr(get_settings(), "wallet_ledger_write_combining", True)
+    session: Session = session_factory()
+    _set_balance(session, 10)
+    inserts = _count_ledger_inserts(session)
+    service = GameWalletService()
+
+    service.consume_tokens_for_plays(session, 1, GameTokenType.DICE_TOKEN, ["a", "b", "c"], reason="DICE_PLAY", commit=False)
+    service.require_and_consume_token(session, 1, GameTokenType.DICE_TOKEN, amount=2, reason="DICE_PLAY", commit=False)
+    assert inserts == []
+    session.commit()
+
+    assert inserts == [4]
+    rows = session.query(UserGameWalletLedger).order_by(UserGameWalletLedger.id).all()
+    assert [(row.label, row.balance_after) for row in rows] == [("a", 9), ("b", 8), ("c", 7), (None, 5)]
+    session.close()
+
+
+def test_write_combining_drops_rows_of_rolled_back_transactions(session_factory, monkeypatch) -> None:
+    monkeypatch.setattr(get_settings(), "wallet_ledger_write_combining", True)
+    session: Session = session_factory()
+    _set_balance(session, 10)
+    service = GameWalletService()
+
+    service.require_and_consume_token(session, 1, GameTokenType.DICE_TOKEN, reason="ROLLED_BACK", commit=False)
+    session.rollback()
+    service.require_and_consume_token(session, 1, GameTokenType.DICE_TOKEN, reason="KEPT", commit=False)
+    with pytest.raises(RuntimeError):
+        with session.begin_nested():
+            service.require_and_consume_token(session, 1, GameTokenType.DICE_TOKEN, reason="SAVEPOINT", commit=False)
+            raise RuntimeError("play failed")
+    session.commit()
+
+    assert [row.reason for row in session.query(UserGameWalletLedger)] == ["KEPT"]
+    assert service.get_balance(session, 1, GameTokenType.DICE_TOKEN) == 9
+    session.close()
@@ -0,0 +1,62 @@
+"""Tests for ledger/balance reconciliation over user-id ranges."""
+
+from app.models.game_wallet import GameTokenType, UserGameWallet
+from app.models.game_wallet_ledger import UserGameWalletLedger
+from app.models.user import User
+from app.models.user_cash_ledger import UserCashLedger
+from app.models.vault_earn_event import VaultEarnEvent
+from app.services.game_wallet_service import GameWalletService
+from app.services.ledger_reconciliation_service import reconcile_range, repair_drifts, user_id_ranges
+from app.services.reward_service import RewardService
+
+
+def _seed(db):
+    for user_id in (41, 42, 43):
+        db.add(User(id=user_id, external_id=f"reconcile-{user_id}"))
+    db.commit()
+    # 41: everything went through the services, so it is clean.
+    RewardService().grant_point(db, user_id=41, amount=100, reason="TEST")
+    GameWalletService().grant_tokens(db, 41, GameTokenType.DICE_TOKEN, 3, reason="TEST")
+    # 42: balances edited behind the ledger's back.
+    user = db.get(User, 42)
+    user.cash_balance = 70
+    user.vault_locked_balance = 500
+    db.add(UserGameWallet(user_id=42, token_type=GameTokenType.ROULETTE_COIN, balance=5))
+    db.add(UserCashLedger(user_id=42, delta=50, balance_after=50, reason="TEST"))
+    db.add(VaultEarnEvent(user_id=42, earn_event_id="reconcile-42", earn_type="GAME_PLAY", amount=200, source="DICE"))
+    # 43: ledger rows for a wallet that was never created.
+    db.add(UserGameWalletLedger(user_id=43, token_type=GameTokenType.LOTTERY_TICKET, delta=2, balance_after=2))
+    db.commit()
+
+
+def test_reconcile_range_reports_only_drifted_users(session_factory):
+    db = session_factory()
+    _seed(db)
+
+    with db.get_bind().connect() as conn:
+        drifts = reconcile_range(conn, 41, 43)
+        assert user_id_ranges(conn, 2)[-1][1] >= 43
+
+    found = {(d.check, d.user_id, d.token_type): (d.balance, d.ledger_total) for d in drifts}
+    assert found == {
+        ("cash", 42, None): (70, 50),
+        ("wallet", 42, "ROULETTE_COIN"): (5, 0),
+        ("wallet", 43, "LOTTERY_TICKET"): (0, 2),
+        ("vault", 42, None): (500, 200),
+    }
+
+
+def test_repair_drifts_balances_the_ledger_and_skips_vault(session_factory):
+    db = session_factory()
+    _seed(db)
+
+    with db.get_bind().begin() as conn:
+        assert repair_drifts(conn, reconcile_range(conn, 41, 43)) == 3
+
+    with db.get_bind().connect() as conn:
+        remaining = reconcile_range(conn, 41, 43)
+    assert [(d.check, d.user_id) for d in remaining] == [("vault", 42)]
+    db.expire_all()
+    assert db.get(User, 42).cash_balance == 70
+    adjust = db.query(UserCashLedger).filter(UserCashLedger.reason == "RECONCILE_ADJUST").one()
+    assert (adjust.user_id, adjust.delta, adjust.balance_after) == (42, 20, 70)
@@ -0,0 +1,112 @@
+"""Tests for LevelXPService level-up reward logging."""
+
+from sqlalchemy import event
+
+from app.db import upsert
+from app.db.upsert import insert_ignore, insert_ignore_keys
+from app.models.level_xp import UserLevelRewardLog
+from app.models.user import User
+from app.services import level_xp_service
+from app.services.level_xp_service import LevelXPService
+from app.services.reward_delivery_queue_service import RewardDeliveryQueueService
+
+
+def test_add_xp_checks_claimed_levels_once_and_inserts_new_logs_together(session_factory) -> None:
+    db = session_factory()
+    db.add(User(id=31, external_id="level-xp"))
+    db.commit()
+    service = LevelXPService()
+    service.add_xp(db, user_id=31, delta=100, source="TEST")  # levels 1-3
+    db.commit()
+
+    statements: list[str] = []
+
+    @event.listens_for(db.get_bind(), "before_cursor_execute")
+    def _on_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        if "user_level_reward_log" in statement:
+            statements.append(statement.split()[0])
+
+    result = service.add_xp(db, user_id=31, delta=1500, source="TEST")  # reaches levels 4-10
+    db.commit()
+
+    assert [reward["level"] for reward in result["new_rewards"]] == [4, 5, 6, 7, 8, 9, 10]
+    assert result["level"] == 10
+    assert statements == ["SELECT", "INSERT"]
+    levels = [row.level for row in db.query(UserLevelRewardLog).filter(UserLevelRewardLog.user_id == 31).order_by(UserLevelRewardLog.level)]
+    assert levels == list(range(1, 11))
+
+
+def test_insert_ignore_skips_rows_that_hit_the_unique_key(session_factory) -> None:
+    db = session_factory()
+    db.add(User(id=32, external_id="insert-ignore"))
+    db.add(UserLevelRewardLog(user_id=32, level=1, reward_type="TICKET_ROULETTE", auto_granted=True))
+    db.commit()
+
+    inserted = insert_ignore(
+        db,
+        UserLevelRewardLog.__table__,
+        [
+            {"user_id": 32, "level": level, "reward_type": "TICKET_DICE", "auto_granted": False}
+            for level in (1, 2)
+        ],
+        keys=["user_id", "level"],
+    )
+    db.commit()
+
+    assert inserted == 1
+    rows = {row.level: row.reward_type for row in db.query(UserLevelRewardLog).filter(UserLevelRewardLog.user_id == 32)}
+    assert rows == {1: "TICKET_ROULETTE", 2: "TICKET_DICE"}
+
+
+def test_insert_ignore_keys_returns_only_inserted_rows(session_factory) -> None:
+    db = session_factory()
+    db.add(User(id=33, external_id="insert-ignore-keys"))
+    db.add(UserLevelRewardLog(user_id=33, level=2, reward_type="TICKET_DICE", auto_granted=True))
+    db.commit()
+
+    inserted = insert_ignore_keys(
+        db,
+        UserLevelRewardLog.__table__,
+        [{"user_id": 33, "level": level, "reward_type": "TICKET_DICE", "auto_granted": False} for level in (1, 2, 3)],
+        keys=["user_id", "level"],
+    )
+
+    assert inserted == {(33, 1), (33, 3)}
+
+
+def test_add_xp_skips_levels_claimed_concurrently(session_factory, monkeypatch) -> None:
+    db = session_factory()
+    db.add(User(id=34, external_id="level-race"))
+    db.commit()
+
+    def racing_insert(db, table, rows, *, keys):
+        # Another XP event claims level 2 between the claimed-set SELECT and our INSERT.
+        db.add(UserLevelRewardLog(user_id=34, level=2, reward_type="TICKET_DICE", auto_granted=True))
+        db.flush()
+        return upsert.insert_ignore_keys(db, table, rows, keys=keys)
+
+    monkeypatch.setattr(level_xp_service, "insert_ignore_keys", racing_insert)
+    delivered: list[str] = []
+    monkeypatch.setattr(
+        RewardDeliveryQueueService,
+        "deliver_or_enqueue",
+        lambda self, db, user_id, source, batches, commit=True: delivered.extend(key for key, _ in batches) or True,
+    )
+
+    result = LevelXPService().add_xp(db, user_id=34, delta=100, source="TEST")  # levels 1-3
+
+    assert [reward["level"] for reward in result["new_rewards"]] == [1, 3]
+    assert delivered == ["LEVEL_XP:34:1", "LEVEL_XP:34:3"]
+    assert result["level"] == 3
+
+
+def test_add_xp_leaves_the_commit_to_the_caller(session_factory) -> None:
+    db = session_factory()
+    db.add(User(id=35, external_id="level-no-commit"))
+    db.commit()
+
+    LevelXPService().add_xp(db, user_id=35, delta=100, source="TEST")
+    db.rollback()
+
+    assert db.query(UserLevelRewardLog).filter(UserLevelRewardLog.user_id == 35).count() == 0
+    assert int(db.get(User, 35).cash_balance or 0) == 0
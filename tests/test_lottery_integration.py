@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 from app.models.feature import FeatureConfig, FeatureSchedule, FeatureType
 from app.models.lottery import LotteryConfig, LotteryPrize
 from app.models.user import User
+from app.services.lottery_stock_service import LotteryStockService
 
 
 @pytest.fixture()
@@ -50,3 +51,78 @@ def test_lottery_play_returns_prize(client: TestClient) -> None:
     data = resp.json()
     assert data["result"] == "OK"
     assert data["prize"]["reward_type"] == "POINT"
+
+
+def test_lottery_stock_reservation_redraws_when_sold_out(client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    today = date.today()
+    lotto_cfg = LotteryConfig(name="STOCK_LOTTERY", is_active=True, max_daily_tickets=0)
+    limited = LotteryPrize(config=lotto_cfg, label="LIMITED", reward_type="POINT", reward_amount=5, weight=1000, stock=1, is_active=True)
+    unlimited = LotteryPrize(config=lotto_cfg, label="UNLIMITED", reward_type="POINT", reward_amount=1, weight=1, stock=None, is_active=True)
+    session.add_all(
+        [
+            User(id=1, external_id="tester", status="ACTIVE"),
+            FeatureSchedule(date=today, feature_type=FeatureType.LOTTERY, is_active=True),
+            FeatureConfig(feature_type=FeatureType.LOTTERY, title="Lottery Day", page_path="/lottery", is_enabled=True),
+            lotto_cfg,
+            limited,
+            unlimited,
+        ]
+    )
+    session.commit()
+    limited_id = limited.id
+    session.close()
+
+    labels = []
+    for _ in range(3):
+        resp = client.post("/api/lottery/play")
+        assert resp.status_code == 200, resp.text
+        labels.append(resp.json()["prize"]["label"])
+
+    assert labels.count("LIMITED") == 1
+    session = session_factory()
+    assert session.get(LotteryPrize, limited_id).stock == 0
+    session.close()
+
+
+def test_lottery_stock_reserve_is_conditional(session_factory) -> None:
+    session: Session = session_factory()
+    cfg = LotteryConfig(name="RESERVE", is_active=False, max_daily_tickets=0)
+    prize = LotteryPrize(config=cfg, label="ONE", reward_type="NONE", reward_amount=0, weight=1, stock=1, is_active=True)
+    session.add_all([cfg, prize])
+    session.commit()
+
+    assert LotteryStockService.reserve(session, prize.id) is True
+    assert LotteryStockService.reserve(session, prize.id) is False
+    session.commit()
+    session.refresh(prize)
+    assert prize.stock == 0
+    session.close()
+
+
+@pytest.mark.usefixtures("seed_lottery")
+def test_lottery_batch_play_reserves_stock_per_draw(client: TestClient, session_factory) -> None:
+    resp = client.post("/api/lottery/play", params={"count": 3})
+    assert resp.status_code == 200, resp.text
+    assert [prize["label"] for prize in resp.json()["results"]] == ["P1", "P1", "P1"]
+
+    session: Session = session_factory()
+    assert session.query(LotteryPrize).filter(LotteryPrize.label == "P1").one().stock == 7
+    session.close()
+
+
+@pytest.mark.usefixtures("seed_lottery")
+def test_lottery_play_reads_only_limited_prize_stock_once_cached(client: TestClient, session_factory) -> None:
+    from sqlalchemy import event
+
+    assert client.post("/api/lottery/play").status_code == 200  # builds the prize snapshot
+
+    prize_selects: list[str] = []
+
+    @event.listens_for(session_factory().get_bind(), "before_cursor_execute")
+    def _on_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        if statement.startswith("SELECT") and "FROM lottery_prize" in statement:
+            prize_selects.append(statement.split("FROM")[0].strip())
+
+    assert client.post("/api/lottery/play").status_code == 200
+    assert prize_selects == ["SELECT lottery_prize.id"]
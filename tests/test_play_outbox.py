@@ -0,0 +1,91 @@
+"""Outbox mode: plays enqueue side effects; the worker applies them with retries."""
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.models.feature import FeatureConfig, FeatureSchedule, FeatureType
+from app.models.game_wallet import GameTokenType, UserGameWallet
+from app.models.outbox_event import OutboxEvent
+from app.models.roulette import RouletteConfig, RouletteSegment
+from app.models.user import User
+from app.services.outbox_service import SEASON_PASS_INTERNAL_WIN, OutboxService
+from app.services.roulette_service import RouletteService
+
+
+@pytest.fixture()
+def outbox_session(session_factory, monkeypatch) -> Session:
+    monkeypatch.setenv("PLAY_OUTBOX_ENABLED", "true")
+    get_settings.cache_clear()
+    session: Session = session_factory()
+    today = date.today()
+    config = RouletteConfig(name="OUTBOX_ROULETTE", is_active=True, max_daily_spins=0)
+    session.add_all(
+        [
+            User(id=1, external_id="tester", status="ACTIVE"),
+            FeatureSchedule(date=today, feature_type=FeatureType.ROULETTE, is_active=True),
+            FeatureConfig(feature_type=FeatureType.ROULETTE, title="Roulette", page_path="/roulette", is_enabled=True),
+            config,
+            UserGameWallet(user_id=1, token_type=GameTokenType.ROULETTE_COIN, balance=5),
+        ]
+    )
+    session.flush()
+    session.add_all(
+        [
+            RouletteSegment(config_id=config.id, slot_index=i, label=f"S{i}", reward_type="POINT", reward_amount=10, weight=1)
+            for i in range(6)
+        ]
+    )
+    session.commit()
+    yield session
+    session.close()
+    monkeypatch.delenv("PLAY_OUTBOX_ENABLED")
+    get_settings.cache_clear()
+
+
+def test_worker_applies_enqueued_side_effects(outbox_session: Session) -> None:
+    RouletteService().play(outbox_session, user_id=1, now=date.today(), count=2)
+
+    events = outbox_session.query(OutboxEvent).all()
+    assert events and all(e.status == "PENDING" for e in events)
+    # Each key is unique, so a retried request cannot enqueue the same effect twice.
+    assert len({e.idempotency_key for e in events}) == len(events)
+
+    summary = OutboxService().process_batch(outbox_session)
+
+    assert summary == {"claimed": len(events), "done": len(events), "retried": 0, "failed": 0}
+    outbox_session.expire_all()
+    assert all(e.status == "DONE" and e.processed_at is not None for e in outbox_session.query(OutboxEvent).all())
+    assert OutboxService().process_batch(outbox_session)["claimed"] == 0
+
+
+def test_failing_handler_backs_off_then_fails(outbox_session: Session, monkeypatch) -> None:
+    def _boom(_db, _payload):
+        raise RuntimeError("downstream unavailable")
+
+    monkeypatch.setitem(OutboxService.HANDLERS, SEASON_PASS_INTERNAL_WIN, _boom)
+    OutboxService.enqueue(outbox_session, SEASON_PASS_INTERNAL_WIN, "test:1", {"user_id": 1, "day": date.today().isoformat()})
+    outbox_session.commit()
+
+    service = OutboxService()
+    now = datetime.utcnow()
+    summary = service.process_batch(outbox_session, now=now)
+    assert summary["retried"] == 1
+
+    event = outbox_session.query(OutboxEvent).one()
+    assert event.status == "PENDING"
+    assert event.attempts == 1
+    assert event.next_attempt_at > now
+    assert "downstream unavailable" in event.last_error
+    # Not due yet: nothing is claimed until the backoff elapses.
+    assert service.process_batch(outbox_session, now=now)["claimed"] == 0
+
+    for _ in range(service.MAX_ATTEMPTS - 1):
+        now += timedelta(seconds=service.BACKOFF_MAX_SECONDS + 1)
+        service.process_batch(outbox_session, now=now)
+
+    outbox_session.expire_all()
+    event = outbox_session.query(OutboxEvent).one()
+    assert event.status == "FAILED"
+    assert event.attempts == service.MAX_ATTEMPTS
@@ -0,0 +1,163 @@
+"""Failed season-pass reward deliveries are queued and re-delivered by the worker."""
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.models.reward_delivery_job import RewardDeliveryJob
+from app.models.season_pass import SeasonPassConfig, SeasonPassLevel, SeasonPassRewardLog
+from app.models.user import User
+from app.models.user_cash_ledger import UserCashLedger
+from app.services.reward_delivery_queue_service import RewardDeliveryQueueService
+from app.services.reward_service import RewardService
+
+
+@pytest.fixture()
+def seed_season(session_factory) -> int:
+    session: Session = session_factory()
+    today = date.today()
+    season = SeasonPassConfig(
+        season_name="RETRY_SEASON",
+        start_date=today - timedelta(days=1),
+        end_date=today + timedelta(days=7),
+        max_level=3,
+        base_xp_per_stamp=10,
+        is_active=True,
+    )
+    session.add_all(
+        [
+            User(id=1, external_id="tester", status="ACTIVE"),
+            season,
+            SeasonPassLevel(season=season, level=1, required_xp=0, reward_type="POINT", reward_amount=1, auto_claim=True),
+            SeasonPassLevel(season=season, level=2, required_xp=10, reward_type="POINT", reward_amount=7, auto_claim=True),
+        ]
+    )
+    session.commit()
+    season_id = season.id
+    session.close()
+    return season_id
+
+
+def _lock_timeout(*_args, **_kwargs):
+    raise OperationalError("UPDATE user", {}, Exception("Lock wait timeout exceeded"))
+
+
+def _cash(session: Session) -> int:
+    return int(session.query(User.cash_balance).filter(User.id == 1).scalar() or 0)
+
+
+def test_failed_auto_claim_is_queued_then_delivered_once(client: TestClient, session_factory, seed_season, monkeypatch) -> None:
+    original = RewardService.deliver_many
+    monkeypatch.setattr(RewardService, "deliver_many", _lock_timeout)
+
+    resp = client.post("/api/season-pass/stamp", json={"source_feature_type": "ROULETTE", "xp_bonus": 0})
+    assert resp.status_code == 200, resp.text
+
+    session: Session = session_factory()
+    job = session.query(RewardDeliveryJob).one()
+    assert (job.status, job.source, job.idempotency_key) == ("PENDING", "SEASON_PASS_AUTO_CLAIM", f"SEASON_PASS:{seed_season}:1:2")
+    assert job.rewards_json[0]["reward_amount"] == 7
+    assert "Lock wait timeout" in job.last_error
+    # The claim is recorded with the stamp even though the grant was deferred.
+    assert session.query(SeasonPassRewardLog).filter(SeasonPassRewardLog.level == 2).count() == 1
+    assert _cash(session) == 0
+
+    monkeypatch.setattr(RewardService, "deliver_many", original)
+    service = RewardDeliveryQueueService()
+    assert service.process_batch(session)["done"] == 1
+    assert service.process_batch(session, now=datetime.utcnow() + timedelta(days=1))["claimed"] == 0
+
+    session.expire_all()
+    assert _cash(session) == 7
+    assert session.query(UserCashLedger).filter(UserCashLedger.user_id == 1).count() == 1
+    assert session.get(RewardDeliveryJob, job.id).status == "DONE"
+    session.close()
+
+
+def test_worker_backs_off_and_admin_view_shows_backlog(client: TestClient, session_factory, seed_season, monkeypatch) -> None:
+    monkeypatch.setattr(RewardService, "deliver_many", _lock_timeout)
+    assert client.post("/api/season-pass/stamp", json={"source_feature_type": "ROULETTE", "xp_bonus": 0}).status_code == 200
+
+    session: Session = session_factory()
+    service = RewardDeliveryQueueService()
+    now = datetime.utcnow()
+    assert service.process_batch(session, now=now)["retried"] == 1
+    job = session.query(RewardDeliveryJob).one()
+    assert job.attempts == 1
+    assert job.next_attempt_at == now + timedelta(seconds=service.BACKOFF_BASE_SECONDS)
+    # Not due yet.
+    assert service.process_batch(session, now=now + timedelta(seconds=1))["claimed"] == 0
+
+    job.attempts = service.MAX_ATTEMPTS - 1
+    session.commit()
+    assert service.process_batch(session, now=now + timedelta(hours=2))["failed"] == 1
+    session.close()
+
+    backlog = client.get("/admin/api/reward-delivery-jobs").json()
+    assert backlog["counts"] == {"FAILED": 1}
+    assert backlog["items"][0]["status"] == "FAILED"
+
+    retried = client.post(f"/admin/api/reward-delivery-jobs/{backlog['items'][0]['id']}/retry")
+    assert retried.status_code == 200
+    assert (retried.json()["status"], retried.json()["attempts"]) == ("PENDING", 0)
+
+
+def test_failed_bulk_delivery_is_queued_per_user(session_factory, monkeypatch) -> None:
+    from app.services.reward_service import RewardItem
+
+    monkeypatch.setattr(RewardService, "deliver_bulk", _lock_timeout)
+    session: Session = session_factory()
+    session.add_all([User(id=61, external_id="bulk-q-61"), User(id=62, external_id="bulk-q-62")])
+    session.commit()
+
+    delivered = RewardDeliveryQueueService().deliver_or_enqueue_many(
+        session,
+        "SEASON_PASS_AUTO_CLAIM",
+        {
+            61: [("SEASON_PASS:1:61:3", [RewardItem("POINT", 10)])],
+            62: [("SEASON_PASS:1:62:3", [RewardItem("POINT", 10)]), ("SEASON_PASS:1:62:4", [RewardItem("POINT", 20)])],
+        },
+    )
+
+    assert delivered is False
+    jobs = session.query(RewardDeliveryJob).order_by(RewardDeliveryJob.idempotency_key).all()
+    assert [(job.user_id, job.idempotency_key, job.status) for job in jobs] == [
+        (61, "SEASON_PASS:1:61:3", "PENDING"),
+        (62, "SEASON_PASS:1:62:3", "PENDING"),
+        (62, "SEASON_PASS:1:62:4", "PENDING"),
+    ]
+    assert session.query(UserCashLedger).filter(UserCashLedger.user_id.in_([61, 62])).count() == 0
+    session.close()
+
+
+def test_reclaimed_lease_mid_delivery_grants_once(client: TestClient, session_factory, seed_season, monkeypatch) -> None:
+    original = RewardService.deliver_many
+    monkeypatch.setattr(RewardService, "deliver_many", _lock_timeout)
+    assert client.post("/api/season-pass/stamp", json={"source_feature_type": "ROULETTE", "xp_bonus": 0}).status_code == 200
+
+    service = RewardDeliveryQueueService()
+    now = datetime.utcnow()
+    reclaim_at = now + timedelta(seconds=service.LEASE_SECONDS + 1)
+    other: Session = session_factory()
+    other_summary: dict[str, int] = {}
+
+    def slow_deliver(self, db, *args, **kwargs):
+        # Worker A stalls past its lease; worker B reclaims the job and delivers it first.
+        monkeypatch.setattr(RewardService, "deliver_many", original)
+        other_summary.update(RewardDeliveryQueueService().process_batch(other, now=reclaim_at))
+        return original(self, db, *args, **kwargs)
+
+    monkeypatch.setattr(RewardService, "deliver_many", slow_deliver)
+    session: Session = session_factory()
+    summary = service.process_batch(session, now=now)
+
+    assert (other_summary["claimed"], other_summary["done"]) == (1, 1)
+    assert (summary["claimed"], summary["done"], summary["lost"]) == (1, 0, 1)
+    session.expire_all()
+    assert _cash(session) == 7
+    assert session.query(UserCashLedger).filter(UserCashLedger.user_id == 1).count() == 1
+    assert session.query(RewardDeliveryJob).one().status == "DONE"
+    other.close()
+    session.close()
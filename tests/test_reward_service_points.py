@@ -1,8 +1,13 @@
 """Tests for RewardService point (cash) grants."""
 
+import pytest
+
+from app.core.exceptions import InvalidConfigError
+from app.models.game_wallet import GameTokenType, UserGameWallet
+from app.models.game_wallet_ledger import UserGameWalletLedger
 from app.models.user import User
 from app.models.user_cash_ledger import UserCashLedger
-from app.services.reward_service import RewardService
+from app.services.reward_service import RewardItem, RewardService
 
 
 def test_grant_point_updates_cash_balance_and_creates_ledger(session_factory):
@@ -42,3 +47,103 @@ def test_deliver_point_routes_to_grant_point(session_factory):
     assert len(ledgers) == 1
     assert ledgers[0].delta == 50
     assert ledgers[0].reason == "dice_play"
+
+
+def test_deliver_many_groups_writes_and_commits_once(session_factory):
+    db = session_factory()
+    user = User(external_id="u3", cash_balance=10)
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    commits = []
+    original_commit = db.commit
+
+    def _counting_commit():
+        commits.append(1)
+        original_commit()
+
+    db.commit = _counting_commit
+
+    RewardService().deliver_many(
+        db,
+        user_id=user.id,
+        rewards=[
+            RewardItem("POINT", 100, {"reason": "SEASON_PASS"}),
+            RewardItem("TICKET_DICE", 2, {"level": 3}),
+            RewardItem("NONE", 5),
+            RewardItem("POINT", 50, {"reason": "SEASON_PASS"}),
+            RewardItem("TICKET_DICE", 1, {"level": 4}),
+            RewardItem("TICKET_ROULETTE", 1),
+        ],
+    )
+
+    assert len(commits) == 1
+    assert db.query(User).filter(User.id == user.id).one().cash_balance == 160
+    cash = db.query(UserCashLedger).filter(UserCashLedger.user_id == user.id).order_by(UserCashLedger.id).all()
+    assert [(row.delta, row.balance_after) for row in cash] == [(100, 110), (50, 160)]
+
+    wallets = {
+        row.token_type: row.balance
+        for row in db.query(UserGameWallet).filter(UserGameWallet.user_id == user.id)
+    }
+    assert wallets == {GameTokenType.DICE_TOKEN: 3, GameTokenType.ROULETTE_COIN: 1}
+    dice_ledger = (
+        db.query(UserGameWalletLedger)
+        .filter(UserGameWalletLedger.user_id == user.id, UserGameWalletLedger.token_type == GameTokenType.DICE_TOKEN)
+        .order_by(UserGameWalletLedger.id)
+        .all()
+    )
+    assert [(row.delta, row.balance_after, row.reason) for row in dice_ledger] == [(2, 2, "LEVEL_REWARD"), (1, 3, "LEVEL_REWARD")]
+
+
+def test_deliver_many_rejects_negative_amount_before_writing(session_factory):
+    db = session_factory()
+    user = User(external_id="u4")
+    db.add(user)
+    db.commit()
+
+    with pytest.raises(InvalidConfigError):
+        RewardService().deliver_many(db, user_id=user.id, rewards=[RewardItem("POINT", 10), RewardItem("POINT", -1)])
+
+    assert db.query(UserCashLedger).filter(UserCashLedger.user_id == user.id).count() == 0
+
+
+def test_deliver_bulk_groups_writes_across_users(session_factory):
+    from sqlalchemy import event
+
+    db = session_factory()
+    users = [User(external_id=f"bulk-{i}", cash_balance=10 * i) for i in range(1, 4)]
+    db.add_all(users)
+    db.commit()
+    ids = [user.id for user in users]
+
+    statements = []
+
+    @event.listens_for(db.get_bind(), "before_cursor_execute")
+    def _on_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(" ".join(statement.split()[:3]))
+
+    RewardService().deliver_bulk(
+        db,
+        {
+            ids[0]: [RewardItem("POINT", 100), RewardItem("TICKET_DICE", 2, {"level": 3})],
+            ids[1]: [RewardItem("POINT", 5), RewardItem("POINT", 7), RewardItem("TICKET_ROULETTE", 1)],
+            ids[2]: [RewardItem("TICKET_DICE", 1), RewardItem("NONE", 3)],
+        },
+    )
+    db.commit()
+
+    # user lock read, cash UPDATE, cash ledger, wallet upsert, wallet read, wallet ledger
+    assert len([s for s in statements if not s.startswith(("SAVEPOINT", "RELEASE"))]) == 6
+    assert {u.id: u.cash_balance for u in db.query(User).filter(User.id.in_(ids))} == {ids[0]: 110, ids[1]: 32, ids[2]: 30}
+    cash = db.query(UserCashLedger).filter(UserCashLedger.user_id == ids[1]).order_by(UserCashLedger.id).all()
+    assert [(row.delta, row.balance_after) for row in cash] == [(5, 25), (7, 32)]
+    wallets = {
+        (row.user_id, row.token_type): row.balance for row in db.query(UserGameWallet).filter(UserGameWallet.user_id.in_(ids))
+    }
+    assert wallets == {
+        (ids[0], GameTokenType.DICE_TOKEN): 2,
+        (ids[1], GameTokenType.ROULETTE_COIN): 1,
+        (ids[2], GameTokenType.DICE_TOKEN): 1,
+    }
+    assert db.query(UserGameWalletLedger).filter(UserGameWalletLedger.user_id.in_(ids)).count() == 3
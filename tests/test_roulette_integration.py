@@ -1,13 +1,18 @@
 """Roulette endpoint integration tests with seeded config and schedule."""
-from datetime import date
+from datetime import date, datetime, timedelta
 
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
 from app.models.feature import FeatureConfig, FeatureSchedule, FeatureType
-from app.models.roulette import RouletteConfig, RouletteSegment
+from app.models.game_wallet import GameTokenType, UserGameWallet
+from app.models.game_wallet_ledger import UserGameWalletLedger
+from app.models.play_request_dedupe import PlayRequestDedupe
+from app.models.roulette import RouletteConfig, RouletteLog, RouletteSegment
 from app.models.user import User
+from app.models.user_cash_ledger import UserCashLedger
+from app.models.user_daily_play_counter import UserDailyPlayCounter
 
 
 def _segments(config: RouletteConfig) -> list[RouletteSegment]:
@@ -50,3 +55,124 @@ def test_roulette_play_returns_segment(client: TestClient) -> None:
     data = resp.json()
     assert data["result"] == "OK"
     assert data["segment"]["reward_type"] == "POINT"
+
+
+@pytest.mark.usefixtures("seed_roulette")
+def test_roulette_admin_edit_publishes_new_snapshot(client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    config = session.query(RouletteConfig).filter(RouletteConfig.name == "TEST_ROULETTE").one()
+    config_id, version = config.id, config.version
+    session.close()
+
+    assert client.post("/api/roulette/play").status_code == 200
+
+    payload = {
+        "name": "TEST_ROULETTE",
+        "is_active": True,
+        "max_daily_spins": 0,
+        "segments": [
+            {"index": i, "label": f"N{i}", "weight": 1, "reward_type": "POINT", "reward_value": 2, "is_jackpot": False}
+            for i in range(6)
+        ],
+    }
+    assert client.put(f"/admin/api/roulette-config/{config_id}", json=payload).status_code == 200
+
+    session = session_factory()
+    assert session.get(RouletteConfig, config_id).version == version + 1
+    session.close()
+
+    labels = {segment["label"] for segment in client.get("/api/roulette/status").json()["segments"]}
+    assert labels == {f"N{i}" for i in range(6)}
+    resp = client.post("/api/roulette/play")
+    assert resp.status_code == 200
+    assert resp.json()["segment"]["label"].startswith("N")
+
+
+@pytest.mark.usefixtures("seed_roulette")
+def test_roulette_batch_play_consumes_once_and_aggregates_rewards(client: TestClient, session_factory) -> None:
+    resp = client.post("/api/roulette/play", params={"count": 5})
+    assert resp.status_code == 200, resp.text
+    data = resp.json()
+    assert len(data["results"]) == 5
+    assert data["segment"] == data["results"][-1]
+
+    session: Session = session_factory()
+    wallet = (
+        session.query(UserGameWallet)
+        .filter(UserGameWallet.user_id == 1, UserGameWallet.token_type == GameTokenType.ROULETTE_COIN)
+        .one()
+    )
+    assert wallet.balance == 5
+    ledger = session.query(UserGameWalletLedger).filter(UserGameWalletLedger.reason == "ROULETTE_PLAY").all()
+    assert sorted(row.balance_after for row in ledger) == [5, 6, 7, 8, 9]
+    assert session.query(RouletteLog).count() == 5
+    # Every segment pays 1 POINT: a single aggregated grant of 5.
+    cash_rows = session.query(UserCashLedger).filter(UserCashLedger.user_id == 1).all()
+    assert [row.delta for row in cash_rows] == [5]
+    session.close()
+
+
+@pytest.mark.usefixtures("seed_roulette")
+def test_roulette_batch_play_rejects_out_of_range_count(client: TestClient) -> None:
+    assert client.post("/api/roulette/play", params={"count": 0}).status_code == 422
+    assert client.post("/api/roulette/play", params={"count": 51}).status_code == 422
+
+
+@pytest.mark.usefixtures("seed_roulette")
+def test_roulette_status_reads_daily_play_counter(client: TestClient, session_factory) -> None:
+    assert client.post("/api/roulette/play").status_code == 200
+    assert client.post("/api/roulette/play", params={"count": 3}).status_code == 200
+
+    assert client.get("/api/roulette/status").json()["today_spins"] == 4
+    session: Session = session_factory()
+    counter = session.query(UserDailyPlayCounter).filter(UserDailyPlayCounter.feature_type == FeatureType.ROULETTE.value).one()
+    assert counter.play_count == 4
+    session.close()
+
+
+@pytest.mark.usefixtures("seed_roulette")
+def test_roulette_play_with_idempotency_key_replays_response(client: TestClient, session_factory) -> None:
+    headers = {"Idempotency-Key": "retry-1"}
+    first = client.post("/api/roulette/play", params={"count": 2}, headers=headers)
+    retry = client.post("/api/roulette/play", params={"count": 2}, headers=headers)
+    assert first.status_code == retry.status_code == 200
+    assert retry.json() == first.json()
+
+    session: Session = session_factory()
+    wallet = (
+        session.query(UserGameWallet)
+        .filter(UserGameWallet.user_id == 1, UserGameWallet.token_type == GameTokenType.ROULETTE_COIN)
+        .one()
+    )
+    assert wallet.balance == 8
+    assert session.query(RouletteLog).count() == 2
+    assert session.query(PlayRequestDedupe).one().response_json == first.json()
+    session.close()
+
+    assert client.post("/api/roulette/play", headers={"Idempotency-Key": "retry-2"}).status_code == 200
+    session = session_factory()
+    assert session.query(RouletteLog).count() == 3
+    session.close()
+
+
+@pytest.mark.usefixtures("seed_roulette")
+def test_roulette_play_with_in_flight_idempotency_key_conflicts(client: TestClient, session_factory) -> None:
+    session: Session = session_factory()
+    # A claimed key without a stored response: another request is still running it.
+    session.add(
+        PlayRequestDedupe(
+            user_id=1,
+            feature_type=FeatureType.ROULETTE.value,
+            request_id="in-flight",
+            expires_at=datetime.utcnow() + timedelta(minutes=5),
+        )
+    )
+    session.commit()
+    session.close()
+
+    resp = client.post("/api/roulette/play", headers={"Idempotency-Key": "in-flight"})
+    assert resp.status_code == 409
+    assert resp.json()["error"]["code"] == "PLAY_REQUEST_IN_PROGRESS"
+    session = session_factory()
+    assert session.query(RouletteLog).count() == 0
+    session.close()
@@ -244,3 +244,247 @@ def test_season_conflict_raises_error(session_factory) -> None:
     assert "NO_ACTIVE_SEASON_CONFLICT" in exc_info.value.detail
     
     session.close()
+
+
+def test_internal_wins_read_counter_incremented_by_plays(client: TestClient, seed_season, session_factory) -> None:
+    from app.models.feature import FeatureConfig, FeatureSchedule, FeatureType
+    from app.models.roulette import RouletteConfig, RouletteSegment
+    from app.models.user_internal_win_counter import UserInternalWinCounter
+    from app.services.season_pass_service import SeasonPassService
+
+    session: Session = session_factory()
+    roulette_cfg = RouletteConfig(name="WIN_ROULETTE", is_active=True, max_daily_spins=0)
+    session.add_all(
+        [
+            FeatureSchedule(date=date.today(), feature_type=FeatureType.ROULETTE, is_active=True),
+            FeatureConfig(feature_type=FeatureType.ROULETTE, title="Roulette", page_path="/roulette", is_enabled=True),
+            roulette_cfg,
+        ]
+    )
+    session.flush()
+    session.add_all(
+        [
+            RouletteSegment(config_id=roulette_cfg.id, slot_index=i, label=f"S{i}", reward_type="POINT", reward_amount=1, weight=1)
+            for i in range(6)
+        ]
+    )
+    session.commit()
+    session.close()
+
+    assert client.post("/api/roulette/play", params={"count": 3}).status_code == 200
+
+    session = session_factory()
+    counter = session.query(UserInternalWinCounter).one()
+    assert (counter.user_id, counter.win_count) == (1, 3)
+
+    resp = client.get("/api/season-pass/internal-wins")
+    assert resp.status_code == 200
+    assert resp.json()["total_wins"] == 3
+
+    service = SeasonPassService()
+    assert service.maybe_add_internal_win_stamp(session, user_id=1, threshold=3) is not None
+    # Once per season.
+    assert service.maybe_add_internal_win_stamp(session, user_id=1, threshold=3) is None
+    session.close()
+
+
+def test_level_table_bisects_required_xp() -> None:
+    from types import SimpleNamespace
+
+    from app.services.season_pass_cache import SeasonLevelTable
+
+    rows = [
+        SimpleNamespace(level=lvl, required_xp=xp, reward_type="POINT", reward_amount=lvl, auto_claim=True)
+        for lvl, xp in ((3, 15), (1, 0), (2, 10), (4, 40))
+    ]
+    table = SeasonLevelTable.compile(rows)
+
+    assert [lvl.level for lvl in table.levels] == [1, 2, 3, 4]
+    assert [lvl.level for lvl in table.reached(14)] == [1, 2]
+    assert [lvl.level for lvl in table.reached(15)] == [1, 2, 3]
+    assert [lvl.level for lvl in table.reached(10_000)] == [1, 2, 3, 4]
+    assert table.get(3).required_xp == 15 and table.get(9) is None
+    assert table.max_required_xp == 40
+
+
+def test_season_cache_skips_queries_until_admin_edit(seed_season, session_factory) -> None:
+    from sqlalchemy import event
+
+    from app.schemas.admin_season import AdminSeasonUpdate
+    from app.services.admin_season_service import AdminSeasonService
+    from app.services.season_pass_service import SeasonPassService
+
+    session: Session = session_factory()
+    service = SeasonPassService()
+    season = service.get_current_season(session, date.today())
+    service.get_level_table(session, season)
+
+    selects: list[str] = []
+
+    @event.listens_for(session.get_bind(), "before_cursor_execute")
+    def _on_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        if statement.startswith("SELECT") and ("season_pass_config" in statement or "season_pass_level" in statement):
+            selects.append(statement)
+
+    cached = service.get_current_season(session, date.today())
+    assert [lvl.level for lvl in service.get_level_table(session, cached).reached(12)] == [1, 2]
+    assert selects == []
+
+    AdminSeasonService.update_season(session, season.id, AdminSeasonUpdate(base_xp_per_stamp=25))
+    selects.clear()
+    assert service.get_current_season(session, date.today()).base_xp_per_stamp == 25
+    assert selects
+    session.close()
+
+
+def test_apply_bonus_xp_bulk_levels_up_users_with_bulk_statements(seed_season, session_factory) -> None:
+    from sqlalchemy import event
+
+    from app.models.user_cash_ledger import UserCashLedger
+    from app.services.season_pass_service import SeasonPassService
+
+    session: Session = session_factory()
+    season = session.query(SeasonPassConfig).one()
+    session.add_all([User(id=51, external_id="bulk-51"), User(id=52, external_id="bulk-52")])
+    session.add(SeasonPassProgress(user_id=52, season_id=season.id, current_level=2, current_xp=10, total_stamps=1))
+    session.commit()
+
+    statements: list[str] = []
+
+    @event.listens_for(session.get_bind(), "before_cursor_execute")
+    def _on_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        if "season_pass_progress" in statement.split("WHERE")[0] or "season_pass_reward_log" in statement:
+            statements.append(statement.split()[0])
+
+    summary = SeasonPassService().apply_bonus_xp_bulk(session, season.id, {51: 20, 52: 3, 1: 0})
+
+    assert summary == {"users": 2, "leveled_up": 1, "rewards": 1}
+    # progress read, insert missing, re-read, claimed-level read, reward-log insert, progress update
+    assert statements == ["SELECT", "INSERT", "SELECT", "SELECT", "INSERT", "UPDATE"]
+    progress = {
+        row.user_id: (row.current_level, row.current_xp)
+        for row in session.query(SeasonPassProgress).filter(SeasonPassProgress.season_id == season.id)
+    }
+    assert progress == {51: (3, 20), 52: (2, 13)}
+    logs = session.query(SeasonPassRewardLog).all()
+    assert [(log.user_id, log.level, log.reward_amount) for log in logs] == [(51, 3, 10)]
+    assert [row.delta for row in session.query(UserCashLedger).filter(UserCashLedger.user_id == 51)] == [10]
+
+    # Replaying the same import only adds XP; claimed levels are not paid twice.
+    SeasonPassService().apply_bonus_xp_bulk(session, season.id, {51: 20}, chunk_size=1)
+    assert session.query(SeasonPassRewardLog).count() == 1
+    session.close()
+
+
+def test_status_is_one_read_only_query_once_season_is_cached(seed_season, session_factory) -> None:
+    from sqlalchemy import event
+
+    from app.services.season_pass_service import SeasonPassService
+
+    session: Session = session_factory()
+    service = SeasonPassService()
+    service.get_status(session, user_id=1, now=date.today())  # warm the season/level cache
+
+    statements: list[str] = []
+
+    @event.listens_for(session.get_bind(), "before_cursor_execute")
+    def _on_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement.split()[0])
+
+    status_data = service.get_status(session, user_id=1, now=date.today())
+
+    assert statements == ["SELECT"]
+    assert status_data["progress"]["current_level"] == 1
+    assert status_data["today"]["stamped"] is False
+    assert session.query(SeasonPassProgress).count() == 0
+    session.close()
+
+
+def test_status_etag_returns_304_until_progress_changes(client: TestClient, seed_season) -> None:
+    first = client.get("/api/season-pass/status")
+    etag = first.headers["ETag"]
+
+    unchanged = client.get("/api/season-pass/status", headers={"If-None-Match": etag})
+    assert unchanged.status_code == 304
+    assert unchanged.headers["ETag"] == etag
+    assert unchanged.content == b""
+
+    client.post("/api/season-pass/stamp", json={"source_feature_type": "ROULETTE", "xp_bonus": 10})
+    changed = client.get("/api/season-pass/status", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    body = changed.json()
+    assert body["today"]["stamped"] is True
+    assert [lvl["is_claimed"] for lvl in body["levels"]] == [False, False, True]
+
+
+def test_stamp_log_is_written_with_one_upsert(seed_season, session_factory) -> None:
+    from fastapi import HTTPException
+    from sqlalchemy import event
+
+    from app.services.season_pass_service import SeasonPassService
+
+    session: Session = session_factory()
+    service = SeasonPassService()
+    statements: list[str] = []
+
+    @event.listens_for(session.get_bind(), "before_cursor_execute")
+    def _on_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        if "season_pass_stamp_log" in statement:
+            statements.append(statement.split()[0])
+
+    service.add_stamp(session, user_id=1, source_feature_type="ROULETTE", now=date.today())
+    assert statements == ["INSERT"]
+
+    # The daily check-in is once per day across features, decided by the same INSERT.
+    with pytest.raises(HTTPException) as exc:
+        service.add_stamp(session, user_id=1, source_feature_type="DICE", now=date.today())
+    assert exc.value.detail == "ALREADY_STAMPED_TODAY"
+
+    # Other period keys accumulate onto the existing row.
+    service.add_stamp(session, user_id=1, source_feature_type="EVENT", now=date.today(), period_key="EVT")
+    service.add_stamp(session, user_id=1, source_feature_type="EVENT", now=date.today(), period_key="EVT", stamp_count=2)
+    event_log = session.query(SeasonPassStampLog).filter(SeasonPassStampLog.period_key == "EVT").one()
+    assert (event_log.stamp_count, event_log.xp_earned, event_log.reward_amount) == (3, 30, 10)
+    assert service.maybe_add_stamp(
+        session, user_id=1, source_feature_type="EVENT", now=date.today(), period_key="EVT", once_per_period=True
+    ) is None
+
+    progress = session.query(SeasonPassProgress).filter(SeasonPassProgress.user_id == 1).one()
+    assert (progress.current_xp, progress.total_stamps) == (40, 4)
+    assert session.query(SeasonPassStampLog).count() == 2
+    session.close()
+
+
+def test_external_ranking_keeps_unconverted_deposit_when_xp_chunk_fails(seed_season, session_factory, monkeypatch) -> None:
+    from sqlalchemy.exc import OperationalError
+
+    from app.models.external_ranking import ExternalRankingData
+    from app.schemas.external_ranking import ExternalRankingCreate
+    from app.services.admin_external_ranking_service import AdminExternalRankingService
+    from app.services.season_pass_service import SeasonPassService
+
+    def _lock_timeout(*_args, **_kwargs):
+        raise OperationalError("UPDATE season_pass_progress", {}, Exception("Lock wait timeout exceeded"))
+
+    session: Session = session_factory()
+    payload = [ExternalRankingCreate(user_id=1, deposit_amount=250_000, play_count=0)]
+    original = SeasonPassService._apply_bonus_xp_chunk
+    monkeypatch.setattr(SeasonPassService, "_apply_bonus_xp_chunk", _lock_timeout)
+    with pytest.raises(OperationalError):
+        AdminExternalRankingService.upsert_many(session, payload)
+    session.rollback()
+
+    # The deposit is recorded, but the 2 steps it is worth stay unconverted until XP is applied.
+    row = session.query(ExternalRankingData).filter(ExternalRankingData.user_id == 1).one()
+    assert (row.deposit_amount, row.deposit_remainder) == (250_000, 250_000)
+    assert session.query(SeasonPassProgress).filter(SeasonPassProgress.user_id == 1).count() == 0
+
+    monkeypatch.setattr(SeasonPassService, "_apply_bonus_xp_chunk", original)
+    AdminExternalRankingService.upsert_many(session, payload)
+
+    session.expire_all()
+    assert session.query(ExternalRankingData.deposit_remainder).filter(ExternalRankingData.user_id == 1).scalar() == 50_000
+    # 2 deposit steps x 20 XP, plus the weekly TOP10 stamp.
+    assert session.query(SeasonPassProgress.current_xp).filter(SeasonPassProgress.user_id == 1).scalar() == 50
+    session.close()
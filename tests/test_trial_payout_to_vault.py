@@ -8,7 +8,6 @@ from sqlalchemy.orm import Session
 from app.core.config import get_settings
 from app.models.game_wallet import GameTokenType, UserGameWallet
 from app.models.new_member_dice import NewMemberDiceEligibility
-from app.models.trial_token_bucket import TrialTokenBucket
 from app.models.user import User
 from app.models.vault_earn_event import VaultEarnEvent
 from app.services.game_wallet_service import GameWalletService
@@ -22,7 +21,7 @@ def _enable_trial_payout(valuation_json: str | None = None) -> None:
     get_settings.cache_clear()
 
 
-def test_trial_token_bucket_consumed_flag(session_factory) -> None:
+def test_trial_balance_consumed_flag(session_factory) -> None:
     session: Session = session_factory()
 
     # Ensure user wallet exists and set known balance.
@@ -55,12 +54,51 @@ def test_trial_token_bucket_consumed_flag(session_factory) -> None:
     assert balance_after == 0
     assert consumed_trial is True
 
-    bucket = (
-        session.query(TrialTokenBucket)
-        .filter(TrialTokenBucket.user_id == 1, TrialTokenBucket.token_type == GameTokenType.DICE_TOKEN)
-        .one()
-    )
-    assert bucket.balance == 0
+    assert wallet.trial_balance == 0
+
+
+def test_consume_for_plays_flags_trial_tokens_first(session_factory) -> None:
+    session: Session = session_factory()
+    session.add(User(id=11, external_id="trial-plays"))
+    session.commit()
+    svc = GameWalletService()
+    svc.grant_tokens(session, user_id=11, token_type=GameTokenType.DICE_TOKEN, amount=2, reason="GRANT")
+    svc.grant_tokens(session, user_id=11, token_type=GameTokenType.DICE_TOKEN, amount=2, reason="TRIAL_GRANT")
+    assert svc.mark_trial_grant(session, user_id=11, token_type=GameTokenType.DICE_TOKEN, amount=2) == 2
+
+    balance, flags = svc.consume_tokens_for_plays(session, 11, GameTokenType.DICE_TOKEN, ["a", "b", "c"])
+    assert (balance, flags) == (1, [True, True, False])
+
+    balance, flags = svc.consume_tokens_for_plays(session, 11, GameTokenType.DICE_TOKEN, ["d"])
+    assert (balance, flags) == (0, [False])
+
+    # A new trial grant starts counting from zero again.
+    svc.grant_tokens(session, user_id=11, token_type=GameTokenType.DICE_TOKEN, amount=1, reason="TRIAL_GRANT")
+    assert svc.mark_trial_grant(session, user_id=11, token_type=GameTokenType.DICE_TOKEN, amount=1) == 1
+    assert svc.require_and_consume_token(session, 11, GameTokenType.DICE_TOKEN) == (0, True)
+
+
+def test_trial_balance_stays_within_zero_and_balance(session_factory) -> None:
+    session: Session = session_factory()
+    session.add(User(id=12, external_id="trial-bounds"))
+    session.commit()
+    svc = GameWalletService()
+    svc.grant_tokens(session, user_id=12, token_type=GameTokenType.DICE_TOKEN, amount=3, reason="GRANT")
+    svc.consume_tokens_for_plays(session, 12, GameTokenType.DICE_TOKEN, ["a", "b"])
+
+    def trial_balance() -> int:
+        return session.query(UserGameWallet.trial_balance).filter(UserGameWallet.user_id == 12).scalar()
+
+    # Untracked plays never push the count below zero.
+    assert trial_balance() == 0
+
+    svc.grant_tokens(session, user_id=12, token_type=GameTokenType.DICE_TOKEN, amount=3, reason="TRIAL_GRANT")
+    assert svc.mark_trial_grant(session, user_id=12, token_type=GameTokenType.DICE_TOKEN, amount=3) == 3
+    # A revoke clamps the trial count to the remaining balance, so later plays don't over-report trial use.
+    assert svc.revoke_tokens(session, user_id=12, token_type=GameTokenType.DICE_TOKEN, amount=3) == 1
+    assert trial_balance() == 1
+    assert svc.consume_tokens_for_plays(session, 12, GameTokenType.DICE_TOKEN, ["c"]) == (0, [True])
+    assert trial_balance() == 0
 
 
 def test_trial_reward_routed_to_vault_with_skip_logging(session_factory) -> None:
@@ -0,0 +1,32 @@
+"""AliasSampler distribution and validation."""
+import random
+
+import pytest
+
+from app.services.weighted_sampler import AliasSampler
+
+
+def test_alias_sampler_matches_weights() -> None:
+    weights = [10000, 5000, 2500, 0, 1]
+    sampler = AliasSampler(["a", "b", "c", "zero", "e"], weights)
+    rng = random.Random(7)
+    draws = 50000
+    counts = {item: 0 for item in sampler.items}
+    for _ in range(draws):
+        counts[sampler.sample(rng)] += 1
+
+    total = sum(weights)
+    assert counts["zero"] == 0
+    for item, weight in zip(sampler.items, weights):
+        assert abs(counts[item] / draws - weight / total) < 0.01
+
+
+def test_alias_sampler_single_item() -> None:
+    sampler = AliasSampler([42], [3])
+    assert {sampler.sample() for _ in range(10)} == {42}
+
+
+@pytest.mark.parametrize("weights", [[], [0, 0], [1, -1]])
+def test_alias_sampler_rejects_invalid_weights(weights) -> None:
+    with pytest.raises(ValueError):
+        AliasSampler(list(range(len(weights))), weights)